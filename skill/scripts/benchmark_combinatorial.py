@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Combinatorial Engine Benchmark
+
+Runs CombinatorialTestGenerator over a fixed suite of parameter models and
+records planning speed and plan quality, so a change to combinatorial.py can
+be judged by comparing two result files.
+
+Models:
+- Uniform: k parameters with v values each (5-60 parameters)
+- Skewed: value counts drawn from a long-tailed distribution
+- Sparse: select-mode pools whose cells are N/A with a given probability
+- Real: every SCENARIO_DEFINITIONS entry of generate_variants.py
+
+Every case runs in a fresh interpreter (one after the other) and records wall
+time, peak memory, candidates evaluated per second, plan size and coverage,
+together with the trivial lower bound for the model and the size of the smallest
+covering-array construction known to combinatorial.py.
+
+Usage:
+    # Quick suite, results to benchmark_results.json
+    python3 benchmark_combinatorial.py
+
+    # Full suite, compared against a result file from an earlier commit
+    python3 benchmark_combinatorial.py --suite full --compare baseline.json
+
+Author: QA Automation Skill
+Version: 1.0.0
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import math
+import multiprocessing
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak memory is then not recorded
+    resource = None
+
+import combinatorial
+import generate_variants
+
+# Generate mode scans the full Cartesian product with the greedy algorithm up to
+# this many rows and switches to IPOG (or --large-algorithm) beyond it
+GREEDY_MAX_PRODUCT = 20000
+
+# Long-tailed value counts for the skewed models
+SKEWED_COUNTS = [2, 2, 2, 3, 3, 4, 5, 6, 8, 12]
+
+
+@dataclass
+class BenchmarkCase:
+    """One model planned in one mode"""
+    name: str
+    mode: str
+    params: Dict[str, List[str]]
+    # Select mode: candidate rows (None = the full Cartesian product)
+    rows: Optional[List[List[str]]] = None
+    sparsity: float = 0.0
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one benchmark case"""
+    name: str
+    mode: str
+    algorithm: str
+    parameters: int
+    value_counts: List[int]
+    # Candidate rows (generate mode: the product scanned by greedy, 0 for IPOG/AETG)
+    candidates: int
+    # Candidate gains computed or updated, from the generator's instrumentation
+    candidates_scored: int
+    sparsity: float
+    wall_seconds: float
+    # Resident set size before building the candidates and at its peak
+    baseline_rss_mb: Optional[float]
+    peak_rss_mb: Optional[float]
+    candidates_per_second: float
+    plan_size: int
+    coverage_percentage: float
+    total_tuples: int
+    # Trivial lower bound: product of the t largest value counts, no plan can
+    # be smaller (most models need well above it)
+    trivial_lower_bound: int
+    # Density-argument bound ln(tuples) * trivial_lower_bound + 1 reached by
+    # greedy construction over the full product
+    greedy_bound: int
+    # plan_size / trivial_lower_bound
+    trivial_bound_ratio: float
+    # Rows of the smallest covering array combinatorial.py can build for the
+    # model (bundled table arrays, Bose/Bush orthogonal arrays,
+    # Kleitman-Spencer) and its name; 0 and "" if none fits
+    construction_size: int
+    construction_source: str
+    # plan_size / construction_size (below 1 when the plan beats every known
+    # construction)
+    construction_ratio: float
+    error: str = ""
+
+
+def uniform_params(k: int, v: int) -> Dict[str, List[str]]:
+    """k parameters with v values each"""
+    return {f"P{i:02d}": [f"v{j}" for j in range(v)] for i in range(k)}
+
+
+def skewed_params(k: int, seed: int) -> Dict[str, List[str]]:
+    """k parameters with long-tailed value counts"""
+    rng = random.Random(seed)
+    return {
+        f"P{i:02d}": [f"v{j}" for j in range(rng.choice(SKEWED_COUNTS))] for i in range(k)
+    }
+
+
+def candidate_pool(
+    params: Dict[str, List[str]],
+    size: int,
+    sparsity: float,
+    seed: int
+) -> List[List[str]]:
+    """
+    Random select-mode candidate rows.
+
+    Args:
+        params: Parameter name -> values
+        size: Number of rows
+        sparsity: Probability that a cell is N/A
+        seed: Random seed
+
+    Returns:
+        Rows with a leading Variant_ID
+    """
+    rng = random.Random(seed)
+    rows = []
+    for r in range(size):
+        row = [f"V{r + 1:05d}"]
+        for values in params.values():
+            row.append('N/A' if rng.random() < sparsity else rng.choice(values))
+        rows.append(row)
+    return rows
+
+
+def build_suite(suite: str, pool: int, seed: int) -> List[BenchmarkCase]:
+    """
+    Benchmark cases of a suite.
+
+    Args:
+        suite: 'quick' or 'full'
+        pool: Candidate rows of the synthetic select-mode models
+        seed: Random seed for the synthetic models
+
+    Returns:
+        List of BenchmarkCase
+    """
+    full = suite == 'full'
+    synthetic = []
+    for k in ((5, 10, 20, 40, 60) if full else (5, 10, 20)):
+        synthetic.append((f"uniform-3^{k}", uniform_params(k, 3)))
+    for k in ((5, 10, 20) if full else (10,)):
+        synthetic.append((f"uniform-5^{k}", uniform_params(k, 5)))
+    for k in ((10, 30, 60) if full else (10, 30)):
+        synthetic.append((f"skewed-{k}", skewed_params(k, seed + k)))
+
+    cases = []
+    for name, params in synthetic:
+        cases.append(BenchmarkCase(name, 'generate', params))
+        cases.append(BenchmarkCase(name, 'select', params, candidate_pool(params, pool, 0.0, seed)))
+        for sparsity in ((0.3, 0.6) if full else (0.3,)):
+            cases.append(BenchmarkCase(
+                f"{name}-na{int(sparsity * 100)}", 'select', params,
+                candidate_pool(params, pool, sparsity, seed), sparsity
+            ))
+
+    scenario_ids = sorted(generate_variants.SCENARIO_DEFINITIONS)
+    if not full:
+        scenario_ids = scenario_ids[:10]
+    for scenario_id in scenario_ids:
+        params = {
+            **generate_variants.SCENARIO_DEFINITIONS[scenario_id]['params'],
+            **generate_variants.GLOBAL_PARAMS
+        }
+        cases.append(BenchmarkCase(scenario_id, 'generate', params))
+        cases.append(BenchmarkCase(scenario_id, 'select', params))
+    return cases
+
+
+def _max_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far"""
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1)
+
+
+def _run_case(conn, case: BenchmarkCase, strength: int, large_algorithm: str):
+    """Plan one case and send its BenchmarkResult (runs in a fresh interpreter)"""
+    headers = list(case.params)
+    counts = [len(values) for values in case.params.values()]
+    product = math.prod(counts)
+    largest = sorted(counts, reverse=True)[:strength]
+    lower_bound = math.prod(largest) if len(counts) >= strength else 0
+    construction_source, construction = combinatorial.smallest_construction(counts, strength) \
+        or ("", 0)
+
+    generator = combinatorial.CombinatorialTestGenerator(
+        mode=case.mode, strength=strength, progress=False, output_formats=('json',),
+        algorithm='greedy' if product <= GREEDY_MAX_PRODUCT else large_algorithm
+    )
+    generator.logger.setLevel(logging.WARNING)
+    baseline = _max_rss_mb()
+
+    if case.mode == 'select':
+        rows = case.rows
+        if rows is None:
+            rows = [[f"V{r + 1:05d}", *values]
+                    for r, values in enumerate(itertools.product(*case.params.values()))]
+        candidates = len(rows)
+    else:
+        # One row per value index lists every value of every parameter
+        rows = [[values[j % len(values)] for values in case.params.values()]
+                for j in range(max(counts))]
+        candidates = product if generator.algorithm == 'greedy' else 0
+
+    try:
+        start = time.perf_counter()
+        if case.mode == 'select':
+            table = generator.encode_rows(['Variant_ID', *headers], rows)
+            plan, stats = generator.select_from_table(table)
+        else:
+            _, plan, stats = generator.generate_plan(headers, rows)
+        wall = time.perf_counter() - start
+        error = ""
+    except Exception as e:
+        wall, stats, error = time.perf_counter() - start, None, str(e)
+
+    scored = generator.instrumentation.candidates_scored
+    tuples = stats.total_pairs if stats else 0
+    plan_size = stats.test_cases_generated if stats else 0
+    conn.send(BenchmarkResult(
+        name=case.name,
+        mode=case.mode,
+        algorithm=generator.algorithm if case.mode == 'generate' else f"greedy-{generator.selector}",
+        parameters=len(headers),
+        value_counts=counts,
+        candidates=candidates,
+        candidates_scored=scored,
+        sparsity=case.sparsity,
+        wall_seconds=round(wall, 4),
+        baseline_rss_mb=baseline,
+        peak_rss_mb=_max_rss_mb(),
+        candidates_per_second=round(scored / wall, 1) if wall > 0 else 0.0,
+        plan_size=plan_size,
+        coverage_percentage=round(stats.coverage_percentage, 2) if stats else 0.0,
+        total_tuples=tuples,
+        trivial_lower_bound=lower_bound,
+        greedy_bound=math.ceil(lower_bound * math.log(tuples)) + 1 if tuples > 1 else lower_bound,
+        trivial_bound_ratio=round(plan_size / lower_bound, 3) if lower_bound else 0.0,
+        construction_size=construction,
+        construction_source=construction_source,
+        construction_ratio=round(plan_size / construction, 3) if construction else 0.0,
+        error=error
+    ))
+    conn.close()
+
+
+def run_case(case: BenchmarkCase, strength: int, large_algorithm: str = 'ipog') -> BenchmarkResult:
+    """Run one case in a freshly spawned interpreter so peak memory is its own"""
+    context = multiprocessing.get_context('spawn')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_run_case, args=(sender, case, strength, large_algorithm))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        raise RuntimeError(f"Benchmark worker for {case.name} ({case.mode}) died")
+    process.join()
+    return result
+
+
+def best_of(results: List[BenchmarkResult]) -> BenchmarkResult:
+    """Fastest of repeated runs; plans are deterministic, so only timing differs"""
+    return min(results, key=lambda result: result.wall_seconds)
+
+
+def git_commit() -> str:
+    """Commit the benchmark ran against, or '' outside a git checkout"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+            cwd=Path(__file__).parent, timeout=10
+        ).stdout.strip()
+    except Exception:
+        return ""
+
+
+def compare(results: List[Dict[str, Any]], baseline_file: str):
+    """Print time and plan-size changes against an earlier result file"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    before = {(r['name'], r['mode']): r for r in baseline['results']}
+
+    print(f"\nCompared with {baseline_file} (commit {baseline.get('commit') or 'unknown'}):")
+    print(f"  {'case':<28} {'mode':<9} {'time':>18} {'plan size':>14}")
+    for result in results:
+        old = before.get((result['name'], result['mode']))
+        if old is None:
+            continue
+        speedup = old['wall_seconds'] / result['wall_seconds'] if result['wall_seconds'] else 0
+        print(
+            f"  {result['name']:<28} {result['mode']:<9} "
+            f"{old['wall_seconds']:>7.3f}s -> {speedup:>5.2f}x "
+            f"{old['plan_size']:>6} -> {result['plan_size']:<5}"
+        )
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark combinatorial.py planning speed and plan size',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Quick suite
+  python3 benchmark_combinatorial.py
+
+  # Full suite, 3-way coverage, best of 3 runs
+  python3 benchmark_combinatorial.py --suite full --strength 3 --repeat 3
+
+  # Only the skewed models, compared against an earlier run
+  python3 benchmark_combinatorial.py --filter skewed --compare old_results.json
+
+  # Large generate-mode models with AETG sampling instead of IPOG
+  python3 benchmark_combinatorial.py --mode generate --large-algorithm aetg
+        """
+    )
+    parser.add_argument('--suite', choices=['quick', 'full'], default='quick',
+                        help='Model suite (default: quick)')
+    parser.add_argument('--filter', help='Only run cases whose name contains this text')
+    parser.add_argument('--mode', choices=['select', 'generate'],
+                        help='Only run one mode (default: both)')
+    parser.add_argument('--strength', type=int, default=2,
+                        help='Interaction strength t (default: 2)')
+    parser.add_argument('--large-algorithm', choices=['ipog', 'aetg'], default='ipog',
+                        help='Generate-mode algorithm for models whose product is too large '
+                             'for greedy (default: ipog)')
+    parser.add_argument('--pool', type=int, default=2000,
+                        help='Candidate rows of the synthetic select-mode models (default: 2000)')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Runs per case; the fastest is recorded (default: 1)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed of the synthetic models (default: 0)')
+    parser.add_argument('--output', '-o', default='benchmark_results.json',
+                        help='Result file (default: benchmark_results.json)')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='Earlier result file to compare against')
+    args = parser.parse_args()
+
+    cases = [
+        case for case in build_suite(args.suite, args.pool, args.seed)
+        if (not args.filter or args.filter in case.name) and (not args.mode or case.mode == args.mode)
+    ]
+    if not cases:
+        print("✗ Error: no benchmark case matches", file=sys.stderr)
+        sys.exit(1)
+
+    results = []
+    for i, case in enumerate(cases, 1):
+        result = best_of([
+            run_case(case, args.strength, args.large_algorithm) for _ in range(max(1, args.repeat))
+        ])
+        results.append(asdict(result))
+        status = f"✗ {result.error}" if result.error else (
+            f"{result.plan_size:>5} rows ({result.trivial_bound_ratio:.2f}x trivial lower bound, "
+            f"smallest construction {result.construction_size or '-'}), "
+            f"{result.wall_seconds:.3f}s, {result.peak_rss_mb} MB"
+        )
+        print(f"[{i}/{len(cases)}] {case.name:<28} {case.mode:<9} {status}", flush=True)
+
+    document = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {
+            'suite': args.suite, 'strength': args.strength, 'pool': args.pool,
+            'large_algorithm': args.large_algorithm,
+            'repeat': args.repeat, 'seed': args.seed
+        },
+        'results': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+    print(f"\n✓ Results written to: {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,15 +23,27 @@ Version: 2.0.0
 
 import csv
 import sys
+import json
+import concurrent.futures
+import copy
+import heapq
 import itertools
 import logging
 import argparse
+import math
+import multiprocessing
 import os
+import random
+import time
+from array import array
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Optional
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple, Optional
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 
+from generate_variants import iter_variant_records, read_variant_columns, resolve_variants_file
+
 try:
     from tqdm import tqdm
     TQDM_AVAILABLE = True
@@ -79,555 +91,4134 @@ except ImportError:
 
 @dataclass
 class CoverageStats:
-    """Statistics about pairwise coverage"""
+    """Statistics about t-way coverage (pairwise by default)"""
     total_pairs: int
     covered_pairs: int
     uncovered_pairs: int
     coverage_percentage: float
     test_cases_generated: int
+    strength: int = 2
+    # t-tuples dropped from the target because constraints make them unreachable
+    excluded_pairs: int = 0
+    # Rows carried over unchanged from an existing plan (augment mode)
+    fixed_test_cases: int = 0
+    # Plan size before the post-optimization pass (0 = pass not run)
+    rows_before_optimization: int = 0
+    # strength -> (covered, total) for every strength from 2 up to ``strength``
+    strength_breakdown: Dict[int, Tuple[int, int]] = field(default_factory=dict)
+    # Partition key -> stats of that partition (--partition-by); totals are their sums
+    partitions: Dict[str, 'CoverageStats'] = field(default_factory=dict)
+    # Tie-break seed of the kept greedy pass (0 = input order) and passes run (--restarts)
+    seed: int = 0
+    restarts: int = 1
+    # (parameters, strength, covered, total) of every applied higher-strength group;
+    # totals above include their tuples, ``strength_breakdown`` does not
+    strength_groups: List[Tuple[str, int, int, int]] = field(default_factory=list)
+    # Algebraic or bundled covering array the plan was built from ("" = none)
+    construction: str = ""
 
 
-class CombinatorialTestGenerator:
+@dataclass
+class ExistingPlan:
+    """Rows of a previously generated plan, kept fixed when augmenting"""
+    headers: List[str]
+    rows: List[Tuple[str, ...]]
+    variant_ids: Optional[List[str]] = None
+    source: str = ""
+
+    def aligned(self, headers: List[str]) -> List[Tuple[str, ...]]:
+        """Rows re-ordered to ``headers``; parameters the plan lacks become N/A"""
+        index = {h: i for i, h in enumerate(self.headers)}
+        return [
+            tuple(row[index[h]] if h in index else 'N/A' for h in headers)
+            for row in self.rows
+        ]
+
+
+@dataclass
+class EncodedTable:
+    """Variants CSV held column-wise as dictionary-encoded integer codes"""
+    headers: List[str]
+    # Distinct non-N/A values per parameter, sorted; a value's code is its index
+    values: List[List[str]]
+    # Code of every row per parameter; -1 marks N/A
+    columns: List[array]
+    variant_ids: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    def params(self) -> Dict[str, List[str]]:
+        """Parameter name -> values, as ``extract_parameters`` returns them"""
+        return dict(zip(self.headers, self.values))
+
+    def rows(self) -> List[Tuple[int, ...]]:
+        """The encoded rows as tuples of codes"""
+        return list(zip(*self.columns))
+
+    def variant_id(self, r: int) -> str:
+        return self.variant_ids[r] if self.variant_ids is not None else f"V{r+1:03d}"
+
+    def sparse_rows(self) -> List[List[Tuple[int, int]]]:
+        """
+        Each row's populated (column, code) entries, in column order.
+
+        Built column by column with a C-level N/A filter, so the work grows
+        with the populated cells rather than with the table width.
+        """
+        n = len(self)
+        entries: List[List[Tuple[int, int]]] = [[] for _ in range(n)]
+        for c, column in enumerate(self.columns):
+            for r in itertools.compress(range(n), map((0).__le__, column)):
+                entries[r].append((c, column[r]))
+        return entries
+
+    def decode_row(self, r: int) -> Tuple[str, ...]:
+        """String values of row ``r``; N/A cells read 'N/A'"""
+        return tuple(
+            values[column[r]] if column[r] >= 0 else 'N/A'
+            for values, column in zip(self.values, self.columns)
+        )
+
+
+@dataclass
+class CoverageAnalysis:
+    """Coverage of an existing test set, measured by the streaming analyzer"""
+    stats: CoverageStats
+    headers: List[str]
+    # (parameter names, covered, total) for every group of ``strength`` parameters
+    group_breakdown: List[Tuple[Tuple[str, ...], int, int]]
+    # Every uncovered t-tuple as ((parameter, value), ...)
+    uncovered: List[Tuple[Tuple[str, str], ...]]
+    # Parameter -> sample (up to 20) of values found in the test set but not in the parameter space
+    unknown_values: Dict[str, Set[str]] = field(default_factory=dict)
+    source: str = ""
+    universe: str = ""
+
+
+# Cell values treated as "parameter does not apply"
+NA_VALUES = ('N/A', 'NA', 'NULL', '')
+
+
+def strength_label(strength: int) -> str:
+    """Human-readable name of an interaction strength"""
+    return 'Pairwise' if strength == 2 else f'{strength}-way'
+
+
+def _pack_bits(indices, size: int) -> int:
+    """Pack a collection of bit positions into an int bitset of ``size`` bits"""
+    buf = bytearray(b'0') * (size or 1)
+    top = len(buf) - 1
+    for k in indices:
+        buf[top - k] = 49  # ord('1')
+    return int(buf, 2)
+
+
+def _iter_set_bits(mask: int):
+    """Yield the positions of the set bits of ``mask`` in ascending order"""
+    bits = bin(mask)
+    top = len(bits) - 1
+    pos = bits.rfind('1')
+    while pos > 1:
+        yield top - pos
+        pos = bits.rfind('1', 2, pos)
+
+
+def _popcount(mask: int) -> int:
+    """Number of set bits of ``mask``"""
+    return bin(mask).count('1')
+
+
+class Instrumentation:
     """
-    Production-ready combinatorial test plan generator with pairwise coverage.
+    Counters for the selection and construction loops.
 
-    This implementation uses a greedy algorithm to select test cases that maximize
-    pairwise coverage. For more sophisticated algorithms, consider using libraries
-    like 'allpairspy' or 'pict'.
+    A loop calls ``begin`` once, ``step`` once per iteration (a selected row,
+    or a parameter added by IPOG) and ``end`` once. This base class only
+    updates counters - a clock read and a few additions per iteration - so
+    it is the default. Subclasses report through the ``on_*`` hooks.
+
+    Counters accumulate over every phase: ``iterations``, ``candidates_scored``
+    (candidate gains computed or updated), ``tuples_covered``, ``seconds``
+    spent inside phases and ``max_iteration_seconds``.
     """
 
-    def __init__(self, mode: str = 'select', verbose: bool = False):
+    def __init__(self):
+        self.iterations = 0
+        self.candidates_scored = 0
+        self.tuples_covered = 0
+        self.seconds = 0.0
+        self.max_iteration_seconds = 0.0
+        # State of the current phase
+        self.phase = ""
+        self.total = 0
+        self.covered = 0
+        self.rows = 0
+        self._started = 0.0
+        self._last = 0.0
+
+    def begin(self, phase: str, total: int, covered: int = 0):
+        """Start a phase that has ``total`` tuples to cover, ``covered`` of them already"""
+        self.phase, self.total, self.covered, self.rows = phase, total, covered, 0
+        self._started = self._last = time.perf_counter()
+        self.on_begin()
+
+    def step(self, newly_covered: int, scored: int = 0, rows: int = 1):
         """
-        Initialize the generator.
+        Record one iteration.
 
         Args:
-            mode: 'select' to choose from existing variants, 'generate' to create new ones
-            verbose: Enable detailed logging
+            newly_covered: Tuples the iteration covered
+            scored: Candidate gains computed or updated by the iteration
+            rows: Rows the iteration added to the plan
         """
-        self.mode = mode
-        self.verbose = verbose
-        self._setup_logging()
+        now = time.perf_counter()
+        seconds = now - self._last
+        self._last = now
+        self.iterations += 1
+        self.candidates_scored += scored
+        self.tuples_covered += newly_covered
+        self.covered += newly_covered
+        self.rows += rows
+        if seconds > self.max_iteration_seconds:
+            self.max_iteration_seconds = seconds
+        self.on_step(seconds, newly_covered, scored)
+
+    def end(self):
+        """Finish the current phase"""
+        self.seconds += time.perf_counter() - self._started
+        self.on_end()
+
+    def on_begin(self):
+        pass
+
+    def on_step(self, seconds: float, newly_covered: int, scored: int):
+        pass
+
+    def on_end(self):
+        pass
+
+    def summary(self) -> Dict[str, Any]:
+        """Counters as a JSON-serializable dictionary"""
+        return {
+            'iterations': self.iterations,
+            'candidates_scored': self.candidates_scored,
+            'tuples_covered': self.tuples_covered,
+            'seconds': round(self.seconds, 4),
+            'mean_iteration_seconds': round(self.seconds / self.iterations, 6) if self.iterations else 0.0,
+            'max_iteration_seconds': round(self.max_iteration_seconds, 6)
+        }
+
+
+class ProgressInstrumentation(Instrumentation):
+    """Counters plus a one-line terminal progress display, redrawn at most every ``interval`` seconds"""
+
+    def __init__(self, interval: Optional[float] = 0.5, stream=None):
+        """
+        Args:
+            interval: Minimum seconds between redraws; None disables the display
+            stream: Output stream (default: stderr)
+        """
+        super().__init__()
+        self.interval = interval
+        self.stream = stream
+        self._next_draw = 0.0
+
+    def _draw(self, final: bool = False):
+        pct = self.covered / self.total * 100 if self.total else 100.0
+        stream = self.stream or sys.stderr
+        stream.write(
+            f"\r{self.phase}: {self.covered:,}/{self.total:,} tuples ({pct:.1f}%), "
+            f"{self.rows} rows" + ("\n" if final else "")
+        )
+        stream.flush()
 
-    def _setup_logging(self):
-        """Configure logging with appropriate level"""
-        level = logging.DEBUG if self.verbose else logging.INFO
-        logging.basicConfig(
-            level=level,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+    def on_begin(self):
+        self._next_draw = self._started
+
+    def on_step(self, seconds: float, newly_covered: int, scored: int):
+        if self.interval is not None and self._last >= self._next_draw:
+            self._draw()
+            self._next_draw = self._last + self.interval
+
+    def on_end(self):
+        if self.interval is not None:
+            self._draw(final=True)
+
+
+class TraceInstrumentation(ProgressInstrumentation):
+    """
+    Counters plus a JSON trace of every iteration, rewritten at the end of each phase.
+
+    The trace holds the counter summary and, per phase, its tuple total and
+    one record per iteration: rows, tuples covered so far, newly covered
+    tuples, candidates scored and seconds.
+    """
+
+    def __init__(self, trace_file: str, interval: Optional[float] = None, stream=None):
+        """
+        Args:
+            trace_file: Path of the JSON trace
+            interval: Progress redraw interval; None (default) shows no progress
+            stream: Progress output stream (default: stderr)
+        """
+        super().__init__(interval, stream)
+        self.trace_file = trace_file
+        self.phases: List[Dict[str, Any]] = []
+
+    def on_begin(self):
+        super().on_begin()
+        self.phases.append({
+            'phase': self.phase, 'total': self.total, 'covered_before': self.covered, 'iterations': []
+        })
+
+    def on_step(self, seconds: float, newly_covered: int, scored: int):
+        super().on_step(seconds, newly_covered, scored)
+        self.phases[-1]['iterations'].append(
+            [self.rows, self.covered, newly_covered, scored, round(seconds, 6)]
         )
-        self.logger = logging.getLogger(__name__)
 
-    def validate_input_file(self, input_file: str) -> bool:
+    def on_end(self):
+        super().on_end()
+        self.phases[-1]['seconds'] = round(self._last - self._started, 6)
+        Path(self.trace_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(self.trace_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'counters': self.summary(),
+                'iteration_fields': ['rows', 'covered', 'newly_covered', 'candidates_scored', 'seconds'],
+                'phases': self.phases
+            }, f, indent=2)
+
+
+# Below this many candidates the pool start-up costs more than it saves
+PARALLEL_MIN_CANDIDATES = 2000
+
+# Plan output formats: markdown report, JSON sidecar, CSV sidecar
+OUTPUT_FORMATS = ('md', 'json', 'csv')
+
+
+def _scoring_worker(
+    conn,
+    candidates_name: str,
+    coverage_name: str,
+    width: int,
+    lo: int,
+    hi: int,
+    strength: int,
+    groups: List[Tuple[int, ...]],
+    strides: List[Tuple[int, ...]],
+    offsets: List[int],
+    extra: List[int]
+):
+    """
+    Lazy-greedy scorer for candidates ``lo..hi-1`` of a shared candidate matrix.
+
+    Both the encoded candidates (int32, row-major) and the coverage state (one
+    byte-aligned bit matrix per column group) live in shared memory; only the
+    master writes the coverage state. For every step the master sends the
+    index selected in the previous step (-1 at first) and the worker answers
+    with its chunk's best (-gain, index) at the current coverage (or None)
+    and the number of candidates it scored for that answer. ``extra`` lists
+    the higher-strength groups, scored when a row populates all their columns.
+    """
+    candidates_shm = shared_memory.SharedMemory(name=candidates_name)
+    coverage_shm = shared_memory.SharedMemory(name=coverage_name)
+    matrix = candidates_shm.buf.cast('i')
+    state = coverage_shm.buf
+    try:
+        rows = matrix[lo * width:hi * width].tolist()
+        group_of = {cols: g for g, cols in enumerate(groups)}
+
+        # Open slots are absolute bit positions in the shared coverage state
+        open_slots = []
+        for k in range(hi - lo):
+            row = rows[k * width:(k + 1) * width]
+            populated = [(i, code) for i, code in enumerate(row) if code >= 0]
+            assignments = list(itertools.combinations(populated, strength))
+            for g in extra:
+                if all(row[c] >= 0 for c in groups[g]):
+                    assignments.append(tuple((c, row[c]) for c in groups[g]))
+            slots = []
+            for assignment in assignments:
+                g = group_of[tuple(c for c, _ in assignment)]
+                pos = offsets[g] + sum(
+                    code * stride for (_, code), stride in zip(assignment, strides[g])
+                )
+                if (state[pos >> 3] >> (pos & 7)) & 1:
+                    slots.append(pos)
+            open_slots.append(slots)
+        del rows
+
+        heap = [(-len(slots), lo + k) for k, slots in enumerate(open_slots)]
+        heapq.heapify(heap)
+        evaluated_at = [0] * (hi - lo)
+        step = 0
+        scored = hi - lo
+
+        while True:
+            taken = conn.recv()
+            if taken is None:
+                break
+            if heap and heap[0][1] == taken:
+                heapq.heappop(heap)
+            step += 1
+            while heap and heap[0][0] < 0:
+                r = heap[0][1]
+                if evaluated_at[r - lo] == step:
+                    break
+                evaluated_at[r - lo] = step
+                scored += 1
+                slots = [pos for pos in open_slots[r - lo] if (state[pos >> 3] >> (pos & 7)) & 1]
+                open_slots[r - lo] = slots
+                heapq.heapreplace(heap, (-len(slots), r))
+            conn.send((heap[0] if heap and heap[0][0] < 0 else None, scored))
+            scored = 0
+    finally:
+        matrix.release()
+        state.release()
+        candidates_shm.close()
+        coverage_shm.close()
+        conn.close()
+
+
+class ConstraintSet:
+    """
+    Forbidden-combination constraints on parameter values.
+
+    Loaded from a JSON file with two optional sections::
+
+        {
+          "forbidden": [
+            {"Input_Validity": "Valid", "Field_Values": "Missing_Email"}
+          ],
+          "implications": [
+            {"if": {"Input_Validity": "Valid"}, "then": {"Field_Values": ["All_Valid"]}}
+          ]
+        }
+
+    A forbidden entry may list several values per parameter (any combination
+    is forbidden). An implication forbids every value of a ``then`` parameter
+    outside its allowed list whenever all ``if`` conditions hold.
+    """
+
+    def __init__(
+        self,
+        forbidden: Optional[List[Dict[str, Any]]] = None,
+        implications: Optional[List[Dict[str, Dict[str, Any]]]] = None
+    ):
+        self.forbidden = forbidden or []
+        self.implications = implications or []
+
+    @classmethod
+    def from_file(cls, path: str) -> 'ConstraintSet':
         """
-        Validate the input CSV file exists and is readable.
+        Load constraints from a JSON file.
 
-        Args:
-            input_file: Path to the input CSV file
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a valid constraint specification
+        """
+        if not Path(path).is_file():
+            raise FileNotFoundError(f"Constraints file not found: {path}")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                spec = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid constraints file {path}: {e}")
+
+        if not isinstance(spec, dict):
+            raise ValueError(f"Constraints file must contain a JSON object: {path}")
+        for rule in spec.get('implications', []):
+            if not isinstance(rule, dict) or 'if' not in rule or 'then' not in rule:
+                raise ValueError(f"Implication needs 'if' and 'then' sections: {rule}")
+        return cls(spec.get('forbidden', []), spec.get('implications', []))
+
+    def __len__(self) -> int:
+        return len(self.forbidden) + len(self.implications)
+
+    @staticmethod
+    def _as_list(values) -> List[str]:
+        return [values] if isinstance(values, str) else list(values)
+
+    def compile(self, engine: 'CoverageEngine') -> 'CompiledConstraints':
+        """
+        Translate the constraints into encoded forbidden tuples for an engine.
 
-        Returns:
-            True if valid, raises exception otherwise
+        Implications are expanded to forbidden tuples over the engine's value
+        domains. Parameters or values the engine does not know are ignored,
+        since no row can ever contain them.
+        """
+        column_of = {h: c for c, h in enumerate(engine.headers)}
+        forbidden = set()
+
+        def add(assignment: Dict[str, List[str]]):
+            columns = []
+            for header, values in assignment.items():
+                if header not in column_of:
+                    return
+                c = column_of[header]
+                codes = [engine.codes[c][v] for v in values if v in engine.codes[c]]
+                if not codes:
+                    return
+                columns.append([(c, code) for code in codes])
+            for combo in itertools.product(*columns):
+                forbidden.add(tuple(sorted(combo)))
+
+        for rule in self.forbidden:
+            add({h: self._as_list(v) for h, v in rule.items()})
+
+        for rule in self.implications:
+            condition = {h: self._as_list(v) for h, v in rule['if'].items()}
+            for header, allowed in rule['then'].items():
+                if header not in column_of:
+                    continue
+                allowed = set(self._as_list(allowed))
+                disallowed = [v for v in engine.values[column_of[header]] if v not in allowed]
+                if disallowed:
+                    add({**condition, header: disallowed})
+
+        return CompiledConstraints(sorted(forbidden), engine.radix)
+
+
+class CompiledConstraints:
+    """Encoded forbidden tuples with per-value lookup for fast validity checks"""
+
+    def __init__(self, forbidden: List[Tuple[Tuple[int, int], ...]], radix: List[int]):
+        self.forbidden = forbidden
+        self.radix = radix
+        self.by_value: Dict[Tuple[int, int], List[Tuple[Tuple[int, int], ...]]] = {}
+        for tup in forbidden:
+            for entry in tup:
+                self.by_value.setdefault(entry, []).append(tup)
+        self.columns = sorted({c for tup in forbidden for c, _ in tup})
+        self.column_set = set(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.forbidden)
+
+    def violates(self, row, column: Optional[int] = None) -> bool:
+        """
+        Check whether a (possibly partial, -1 = unset) row matches a forbidden tuple.
+
+        If ``column`` is given, only forbidden tuples involving it are checked.
+        """
+        columns = range(len(row)) if column is None else (column,)
+        for c in columns:
+            if row[c] < 0:
+                continue
+            for tup in self.by_value.get((c, row[c]), ()):
+                if all(row[fc] == fcode for fc, fcode in tup):
+                    return True
+        return False
+
+    def complete(self, row) -> Optional[List[int]]:
+        """
+        Assign the unset constrained columns of a partial row without violations.
+
+        Unconstrained columns are left untouched. Returns the completed row,
+        or None if no valid completion exists.
+        """
+        row = list(row)
+        if self.violates(row):
+            return None
+        free = [c for c in self.columns if row[c] < 0]
+
+        def search(k: int) -> bool:
+            if k == len(free):
+                return True
+            c = free[k]
+            for v in range(self.radix[c]):
+                row[c] = v
+                if not self.violates(row, c) and search(k + 1):
+                    return True
+            row[c] = -1
+            return False
+
+        return row if search(0) else None
+
+    def invalid_mask(self, row_bits: List[List[int]], n: int) -> int:
+        """Bitset of the candidates matching any forbidden tuple, for all rows at once"""
+        mask = 0
+        for tup in self.forbidden:
+            hits = (1 << n) - 1
+            for c, code in tup:
+                hits &= row_bits[c][code]
+            mask |= hits
+        return mask
+
+
+@dataclass(frozen=True)
+class StrengthGroup:
+    """
+    Parameters covered at a higher strength than the rest of the model.
+
+    Every ``strength``-subset of ``parameters`` becomes an extra coverage
+    group, so a group of three parameters at strength 3 requires all of
+    their value triples while the remaining parameters stay at the base
+    strength (variable-strength coverage).
+    """
+    parameters: Tuple[str, ...]
+    strength: int
+
+    @classmethod
+    def parse(cls, spec: str) -> 'StrengthGroup':
+        """
+        Parse ``[T:]PARAM,PARAM,...``; T defaults to the number of parameters.
 
         Raises:
-            FileNotFoundError: If file doesn't exist
-            PermissionError: If file isn't readable
-            ValueError: If file is empty or invalid
+            ValueError: If the specification is malformed
         """
-        path = Path(input_file)
+        strength, _, names = spec.rpartition(':')
+        parameters = tuple(name.strip() for name in names.split(',') if name.strip())
+        try:
+            t = int(strength) if strength.strip() else len(parameters)
+        except ValueError:
+            raise ValueError(f"Invalid strength in strength group '{spec}'")
+        if len(set(parameters)) != len(parameters):
+            raise ValueError(f"Strength group lists a parameter twice: '{spec}'")
+        if not 2 <= t <= len(parameters):
+            raise ValueError(
+                f"Strength group '{spec}' needs a strength between 2 and its "
+                f"{len(parameters)} parameters"
+            )
+        return cls(parameters, t)
+
+    def label(self) -> str:
+        return ', '.join(self.parameters)
+
+    def column_groups(self, headers: List[str]) -> List[Tuple[int, ...]]:
+        """Column groups the sub-group adds for ``headers`` (empty if too few are present)"""
+        columns = sorted(headers.index(p) for p in self.parameters if p in headers)
+        return list(itertools.combinations(columns, self.strength))
+
+
+# Constructions are only built when their row count is at most this multiple
+# of the product of the t largest value counts (a lower bound on any plan)
+CONSTRUCTION_MAX_RATIO = 1.5
+
+# Pairwise covering arrays CA(N; 2, k, v) found by annealing search, by number of
+# values v; one row per space-separated string. An array also covers any model
+# with at most k parameters of at most v values.
+KNOWN_COVERING_ARRAYS: Dict[int, List[str]] = {
+    3: [
+        "00022 12122 20111 11011 22212 01221 02110 01102 10200 21020 22001",
+        "0020011 1021212 0111002 0222200 1212021 2002102 0200122 2121121 1112110 "
+        "2010220 2201010 1100201",
+        "221202222 212112010 200020210 010122201 201211101 102002102 012220120 "
+        "110200011 011021012 020110112 000101020 121120000 122011221",
+        "111120111200 210112112111 210101220222 002021211112 102100022011 110002010020 "
+        "201212021200 121211212022 020021122100 012212202210 100200101121 221221000111 "
+        "022122001022 021000210201 202010100002",
+    ],
+    4: [
+        "220032 232121 021211 313021 301112 033312 002002 212213 123103 322320 211300 "
+        "111222 010130 102331 000323 130010 330201 203230 331033",
+        "1212103 2111323 2120111 3103132 2323203 0132212 1131000 1001221 1310332 "
+        "0213031 3010210 3221132 2202230 1223310 2033133 3332301 0323120 2022022 "
+        "3230023 0301013 0000302",
+    ],
+    5: [
+        "1041034 2034121 1203401 0340311 2120000 0212022 2440442 1410223 3244230 "
+        "2313334 3433011 0401320 0414104 1124312 3324424 3111241 0133433 4331202 "
+        "3042303 4143120 1332140 3000132 2221113 0023242 4422431 4011410 2102214 "
+        "4304043 4230344",
+    ],
+}
+
+
+def _prime_power(q: int) -> Optional[Tuple[int, int]]:
+    """(p, n) with q = p**n for a prime p, or None"""
+    for p in range(2, q + 1):
+        if q % p == 0:
+            n = 0
+            while q % p == 0:
+                q //= p
+                n += 1
+            return (p, n) if q == 1 else None
+    return None
+
+
+class GaloisField:
+    """Finite field GF(q) of a prime power order; elements are the ints 0..q-1"""
+
+    def __init__(self, q: int):
+        """
+        Build the addition and multiplication tables.
 
-        if not path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_file}")
+        Raises:
+            ValueError: If q is not a prime power
+        """
+        power = _prime_power(q) if q >= 2 else None
+        if power is None:
+            raise ValueError(f"Finite fields need a prime power order, got {q}")
+        p, n = power
+        self.q = q
+        # Element x stands for the polynomial with the base-p digits of x as coefficients
+        digits = [[(x // p ** i) % p for i in range(n)] for x in range(q)]
+
+        def value(coeffs: List[int]) -> int:
+            return sum(c * p ** i for i, c in enumerate(coeffs))
+
+        self.add = [
+            [value([(a + b) % p for a, b in zip(digits[x], digits[y])]) for y in range(q)]
+            for x in range(q)
+        ]
+        # Multiplication modulo the first monic degree-n polynomial without zero divisors
+        for tail in itertools.product(range(p), repeat=n):
+            self.mul = [
+                [value(self._mulmod(digits[x], digits[y], list(tail), p)) for y in range(q)]
+                for x in range(q)
+            ]
+            if all(self.mul[x][y] for x in range(1, q) for y in range(1, q)):
+                break
 
-        if not path.is_file():
-            raise ValueError(f"Path is not a file: {input_file}")
+    @staticmethod
+    def _mulmod(a: List[int], b: List[int], tail: List[int], p: int) -> List[int]:
+        """Product of two polynomials modulo x^n + tail (coefficients low to high)"""
+        n = len(tail)
+        product = [0] * (2 * n)
+        for i, x in enumerate(a):
+            for j, y in enumerate(b):
+                product[i + j] = (product[i + j] + x * y) % p
+        for d in range(2 * n - 1, n - 1, -1):
+            # x^d = x^(d-n) * x^n = -x^(d-n) * tail
+            c = product[d]
+            if c:
+                product[d] = 0
+                for i, t in enumerate(tail):
+                    product[d - n + i] = (product[d - n + i] - c * t) % p
+        return product[:n]
+
+
+def bush_array(q: int, strength: int, k: int) -> List[Tuple[int, ...]]:
+    """
+    Bush orthogonal array OA(q^t; t, k, q) over GF(q) (Bose's construction for t = 2).
 
-        if not os.access(path, os.R_OK):
-            raise PermissionError(f"Cannot read file: {input_file}")
+    Rows are the polynomials of degree below t. Column j < q evaluates the
+    polynomial at field element j and column q holds its leading coefficient,
+    so any t columns show every t-tuple exactly once.
 
-        if path.stat().st_size == 0:
-            raise ValueError(f"Input file is empty: {input_file}")
+    Args:
+        q: Prime power number of values
+        strength: Interaction strength t, at most q
+        k: Number of columns, at most q + 1
+    """
+    field = GaloisField(q)
+    add, mul = field.add, field.mul
+    rows = []
+    for coeffs in itertools.product(range(q), repeat=strength):
+        row = []
+        for x in range(min(k, q)):
+            value = 0
+            for c in reversed(coeffs):
+                value = add[mul[value][x]][c]
+            row.append(value)
+        if k > q:
+            row.append(coeffs[-1])
+        rows.append(tuple(row))
+    return rows
+
+
+def stacked_bose_array(levels: int, q: int, k: int) -> List[Tuple[int, ...]]:
+    """
+    Pairwise covering array CA(levels * q; 2, levels^1 q^(k-1)) extending Bose's construction.
+
+    Row (x, y), x < levels and y in GF(q), holds x, y and y + m * x for every
+    nonzero m, with x read as a field element modulo q. Two of the GF(q)
+    columns differ by a nonzero multiple of x, which takes every value as x
+    runs over the field, so all their pairs occur; with levels = q this is the
+    orthogonal array OA(q^2; 2, q + 1, q).
+
+    Args:
+        levels: Values of the first column, at least q
+        q: Prime power number of values of the other columns
+        k: Number of columns, at most q + 1
+    """
+    field = GaloisField(q)
+    rows = []
+    for x in range(levels):
+        for y in range(q):
+            row = [x, y] + [field.add[y][field.mul[m][x % q]] for m in range(1, q)]
+            rows.append(tuple(row[:k]))
+    return rows
 
-        self.logger.info(f"✓ Input file validated: {input_file}")
-        return True
 
-    def read_csv_with_validation(self, input_file: str) -> Tuple[List[str], List[List[str]]]:
+def binary_covering_array(k: int) -> List[Tuple[int, ...]]:
+    """
+    Optimal pairwise binary covering array (Kleitman-Spencer / Katona).
+
+    Columns are distinct weight-ceil(N/2) subsets of rows 1..N-1: any two are
+    incomparable (giving 01 and 10) and intersect (11), and row 0 is all 0s.
+    N is the smallest size with C(N-1, ceil(N/2)) >= k, which is optimal.
+    """
+    n = 4
+    while math.comb(n - 1, (n + 1) // 2) < k:
+        n += 1
+    columns = list(itertools.combinations(range(1, n), (n + 1) // 2))[:k]
+    return [tuple(int(r in column) for column in columns) for r in range(n)]
+
+
+def _construction_options(
+    radix: List[int],
+    strength: int
+) -> Tuple[List[int], List[Tuple[int, str, Callable[[], List[Tuple[int, ...]]]]]]:
+    """
+    Constructions that fit a model, without building them.
+
+    Args:
+        radix: Number of values of each parameter, in column order
+        strength: Interaction strength t
+
+    Returns:
+        Tuple of (model columns in array column order, list of (rows,
+        description, builder) options)
+    """
+    columns = sorted((c for c, r in enumerate(radix) if r > 1), key=lambda c: -radix[c])
+    if len(columns) < strength:
+        return columns, []
+    levels = [radix[c] for c in columns]
+    k = len(columns)
+
+    # (rows, description, builder) of every construction that fits
+    options = []
+
+    def prime_powers(start: int) -> Iterator[int]:
+        q = max(2, start)
+        while True:
+            if _prime_power(q):
+                yield q
+            q += 1
+
+    if strength == 2:
+        q = next(q for q in prime_powers(levels[1]) if q + 1 >= k)
+        first = max(levels[0], q)
+        name = (
+            f"Bose orthogonal array OA({q * q}; 2, {k}, {q})" if first == q
+            else f"Bose construction CA({first * q}; 2, {first}^1 {q}^{k - 1})"
+        )
+        options.append((first * q, name, lambda: stacked_bose_array(first, q, k)))
+        if levels[0] == 2:
+            binary = binary_covering_array(k)
+            options.append((
+                len(binary), f"Kleitman-Spencer covering array CA({len(binary)}; 2, {k}, 2)",
+                lambda: binary
+            ))
+        for v, arrays in KNOWN_COVERING_ARRAYS.items():
+            if v < levels[0]:
+                continue
+            for spec in arrays:
+                table = [tuple(int(symbol) for symbol in row) for row in spec.split()]
+                if len(table[0]) >= k:
+                    options.append((
+                        len(table), f"covering array CA({len(table)}; 2, {len(table[0])}, {v})",
+                        lambda table=table: [row[:k] for row in table]
+                    ))
+                    break
+    else:
+        q = next(q for q in prime_powers(max(levels[0], strength)) if q + 1 >= k)
+        options.append((
+            q ** strength, f"Bush orthogonal array OA({q ** strength}; {strength}, {k}, {q})",
+            lambda: bush_array(q, strength, k)
+        ))
+
+    return columns, options
+
+
+def smallest_construction(radix: List[int], strength: int) -> Optional[Tuple[str, int]]:
+    """
+    Description and row count of the smallest construction covering a model,
+    without building it (the rows are an upper bound on the optimal plan size).
+
+    Args:
+        radix: Number of values of each parameter
+        strength: Interaction strength t
+
+    Returns:
+        Tuple of (description, rows), or None if no construction fits
+    """
+    _, options = _construction_options(radix, strength)
+    if not options:
+        return None
+    size, name, _ = min(options, key=lambda option: option[0])
+    return name, size
+
+
+def covering_array(
+    radix: List[int],
+    strength: int,
+    max_rows: Optional[int] = None
+) -> Optional[Tuple[str, int, List[Tuple[int, ...]]]]:
+    """
+    Smallest known construction covering a model at strength t.
+
+    Tries Bose's construction (extended to a larger first parameter), Bush's
+    orthogonal arrays, the binary Kleitman-Spencer arrays and the bundled
+    ``KNOWN_COVERING_ARRAYS``. Parameters with a single value are left out;
+    array columns go to the model's parameters by descending value count, and
+    a parameter with fewer values than its column folds the extra symbols
+    onto its own values (any surjective map keeps every t-tuple covered).
+
+    Args:
+        radix: Number of values of each parameter, in column order
+        strength: Interaction strength t
+        max_rows: Skip constructions with more rows than this; they are
+            never built
+
+    Returns:
+        Tuple of (description, rows of the array, encoded rows in column
+        order after folding), or None if no construction fits the model
+    """
+    columns, options = _construction_options(radix, strength)
+    if max_rows is not None:
+        options = [option for option in options if option[0] <= max_rows]
+    if not options:
+        return None
+
+    size, name, build = min(options, key=lambda option: option[0])
+    rows = []
+    for array_row in build():
+        row = [0] * len(radix)
+        for c, symbol in zip(columns, array_row):
+            row[c] = symbol % radix[c]
+        rows.append(tuple(row))
+    # Folding can repeat rows
+    return name, size, list(dict.fromkeys(rows))
+
+
+class CoverageEngine:
+    """
+    Integer-encoded t-way coverage state.
+
+    Parameter values are dictionary-encoded to small integers (N/A is -1) and
+    every group of ``strength`` parameters owns a packed bit matrix - a Python
+    int with one bit per value combination, indexed in mixed radix - marking
+    the t-tuples that are still uncovered. Candidate gains are kept for all
+    candidates at once and updated incrementally: when a tuple becomes
+    covered, the rows containing it are found by ANDing per-value row bitsets.
+
+    Extra column groups larger than ``strength`` (variable-strength coverage)
+    are appended after the t-way groups and tracked the same way.
+    """
+
+    def __init__(
+        self,
+        headers: List[str],
+        params: Dict[str, List[str]],
+        strength: int = 2,
+        extra_groups: Optional[Iterable[Tuple[int, ...]]] = None
+    ):
         """
-        Read and validate CSV file structure.
+        Initialize the engine with every t-tuple uncovered.
 
         Args:
-            input_file: Path to the CSV file
+            headers: Parameter names, in row column order
+            params: Dictionary mapping parameter names to their possible values
+            strength: Interaction strength t (2 = pairwise)
+            extra_groups: Column groups to cover at their own, higher strength
+                (see ``StrengthGroup``)
+        """
+        if strength < 2:
+            raise ValueError(f"Interaction strength must be at least 2, got {strength}")
+
+        self.headers = list(headers)
+        self.strength = strength
+        self.values = [list(params[h]) for h in self.headers]
+        self.codes = [{v: c for c, v in enumerate(vals)} for vals in self.values]
+        self.radix = [len(vals) for vals in self.values]
+
+        # One bit matrix per column group; bit = sum(code * stride) over the group
+        self.group_of: Dict[Tuple[int, ...], int] = {}
+        self.groups: List[Tuple[int, ...]] = []
+        self.strides: List[Tuple[int, ...]] = []
+        self.uncovered: List[int] = []
+        self.total_pairs = 0
+        extra = list(dict.fromkeys(tuple(sorted(cols)) for cols in extra_groups or ()))
+        for cols in extra:
+            if len(cols) <= strength:
+                raise ValueError(
+                    f"Extra coverage groups must be larger than the strength {strength}: {cols}"
+                )
+        all_groups = itertools.chain(
+            itertools.combinations(range(len(self.headers)), strength), extra
+        )
+        for cols in all_groups:
+            strides = []
+            size = 1
+            for c in reversed(cols):
+                strides.append(size)
+                size *= self.radix[c]
+            self.group_of[cols] = len(self.groups)
+            self.groups.append(cols)
+            self.strides.append(tuple(reversed(strides)))
+            self.uncovered.append((1 << size) - 1)
+            self.total_pairs += size
+
+        self.uncovered_count = self.total_pairs
+        self.excluded_count = 0
+        self.constraints: Optional[CompiledConstraints] = None
+
+        # Indices of the extra (higher-strength) groups, after the t-way groups
+        self.extra_groups = list(range(len(self.groups) - len(extra), len(self.groups)))
+        self.base_group_count = len(self.groups) - len(extra)
+
+        # Pairwise fast path: group of columns (i, j), i < j, by direct indexing
+        self.pair_group: Optional[List[List[int]]] = None
+        if strength == 2:
+            self.pair_group = [[-1] * len(self.headers) for _ in self.headers]
+            for g, (i, j) in enumerate(self.groups[:self.base_group_count]):
+                self.pair_group[i][j] = g
+
+    @property
+    def covered_count(self) -> int:
+        """Number of t-tuples covered so far"""
+        return self.total_pairs - self.uncovered_count
+
+    def copy(self) -> 'CoverageEngine':
+        """Independent coverage state sharing the read-only encoding tables"""
+        clone = copy.copy(self)
+        clone.uncovered = list(self.uncovered)
+        return clone
+
+    def encode_row(self, values) -> Tuple[int, ...]:
+        """Encode a row of string values; N/A and unknown values become -1"""
+        return tuple(
+            self.codes[i].get(value, -1) for i, value in enumerate(values)
+        )
 
-        Returns:
-            Tuple of (headers, rows)
+    def decode_row(self, row: Tuple[int, ...]) -> Tuple[str, ...]:
+        """Decode an encoded row back to its string values"""
+        return tuple(
+            self.values[i][code] if code >= 0 else 'N/A' for i, code in enumerate(row)
+        )
 
-        Raises:
-            ValueError: If CSV is malformed
+    def tuple_slot(self, assignment) -> Tuple[int, int]:
         """
-        try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                headers = next(reader)
+        Locate a t-tuple in the coverage state.
 
-                if not headers:
-                    raise ValueError("CSV file has no headers")
+        Args:
+            assignment: Sequence of (column, code) sorted by column
 
-                rows = list(reader)
+        Returns:
+            (group, bit) holding the tuple
+        """
+        g = self.group_of[tuple(c for c, _ in assignment)]
+        return g, sum(code * stride for (_, code), stride in zip(assignment, self.strides[g]))
+
+    def decode_slot(self, g: int, bit: int) -> Tuple[Tuple[int, int], ...]:
+        """Inverse of ``tuple_slot``: the (column, code) assignment of a bit"""
+        return tuple(
+            (c, (bit // stride) % self.radix[c])
+            for c, stride in zip(self.groups[g], self.strides[g])
+        )
 
-                if not rows:
-                    raise ValueError("CSV file has no data rows")
+    def is_uncovered(self, assignment) -> bool:
+        """Check whether a t-tuple, given as sorted (column, code) pairs, is uncovered"""
+        g, bit = self.tuple_slot(assignment)
+        return bool((self.uncovered[g] >> bit) & 1)
 
-                # Validate row lengths
-                expected_cols = len(headers)
-                for i, row in enumerate(rows, start=2):  # Start at 2 (after header)
-                    if len(row) != expected_cols:
-                        self.logger.warning(
-                            f"Row {i} has {len(row)} columns, expected {expected_cols}. "
-                            f"Padding/truncating."
-                        )
-                        # Pad or truncate to match header length
-                        if len(row) < expected_cols:
-                            row.extend([''] * (expected_cols - len(row)))
-                        else:
-                            rows[i-2] = row[:expected_cols]
+    @staticmethod
+    def sparse_row(row: Tuple[int, ...]) -> List[Tuple[int, int]]:
+        """The populated (column, code) entries of a dense encoded row"""
+        return [(i, code) for i, code in enumerate(row) if code >= 0]
 
-                self.logger.info(f"✓ Loaded {len(rows)} rows with {len(headers)} columns")
-                return headers, rows
+    def row_slots(self, entries: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        (group, bit) of every t-tuple of a sparse row.
 
-        except csv.Error as e:
-            raise ValueError(f"CSV parsing error: {e}")
-        except UnicodeDecodeError as e:
-            raise ValueError(f"File encoding error (expected UTF-8): {e}")
+        Only the row's populated entries are combined, so the cost depends on
+        the parameters the row uses, not on the width of the schema.
 
-    def extract_parameters(
+        Args:
+            entries: Populated (column, code) entries sorted by column
+
+        Returns:
+            One (group, bit) per t-tuple of the row
+        """
+        if self.pair_group is not None:
+            pair_group = self.pair_group
+            radix = self.radix
+            slots = []
+            for x, (i, a) in enumerate(entries):
+                groups_i = pair_group[i]
+                slots.extend(
+                    (groups_i[j], a * radix[j] + b) for j, b in entries[x + 1:]
+                )
+        else:
+            group_of = self.group_of
+            strides = self.strides
+            slots = []
+            for assignment in itertools.combinations(entries, self.strength):
+                g = group_of[tuple(c for c, _ in assignment)]
+                slots.append(
+                    (g, sum(code * stride for (_, code), stride in zip(assignment, strides[g])))
+                )
+        if self.extra_groups:
+            codes = dict(entries)
+            for g in self.extra_groups:
+                if all(c in codes for c in self.groups[g]):
+                    slots.append((g, sum(
+                        codes[c] * stride for c, stride in zip(self.groups[g], self.strides[g])
+                    )))
+        return slots
+
+    def _row_tuples(self, row: Tuple[int, ...], column: Optional[int] = None):
+        """
+        Yield (group, bit, assignment) for every non-N/A t-tuple of an encoded row.
+
+        If ``column`` is given, only the tuples involving that column are yielded.
+        Tuples of the extra groups follow the t-tuples.
+        """
+        group_of = self.group_of
+        strides = self.strides
+        if column is None:
+            populated = [(i, code) for i, code in enumerate(row) if code >= 0]
+            assignments = itertools.combinations(populated, self.strength)
+        else:
+            if row[column] < 0:
+                return
+            fixed = (column, row[column])
+            others = [(i, code) for i, code in enumerate(row) if code >= 0 and i != column]
+            assignments = (
+                tuple(sorted(partial + (fixed,)))
+                for partial in itertools.combinations(others, self.strength - 1)
+            )
+        for assignment in assignments:
+            g = group_of[tuple(c for c, _ in assignment)]
+            yield g, sum(code * stride for (_, code), stride in zip(assignment, strides[g])), assignment
+        for g in self.extra_groups:
+            cols = self.groups[g]
+            if (column is None or column in cols) and all(row[c] >= 0 for c in cols):
+                assignment = tuple((c, row[c]) for c in cols)
+                yield g, sum(code * stride for (_, code), stride in zip(assignment, strides[g])), assignment
+
+    def row_gain(
         self,
-        headers: List[str],
-        rows: List[List[str]],
-        exclude_columns: Optional[List[str]] = None
-    ) -> Dict[str, List[str]]:
+        row: Tuple[int, ...],
+        entries: Optional[List[Tuple[int, int]]] = None
+    ) -> int:
+        """Count the uncovered t-tuples an encoded row (or its sparse entries) would cover"""
+        uncovered = self.uncovered
+        if entries is None:
+            entries = self.sparse_row(row)
+        return sum(1 for g, bit in self.row_slots(entries) if (uncovered[g] >> bit) & 1)
+
+    def cover(
+        self,
+        row: Tuple[int, ...],
+        column: Optional[int] = None
+    ) -> List[Tuple[Tuple[int, int], ...]]:
         """
-        Extract parameter values from CSV, filtering N/A and handling constraints.
+        Mark every t-tuple of an encoded row as covered.
 
         Args:
-            headers: Column headers
-            rows: Data rows
-            exclude_columns: Columns to exclude (e.g., 'Variant_ID')
+            row: Encoded row
+            column: Only cover the tuples involving this column
 
         Returns:
-            Dictionary mapping parameter names to their possible values
+            List of newly covered tuples as sorted (column, code) assignments
         """
-        exclude_columns = exclude_columns or ['Variant_ID', 'Test_Case_ID']
-        params = {}
+        uncovered = self.uncovered
+        newly_covered = []
+        for g, bit, assignment in self._row_tuples(row, column):
+            if (uncovered[g] >> bit) & 1:
+                uncovered[g] ^= 1 << bit
+                newly_covered.append(assignment)
+        self.uncovered_count -= len(newly_covered)
+        return newly_covered
+
+    def cover_columns(self, columns: List[List[int]]) -> int:
+        """
+        Mark every t-tuple of a batch of encoded rows as covered.
 
-        for i, header in enumerate(headers):
-            if header in exclude_columns:
-                self.logger.debug(f"Skipping column: {header}")
+        The batch is given column-wise; each group's distinct value tuples are
+        collected with ``set(zip(...))`` so duplicate rows cost almost nothing.
+
+        Args:
+            columns: One list of codes per header, all the same length
+
+        Returns:
+            Number of newly covered t-tuples
+        """
+        newly_covered = 0
+        for g, cols in enumerate(self.groups):
+            strides = self.strides[g]
+            bits = [
+                sum(code * stride for code, stride in zip(codes, strides))
+                for codes in set(zip(*[columns[c] for c in cols]))
+                if min(codes) >= 0
+            ]
+            hit = self.uncovered[g] & _pack_bits(bits, strides[0] * self.radix[cols[0]])
+            if hit:
+                self.uncovered[g] ^= hit
+                newly_covered += bin(hit).count('1')
+        self.uncovered_count -= newly_covered
+        return newly_covered
+
+    def uncovered_tuples(self) -> Iterator[Tuple[Tuple[int, int], ...]]:
+        """Yield every uncovered t-tuple as sorted (column, code) pairs, group by group"""
+        for g, mask in enumerate(self.uncovered):
+            for bit in _iter_set_bits(mask):
+                yield self.decode_slot(g, bit)
+
+    def coverage_of(self, groups: Iterable[int], target: List[int]) -> Tuple[int, int]:
+        """(covered, total) tuples of some groups, given a snapshot of the initial ``uncovered``"""
+        covered = total = 0
+        for g in groups:
+            group_total = _popcount(target[g])
+            covered += group_total - _popcount(self.uncovered[g])
+            total += group_total
+        return covered, total
+
+    def build_row_bits(self, candidates: List[Tuple[int, ...]]) -> List[List[int]]:
+        """Per (column, value) bitset of the candidate rows holding that value"""
+        n = len(candidates)
+        row_bits = []
+        for i, k in enumerate(self.radix):
+            members = [[] for _ in range(k)]
+            for r, row in enumerate(candidates):
+                if row[i] >= 0:
+                    members[row[i]].append(r)
+            row_bits.append([_pack_bits(m, n) for m in members])
+        return row_bits
+
+    def exclude(self, g: int, bit: int) -> bool:
+        """Drop an uncovered t-tuple from the coverage target"""
+        if (self.uncovered[g] >> bit) & 1:
+            self.uncovered[g] ^= 1 << bit
+            self.uncovered_count -= 1
+            self.total_pairs -= 1
+            self.excluded_count += 1
+            return True
+        return False
+
+    def apply_constraints(
+        self,
+        constraint_set: ConstraintSet,
+        candidates: Optional[List[Tuple[int, ...]]] = None
+    ) -> List[int]:
+        """
+        Compile constraints and drop unreachable t-tuples from the target.
+
+        With ``candidates`` (select mode) a tuple is reachable if some valid
+        candidate contains it; tuples that only occur in invalid candidates,
+        or that contain a forbidden combination, are dropped. Without
+        candidates (generate mode) a tuple is reachable if it can be completed
+        to a full valid row.
+
+        Args:
+            constraint_set: Constraints to apply
+            candidates: Encoded candidate rows, for select mode
+
+        Returns:
+            Indices of the valid candidates (empty in generate mode)
+        """
+        compiled = constraint_set.compile(self)
+        self.constraints = compiled
+        if not compiled.forbidden:
+            return list(range(len(candidates or [])))
+
+        # Tuples that contain a forbidden combination can never be covered
+        for g, cols in enumerate(self.groups):
+            if not compiled.column_set.intersection(cols):
                 continue
+            for bit in list(_iter_set_bits(self.uncovered[g])):
+                if compiled.violates(self._slot_row(g, bit)):
+                    self.exclude(g, bit)
+
+        if candidates is None:
+            # Implicitly forbidden tuples: valid on their own, but not completable
+            for g, cols in enumerate(self.groups):
+                if not compiled.column_set.intersection(cols):
+                    continue
+                for bit in list(_iter_set_bits(self.uncovered[g])):
+                    if compiled.complete(self._slot_row(g, bit)) is None:
+                        self.exclude(g, bit)
+            return []
+
+        valid = self.valid_candidates(candidates)
+        if len(valid) < len(candidates):
+            invalid = (1 << len(candidates)) - 1
+            for r in valid:
+                invalid ^= 1 << r
+            # Keep only tuples that some valid candidate can still cover
+            reachable = [0] * len(self.groups)
+            for r in valid:
+                for g, bit, _ in self._row_tuples(candidates[r]):
+                    reachable[g] |= 1 << bit
+            for r in _iter_set_bits(invalid):
+                for g, bit, _ in self._row_tuples(candidates[r]):
+                    if not (reachable[g] >> bit) & 1:
+                        self.exclude(g, bit)
+        return valid
+
+    def valid_candidates(self, candidates: List[Tuple[int, ...]]) -> List[int]:
+        """Indices of the candidates that violate no compiled constraint"""
+        if self.constraints is None or not self.constraints.forbidden:
+            return list(range(len(candidates)))
+        n = len(candidates)
+        invalid = self.constraints.invalid_mask(self.build_row_bits(candidates), n)
+        return [r for r in range(n) if not (invalid >> r) & 1]
+
+    def _slot_row(self, g: int, bit: int) -> List[int]:
+        """Partial row (-1 = unset) holding only the t-tuple at (group, bit)"""
+        row = [-1] * len(self.headers)
+        for c, code in self.decode_slot(g, bit):
+            row[c] = code
+        return row
+
+    def greedy_select(
+        self,
+        candidates: List[Tuple[int, ...]],
+        max_rows: Optional[int] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        entries: Optional[List[List[Tuple[int, int]]]] = None
+    ) -> List[int]:
+        """
+        Greedily pick candidates until no candidate covers a new t-tuple.
 
-            # Extract unique values, excluding empty strings and N/A
-            values = []
-            for row in rows:
-                if i < len(row):
-                    value = row[i].strip()
-                    # Only include non-empty, non-N/A values
-                    if value and value.upper() not in ('N/A', 'NA', 'NULL', ''):
-                        values.append(value)
+        Each step picks the candidate with the highest gain, breaking ties by
+        the lowest candidate index, exactly like a full rescan would.
 
-            unique_values = sorted(list(set(values)))
+        Args:
+            candidates: Encoded candidate rows
+            max_rows: Optional cap on the number of rows selected
+            instrumentation: Optional counters, stepped once per selected row
+            entries: Sparse form of ``candidates`` (see ``sparse_row``), if known
 
-            if not unique_values:
-                self.logger.warning(f"Parameter '{header}' has no valid values, skipping")
+        Returns:
+            Indices of the selected candidates, in selection order
+        """
+        n = len(candidates)
+        max_rows = n if max_rows is None else min(max_rows, n)
+
+        row_bits = self.build_row_bits(candidates)
+        if entries is None:
+            entries = [self.sparse_row(row) for row in candidates]
+        gains = [self.row_gain(row, sparse) for row, sparse in zip(candidates, entries)]
+        remaining = (1 << n) - 1
+        selected = []
+        scored = n
+
+        while len(selected) < max_rows and self.uncovered_count:
+            best = max(gains) if gains else 0
+            if best <= 0:
+                break
+            r = gains.index(best)
+            selected.append(r)
+            gains[r] = -1
+            remaining ^= 1 << r
+
+            newly_covered = self.cover(candidates[r])
+            for assignment in newly_covered:
+                hits = remaining
+                for c, code in assignment:
+                    hits &= row_bits[c][code]
+                for k in _iter_set_bits(hits):
+                    gains[k] -= 1
+                if instrumentation is not None:
+                    scored += _popcount(hits)
+
+            if instrumentation is not None:
+                instrumentation.step(len(newly_covered), scored)
+                scored = 0
+
+        return selected
+
+    def lazy_select(
+        self,
+        candidates: List[Tuple[int, ...]],
+        max_rows: Optional[int] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        entries: Optional[List[List[Tuple[int, int]]]] = None
+    ) -> List[int]:
+        """
+        Lazy-greedy (CELF) selection; returns exactly what ``greedy_select`` would.
+
+        Candidates sit in a max-heap keyed by (gain, -index) where the gain is
+        an upper bound computed at some earlier step. Because marginal gain
+        can only shrink as tuples get covered, the top entry is re-evaluated
+        when it surfaces and selected only once its bound is current. Most
+        candidates are never rescored, and no per-value row bitsets are needed.
+
+        Args:
+            candidates: Encoded candidate rows
+            max_rows: Optional cap on the number of rows selected
+            instrumentation: Optional counters, stepped once per selected row
+            entries: Sparse form of ``candidates`` (see ``sparse_row``), if known
+
+        Returns:
+            Indices of the selected candidates, in selection order
+        """
+        n = len(candidates)
+        max_rows = n if max_rows is None else min(max_rows, n)
+
+        uncovered = self.uncovered
+        if entries is None:
+            entries = [self.sparse_row(row) for row in candidates]
+
+        # Each candidate's still-uncovered (group, bit) slots; pruned on every refresh
+        open_slots = [
+            [(g, bit) for g, bit in self.row_slots(sparse) if (uncovered[g] >> bit) & 1]
+            for sparse in entries
+        ]
+        heap = [(-len(slots), r) for r, slots in enumerate(open_slots)]
+        heapq.heapify(heap)
+        evaluated_at = [0] * n
+        selected = []
+        scored = n
+
+        while heap and len(selected) < max_rows and self.uncovered_count:
+            neg_gain, r = heap[0]
+            if neg_gain >= 0:
+                break
+            step = len(selected)
+            if evaluated_at[r] != step:
+                # Stale bound: refresh it and let the heap reorder
+                evaluated_at[r] = step
+                scored += 1
+                slots = [(g, bit) for g, bit in open_slots[r] if (uncovered[g] >> bit) & 1]
+                open_slots[r] = slots
+                heapq.heapreplace(heap, (-len(slots), r))
                 continue
 
-            params[header] = unique_values
-            self.logger.debug(f"Parameter '{header}': {len(unique_values)} unique values")
+            heapq.heappop(heap)
+            selected.append(r)
+            open_slots[r] = None
+            newly_covered = self.cover(candidates[r])
 
-        if not params:
-            raise ValueError("No valid parameters extracted from CSV")
+            if instrumentation is not None:
+                instrumentation.step(len(newly_covered), scored)
+                scored = 0
 
-        self.logger.info(f"✓ Extracted {len(params)} parameters")
-        return params
+        return selected
 
-    def calculate_total_pairs(self, params: Dict[str, List[str]]) -> int:
-        """Calculate total number of parameter pairs to cover"""
-        total = 0
-        param_list = list(params.keys())
+    def parallel_select(
+        self,
+        candidates: List[Tuple[int, ...]],
+        workers: int,
+        max_rows: Optional[int] = None,
+        instrumentation: Optional[Instrumentation] = None
+    ) -> List[int]:
+        """
+        Lazy-greedy selection with candidate scoring spread over worker processes.
 
-        for i in range(len(param_list)):
-            for j in range(i + 1, len(param_list)):
-                p1_values = params[param_list[i]]
-                p2_values = params[param_list[j]]
-                total += len(p1_values) * len(p2_values)
+        The candidates are split into contiguous chunks, one per worker. The
+        encoded candidate matrix and the coverage state are placed in shared
+        memory, so each step only exchanges the selected index and one
+        (gain, index) per chunk. Picking the highest gain and then the lowest
+        index across chunks reproduces ``lazy_select`` exactly.
 
-        return total
+        Args:
+            candidates: Encoded candidate rows
+            workers: Number of worker processes
+            max_rows: Optional cap on the number of rows selected
+            instrumentation: Optional counters, stepped once per selected row
+
+        Returns:
+            Indices of the selected candidates, in selection order
+        """
+        n = len(candidates)
+        max_rows = n if max_rows is None else min(max_rows, n)
+        width = len(self.headers)
+        workers = max(1, min(workers, n))
+        if n == 0:
+            return []
+
+        # Byte-aligned bit matrix per group, addressed by absolute bit position
+        offsets, byte_sizes = [], []
+        total_bytes = 0
+        for g, cols in enumerate(self.groups):
+            size = self.strides[g][0] * self.radix[cols[0]]
+            offsets.append(total_bytes * 8)
+            byte_sizes.append((size + 7) // 8)
+            total_bytes += byte_sizes[-1]
+
+        candidates_shm = shared_memory.SharedMemory(create=True, size=max(4, n * width * 4))
+        coverage_shm = shared_memory.SharedMemory(create=True, size=max(1, total_bytes))
+        state = coverage_shm.buf
+        processes, conns = [], []
+        try:
+            matrix = candidates_shm.buf.cast('i')
+            matrix[:n * width] = array('i', itertools.chain.from_iterable(candidates))
+            matrix.release()
+            for g, mask in enumerate(self.uncovered):
+                start = offsets[g] // 8
+                state[start:start + byte_sizes[g]] = mask.to_bytes(byte_sizes[g], 'little')
+
+            context = multiprocessing.get_context()
+            bounds = [n * k // workers for k in range(workers + 1)]
+            for lo, hi in zip(bounds, bounds[1:]):
+                parent_conn, child_conn = context.Pipe()
+                process = context.Process(
+                    target=_scoring_worker,
+                    args=(
+                        child_conn, candidates_shm.name, coverage_shm.name, width, lo, hi,
+                        self.strength, self.groups, self.strides, offsets, self.extra_groups
+                    ),
+                    daemon=True
+                )
+                process.start()
+                child_conn.close()
+                processes.append(process)
+                conns.append(parent_conn)
+
+            selected = []
+            taken = -1
+            while len(selected) < max_rows and self.uncovered_count:
+                for conn in conns:
+                    conn.send(taken)
+                answers = [conn.recv() for conn in conns]
+                scored = sum(count for _, count in answers)
+                bests = [best for best, _ in answers if best is not None]
+                if not bests:
+                    break
+                _, taken = min(bests)
+                selected.append(taken)
+
+                newly_covered = self.cover(candidates[taken])
+                for assignment in newly_covered:
+                    g, bit = self.tuple_slot(assignment)
+                    pos = offsets[g] + bit
+                    state[pos >> 3] &= ~(1 << (pos & 7)) & 0xFF
+
+                if instrumentation is not None:
+                    instrumentation.step(len(newly_covered), scored)
+
+            for conn in conns:
+                conn.send(None)
+            for process in processes:
+                process.join()
+            return selected
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            for conn in conns:
+                conn.close()
+            state.release()
+            for shm in (candidates_shm, coverage_shm):
+                shm.close()
+                shm.unlink()
+
+    def ipog_build(self, instrumentation: Optional[Instrumentation] = None) -> List[Tuple[int, ...]]:
+        """
+        Build a t-way covering array one parameter at a time (IPOG).
+
+        Parameters are added in descending order of value count. Each new
+        parameter is first added to the existing rows (horizontal extension,
+        picking the value that covers the most new t-tuples), then any tuples
+        left uncovered are placed into don't-care slots or new rows (vertical
+        extension). Memory grows with the plan, never with the product size.
+
+        If constraints were applied, every row is kept completable to a valid
+        row and constrained don't-care slots are filled with valid values.
+        Tuples already covered before the call (e.g. by the fixed rows of an
+        existing plan) are skipped, so only the missing rows are built.
+
+        Args:
+            instrumentation: Optional counters, stepped once per parameter added
+
+        Returns:
+            Encoded rows, in header column order, with no N/A values
+        """
+        p_count = len(self.headers)
+        t = self.strength
+        order = sorted(range(p_count), key=lambda c: -self.radix[c])
+        radix = self.radix
+        uncovered = self.uncovered
+        constraints = self.constraints if self.constraints and self.constraints.forbidden else None
+
+        def still_valid(row: List[int], columns) -> bool:
+            if constraints is None or not constraints.column_set.intersection(columns):
+                return True
+            return constraints.complete(row) is not None
+
+        def step(covered_before: int, rows_before: int, scored: int):
+            if instrumentation is not None:
+                instrumentation.step(
+                    self.covered_count - covered_before, scored, len(rows) - rows_before
+                )
+
+        # Seed with the full product of the first t parameters
+        covered_before = self.covered_count
+        seed = sorted(order[:t])
+        rows: List[List[int]] = []
+        for codes in itertools.product(*[range(radix[c]) for c in seed]):
+            row = [-1] * p_count
+            for c, code in zip(seed, codes):
+                row[c] = code
+            if len(seed) == t:
+                if not self.is_uncovered([(c, row[c]) for c in seed]):
+                    continue
+            elif not still_valid(row, seed):
+                continue
+            rows.append(row)
+            self.cover(tuple(row))
+        step(covered_before, 0, len(rows))
+
+        for pos in range(t, p_count):
+            covered_before, rows_before = self.covered_count, len(rows)
+            col = order[pos]
+            previous = sorted(order[:pos])
+            col_groups = [
+                self.group_of[tuple(sorted(others + (col,)))]
+                for others in itertools.combinations(previous, t - 1)
+            ]
+            # Higher-strength groups are grown once their last column is added
+            col_extra = [
+                g for g in self.extra_groups
+                if col in self.groups[g] and all(c in previous for c in self.groups[g] if c != col)
+            ]
+
+            # Horizontal extension: extend each existing row with its best value
+            for row in rows:
+                populated = [(i, row[i]) for i in previous if row[i] >= 0]
+                # Slot of each partial tuple with the new column at value 0, plus its stride
+                slots = []
+                for partial in itertools.combinations(populated, t - 1):
+                    g, base = self.tuple_slot(sorted(partial + ((col, 0),)))
+                    slots.append((g, base, self.strides[g][self.groups[g].index(col)]))
+                for g in col_extra:
+                    assignment = [(c, 0 if c == col else row[c]) for c in self.groups[g]]
+                    if min(code for _, code in assignment) >= 0:
+                        _, base = self.tuple_slot(assignment)
+                        slots.append((g, base, self.strides[g][self.groups[g].index(col)]))
+                best_value, best_gain = -1, -1
+                for v in range(radix[col]):
+                    gain = sum((uncovered[g] >> (base + v * stride)) & 1 for g, base, stride in slots)
+                    if gain > best_gain:
+                        row[col] = v
+                        if still_valid(row, (col,)):
+                            best_value, best_gain = v, gain
+                row[col] = best_value
+                self.cover(tuple(row), col)
+
+            # Vertical extension: place every tuple still missing for this column
+            for g in col_groups + col_extra:
+                for bit in list(_iter_set_bits(uncovered[g])):
+                    if not (uncovered[g] >> bit) & 1:
+                        continue
+                    assignment = self.decode_slot(g, bit)
+                    columns = [c for c, _ in assignment]
+                    for row in rows:
+                        if all(row[c] in (code, -1) for c, code in assignment):
+                            previous_values = [row[c] for c in columns]
+                            for c, code in assignment:
+                                row[c] = code
+                            if still_valid(row, columns):
+                                break
+                            for c, value in zip(columns, previous_values):
+                                row[c] = value
+                    else:
+                        row = [-1] * p_count
+                        rows.append(row)
+                        for c, code in assignment:
+                            row[c] = code
+                    # Filling don't-cares may also cover tuples with the row's other values
+                    self.cover(tuple(row), col)
+            # Horizontal extension scored every value of the column for every old row
+            step(covered_before, rows_before, rows_before * radix[col])
+
+        # Remaining don't-care slots can take any (valid) value
+        if constraints is not None:
+            rows = [constraints.complete(row) for row in rows]
+        return [tuple(code if code >= 0 else 0 for code in row) for row in rows]
+
+    def aetg_build(
+        self,
+        candidates: int = 50,
+        seed: int = 0,
+        instrumentation: Optional[Instrumentation] = None
+    ) -> List[Tuple[int, ...]]:
+        """
+        Build a t-way covering array one row at a time from sampled candidates (AETG).
+
+        Every row is the best of ``candidates`` random constructions. Each
+        construction starts from a (column, value) found in the most uncovered
+        tuples, visits the other columns in random order and gives each the
+        value completing the most uncovered tuples with the values already
+        chosen (ties broken at random). For pairwise coverage a value's gain
+        is one AND of packed partner bitsets, so a row costs
+        O(candidates x columns x values) big-int operations whatever the size
+        of the Cartesian product; higher strengths enumerate the (t-1)-subsets
+        of the chosen values instead.
+
+        Constraints and already covered tuples are handled as in ``ipog_build``.
+
+        Args:
+            candidates: Random constructions per row (K)
+            seed: Seed of the random column orders and tie-breaks
+            instrumentation: Optional counters, stepped once per row
+
+        Returns:
+            Encoded rows, in header column order
+        """
+        p_count = len(self.headers)
+        t = self.strength
+        radix = self.radix
+        uncovered = self.uncovered
+        rng = random.Random(seed)
+        constraints = self.constraints if self.constraints and self.constraints.forbidden else None
+
+        # Entry e = offset[c] + v numbers every (column, value)
+        offset = [0] * p_count
+        for c in range(1, p_count):
+            offset[c] = offset[c - 1] + radix[c - 1]
+        entry_of = [(c, v) for c in range(p_count) for v in range(radix[c])]
+
+        # Uncovered tuples per entry, plus pairwise partner bitsets over entries
+        open_count = [0] * len(entry_of)
+        partners = [0] * len(entry_of) if self.pair_group is not None else None
+        for g, mask in enumerate(uncovered):
+            for bit in _iter_set_bits(mask):
+                assignment = self.decode_slot(g, bit)
+                for c, code in assignment:
+                    open_count[offset[c] + code] += 1
+                if partners is not None and g < self.base_group_count:
+                    (i, a), (j, b) = assignment
+                    partners[offset[i] + a] |= 1 << (offset[j] + b)
+                    partners[offset[j] + b] |= 1 << (offset[i] + a)
+
+        def value_gains(row: List[int], col: int, chosen: List[Tuple[int, int]], chosen_mask: int):
+            """Uncovered tuples each value of ``col`` would complete with the chosen entries"""
+            if partners is not None:
+                gains = [
+                    _popcount(partners[offset[col] + v] & chosen_mask) for v in range(radix[col])
+                ]
+                slots = []
+            else:
+                gains = [0] * radix[col]
+                # Slot of each partial tuple with ``col`` at value 0, plus its stride
+                slots = []
+                for partial in itertools.combinations(chosen, t - 1):
+                    g, base = self.tuple_slot(sorted(partial + ((col, 0),)))
+                    slots.append((g, base, self.strides[g][self.groups[g].index(col)]))
+            for g in self.extra_groups:
+                cols = self.groups[g]
+                if col in cols and all(row[c] >= 0 for c in cols if c != col):
+                    _, base = self.tuple_slot([(c, 0 if c == col else row[c]) for c in cols])
+                    slots.append((g, base, self.strides[g][cols.index(col)]))
+            if slots:
+                for v in range(radix[col]):
+                    gains[v] += sum((uncovered[g] >> (base + v * stride)) & 1 for g, base, stride in slots)
+            return gains
+
+        def construct(start: List[Tuple[int, int]]) -> Tuple[int, List[int], int]:
+            """Complete a partial row greedily; returns (gain, row, values scored)"""
+            row = [-1] * p_count
+            chosen = []
+            chosen_mask = 0
+            total = scored = 0
+            order = [c for c in range(p_count) if all(c != s for s, _ in start)]
+            rng.shuffle(order)
+            for c, code in start:
+                # Seeding entries count the tuples they complete among themselves
+                total += value_gains(row, c, chosen, chosen_mask)[code]
+                row[c] = code
+                chosen.append((c, code))
+                chosen_mask |= 1 << (offset[c] + code)
+            for c in order:
+                gains = value_gains(row, c, chosen, chosen_mask)
+                scored += len(gains)
+                values = list(range(radix[c]))
+                rng.shuffle(values)
+                values.sort(key=lambda v: -gains[v])
+                for v in values:
+                    row[c] = v
+                    if constraints is None or c not in constraints.column_set \
+                            or constraints.complete(row) is not None:
+                        break
+                total += gains[row[c]]
+                chosen.append((c, row[c]))
+                chosen_mask |= 1 << (offset[c] + row[c])
+            return total, row, scored
+
+        rows: List[Tuple[int, ...]] = []
+        while self.uncovered_count:
+            covered_before = self.covered_count
+            most = max(open_count)
+            starts = [e for e, count in enumerate(open_count) if count == most]
+            best_gain, best_row, scored = -1, None, 0
+            for _ in range(candidates):
+                gain, row, row_scored = construct([entry_of[rng.choice(starts)]])
+                scored += row_scored
+                if gain > best_gain:
+                    best_gain, best_row = gain, row
+            if best_gain <= 0:
+                # Greedy completion can miss t > 2 tuples; seed with a whole uncovered tuple
+                _, best_row, row_scored = construct(list(next(self.uncovered_tuples())))
+                scored += row_scored
+            row = tuple(best_row)
+            for assignment in self.cover(row):
+                for c, code in assignment:
+                    open_count[offset[c] + code] -= 1
+                if partners is not None and len(assignment) == 2:
+                    (i, a), (j, b) = assignment
+                    partners[offset[i] + a] &= ~(1 << (offset[j] + b))
+                    partners[offset[j] + b] &= ~(1 << (offset[i] + a))
+            rows.append(row)
+            if instrumentation is not None:
+                instrumentation.step(self.covered_count - covered_before, scored)
+        return rows
+
+
+class PlanOptimizer:
+    """
+    Post-pass that shrinks a covering plan without losing any covered t-tuple.
+
+    The target is the set of t-tuples the plan covers when the optimizer is
+    created; per-tuple hit counts track how many rows cover each of them.
+    Rows whose tuples are all covered elsewhere are dropped first. Then,
+    until the deadline, the optimizer deletes the least useful row and runs
+    simulated annealing over row values - each move copies an orphaned tuple
+    into a row - until every target tuple is covered again. An attempt that
+    runs out of moves or time is rolled back, so the result always covers
+    the full target. The first ``fixed`` rows are never removed or changed.
+    """
+
+    def __init__(
+        self,
+        engine: CoverageEngine,
+        rows: List[Tuple[int, ...]],
+        fixed: int = 0,
+        seed: int = 0
+    ):
+        """
+        Count the plan's coverage.
+
+        Args:
+            engine: Engine providing the encoding and the compiled constraints
+            rows: Encoded plan rows
+            fixed: Number of leading rows to keep unchanged
+            seed: Seed for the annealing moves
+        """
+        self.engine = engine
+        self.rows = [list(row) for row in rows]
+        self.origin = list(range(len(rows)))
+        self.fixed = fixed
+        self.rng = random.Random(seed)
+        self.constraints = (
+            engine.constraints if engine.constraints and engine.constraints.forbidden else None
+        )
+
+        sizes = [
+            engine.strides[g][0] * engine.radix[cols[0]] for g, cols in enumerate(engine.groups)
+        ]
+        self.counts = [[0] * size for size in sizes]
+        for row in self.rows:
+            for g, bit, _ in engine._row_tuples(row):
+                self.counts[g][bit] += 1
+        self.target = [
+            _pack_bits((bit for bit, hits in enumerate(counts) if hits), len(counts))
+            for counts in self.counts
+        ]
+        self.orphans: Set[Tuple[int, int]] = set()
+
+    def _is_target(self, g: int, bit: int) -> bool:
+        return bool((self.target[g] >> bit) & 1)
+
+    def _unique(self, row: List[int]) -> int:
+        """Number of target tuples only this row covers"""
+        return sum(
+            1 for g, bit, _ in self.engine._row_tuples(row)
+            if self.counts[g][bit] == 1 and self._is_target(g, bit)
+        )
+
+    def _drop(self, r: int) -> List[int]:
+        row = self.rows.pop(r)
+        self.origin.pop(r)
+        for g, bit, _ in self.engine._row_tuples(row):
+            self.counts[g][bit] -= 1
+            if not self.counts[g][bit] and self._is_target(g, bit):
+                self.orphans.add((g, bit))
+        return row
+
+    def _restore(self, r: int, row: List[int], origin: int):
+        self.rows.insert(r, row)
+        self.origin.insert(r, origin)
+        for g, bit, _ in self.engine._row_tuples(row):
+            if not self.counts[g][bit]:
+                self.orphans.discard((g, bit))
+            self.counts[g][bit] += 1
+
+    def _set(self, r: int, c: int, value: int) -> int:
+        """Change one cell; returns the change in the number of orphaned tuples"""
+        row = self.rows[r]
+        delta = 0
+        for g, bit, _ in self.engine._row_tuples(row, c):
+            self.counts[g][bit] -= 1
+            if not self.counts[g][bit] and self._is_target(g, bit):
+                self.orphans.add((g, bit))
+                delta += 1
+        row[c] = value
+        for g, bit, _ in self.engine._row_tuples(row, c):
+            if not self.counts[g][bit] and self._is_target(g, bit):
+                self.orphans.discard((g, bit))
+                delta -= 1
+            self.counts[g][bit] += 1
+        return delta
+
+    def eliminate_redundant(self) -> int:
+        """Drop rows whose target tuples are all covered by other rows; returns rows dropped"""
+        dropped = 0
+        for r in range(len(self.rows) - 1, self.fixed - 1, -1):
+            if self._unique(self.rows[r]) == 0:
+                self._drop(r)
+                dropped += 1
+        return dropped
+
+    def anneal(self, deadline: float, max_moves: Optional[int] = None) -> int:
+        """
+        Remove rows one at a time, repairing coverage by simulated annealing.
+
+        Args:
+            deadline: ``time.monotonic()`` value at which to stop
+            max_moves: Moves allowed per removal attempt (scales with plan size by default)
+
+        Returns:
+            Number of rows removed
+        """
+        removed = 0
+        tried: Set[int] = set()
+        while time.monotonic() < deadline:
+            movable = [r for r in range(self.fixed, len(self.rows)) if self.origin[r] not in tried]
+            if not movable:
+                break
+            r = min(movable, key=lambda k: (self._unique(self.rows[k]), -k))
+            origin = self.origin[r]
+            row = self._drop(r)
+            journal: List[Tuple[int, int, int]] = []
+            if self._repair(deadline, journal, max_moves or 2000 + 100 * len(self.rows)):
+                removed += 1
+                removed += self.eliminate_redundant()
+                tried.clear()
+            else:
+                for k, c, value in reversed(journal):
+                    self._set(k, c, value)
+                self._restore(r, row, origin)
+                tried.add(origin)
+        return removed
+
+    def _repair(self, deadline: float, journal: List[Tuple[int, int, int]], max_moves: int) -> bool:
+        """Anneal row values until no target tuple is orphaned; accepted moves go to ``journal``"""
+        if len(self.rows) <= self.fixed:
+            return not self.orphans
+        temperature = 1.0
+        for move in range(max_moves):
+            if not self.orphans:
+                return True
+            if move % 256 == 0 and time.monotonic() >= deadline:
+                return False
+            g, bit = self.rng.choice(sorted(self.orphans))
+            k = self.rng.randrange(self.fixed, len(self.rows))
+            row = self.rows[k]
+            changes = [
+                (c, row[c], code) for c, code in self.engine.decode_slot(g, bit) if row[c] != code
+            ]
+            delta = sum(self._set(k, c, code) for c, _, code in changes)
+            if self.constraints is not None and self.constraints.violates(row):
+                accept = False
+            else:
+                accept = delta <= 0 or self.rng.random() < math.exp(-delta / temperature)
+            if accept:
+                journal.extend((k, c, old) for c, old, _ in changes)
+            else:
+                for c, old, _ in reversed(changes):
+                    self._set(k, c, old)
+            temperature = max(0.05, temperature * 0.999)
+        return not self.orphans
+
+
+# Engine and candidates shared by the restart passes of one pool (see _init_restarts)
+_restart_state: Optional[Tuple] = None
+
+
+def _init_restarts(*state):
+    """Pool initializer: receive the engine and candidates once per worker process"""
+    global _restart_state
+    _restart_state = state
+
+
+def _restart_pass(seed: int, state: Optional[Tuple] = None) -> Tuple[int, List[int], int]:
+    """
+    One greedy pass with ties broken by a seeded random candidate order.
+
+    Seed 0 keeps the input order, so it reproduces the deterministic pass.
+
+    Args:
+        seed: Tie-break seed
+        state: (engine, candidates, entries, max_rows, selector); defaults to
+            the state received by the pool initializer
+
+    Returns:
+        Tuple of (tuples covered, selected candidate indices, candidates scored)
+    """
+    engine, candidates, entries, max_rows, selector = state or _restart_state
+    engine = engine.copy()
+    order = list(range(len(candidates)))
+    if seed:
+        random.Random(seed).shuffle(order)
+    counters = Instrumentation()
+    select = engine.lazy_select if selector == 'lazy' else engine.greedy_select
+    selected = select(
+        [candidates[r] for r in order], max_rows=max_rows, instrumentation=counters,
+        entries=[entries[r] for r in order] if entries is not None else None
+    )
+    return engine.covered_count, [order[r] for r in selected], counters.candidates_scored
+
+
+class CombinatorialTestGenerator:
+    """
+    Production-ready combinatorial test plan generator with t-way coverage.
+
+    This implementation uses a greedy algorithm to select test cases that maximize
+    t-way (pairwise by default) coverage, plus IPOG and AETG constructors for
+    generating plans for large parameter models.
+    """
+
+    def __init__(
+        self,
+        mode: str = 'select',
+        verbose: bool = False,
+        algorithm: str = 'greedy',
+        strength: int = 2,
+        selector: str = 'lazy',
+        constraints: Optional[ConstraintSet] = None,
+        workers: int = 1,
+        time_budget: float = 0.0,
+        progress: bool = True,
+        output_formats: Iterable[str] = ('md',),
+        instrumentation: Optional[Instrumentation] = None,
+        restarts: int = 1,
+        seed: int = 0,
+        strength_groups: Optional[List[StrengthGroup]] = None,
+        candidates: int = 50,
+        constructions: bool = True
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            mode: 'select' to choose from existing variants, 'generate' to create new ones
+            verbose: Enable detailed logging
+            algorithm: Generate-mode construction: 'greedy' (scans the full
+                Cartesian product), 'ipog' (in-parameter-order, memory bounded)
+                or 'aetg' (best of ``candidates`` random rows, memory bounded)
+            strength: Interaction strength t to cover (2 = pairwise, 3 = 3-way, ...)
+            selector: Greedy selection strategy: 'lazy' (CELF priority queue) or
+                'incremental' (row-bitset gain updates); both pick the same rows
+            constraints: Forbidden combinations that no planned row may contain
+            workers: Processes scoring greedy candidates (0 = one per CPU);
+                the selected plan does not depend on it
+            time_budget: Seconds for the plan-shrinking post-pass (0 = skip it)
+            progress: Show progress (off in pool workers); without an explicit
+                ``instrumentation`` this picks ProgressInstrumentation over the
+                counter-only Instrumentation
+            instrumentation: Hooks the selection and construction loops report to
+            restarts: Greedy passes with randomized tie-breaks; the smallest plan
+                with the most coverage is kept (runs on ``workers`` processes)
+            seed: Tie-break seed of the first pass; pass k uses ``seed + k``,
+                and seed 0 keeps the input order
+            output_formats: Plan files to write: 'md' (report), 'json' and 'csv'
+                (machine-readable sidecars next to the report)
+            strength_groups: Parameter sub-groups to cover at a higher strength
+                than ``strength`` (variable-strength coverage)
+            candidates: Random candidate rows built per plan row by 'aetg'
+            constructions: In generate mode, try the known covering-array
+                constructions (see ``covering_array``) before ``algorithm``
+        """
+        if strength < 2:
+            raise ValueError(f"Interaction strength must be at least 2, got {strength}")
+        if restarts < 1 or seed < 0:
+            raise ValueError("Restarts must be at least 1 and the seed non-negative")
+        if candidates < 1:
+            raise ValueError(f"Candidates per row must be at least 1, got {candidates}")
+        output_formats = tuple(output_formats)
+        unknown = [fmt for fmt in output_formats if fmt not in OUTPUT_FORMATS]
+        if unknown or not output_formats:
+            raise ValueError(
+                f"Output formats must be among {', '.join(OUTPUT_FORMATS)}, got {', '.join(unknown) or 'none'}"
+            )
+
+        self.mode = mode
+        self.algorithm = algorithm
+        self.selector = selector
+        self.constraints = constraints
+        self.strength = strength
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.time_budget = time_budget
+        self.progress = progress
+        self.instrumentation = instrumentation or (
+            ProgressInstrumentation() if progress else Instrumentation()
+        )
+        self.output_formats = output_formats
+        self.restarts = restarts
+        self.seed = seed
+        self.strength_groups = list(strength_groups or [])
+        self.candidates = candidates
+        self.constructions = constructions
+        # Seed of the pass kept by the last greedy selection
+        self.chosen_seed = seed
+        self.verbose = verbose
+        self._setup_logging()
+
+    def _setup_logging(self):
+        """Configure logging with appropriate level"""
+        level = logging.DEBUG if self.verbose else logging.INFO
+        logging.basicConfig(
+            level=level,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        self.logger = logging.getLogger(__name__)
+
+    def validate_input_file(self, input_file: str) -> bool:
+        """
+        Validate the input CSV file exists and is readable.
+
+        Args:
+            input_file: Path to the input CSV file
+
+        Returns:
+            True if valid, raises exception otherwise
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If file isn't readable
+            ValueError: If file is empty or invalid
+        """
+        path = Path(input_file)
+
+        if not path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_file}")
+
+        if not path.is_file():
+            raise ValueError(f"Path is not a file: {input_file}")
+
+        if not os.access(path, os.R_OK):
+            raise PermissionError(f"Cannot read file: {input_file}")
+
+        if path.stat().st_size == 0:
+            raise ValueError(f"Input file is empty: {input_file}")
+
+        self.logger.info(f"✓ Input file validated: {input_file}")
+        return True
+
+    def read_csv_with_validation(self, input_file: str) -> Tuple[List[str], List[List[str]]]:
+        """
+        Read and validate CSV file structure.
+
+        Args:
+            input_file: Path to the CSV file
+
+        Returns:
+            Tuple of (headers, rows)
+
+        Raises:
+            ValueError: If CSV is malformed
+        """
+        if Path(input_file).suffix.lower() == '.json':
+            headers = read_variant_columns(Path(input_file))
+            rows = list(self._iter_factorized_rows(input_file, headers))
+            if not rows:
+                raise ValueError("CSV file has no data rows")
+            self.logger.info(f"✓ Loaded {len(rows)} rows with {len(headers)} columns")
+            return headers, rows
+
+        try:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                headers = next(reader)
+
+                if not headers:
+                    raise ValueError("CSV file has no headers")
+
+                rows = list(reader)
+
+                if not rows:
+                    raise ValueError("CSV file has no data rows")
+
+                # Validate row lengths
+                expected_cols = len(headers)
+                for i, row in enumerate(rows, start=2):  # Start at 2 (after header)
+                    if len(row) != expected_cols:
+                        self.logger.warning(
+                            f"Row {i} has {len(row)} columns, expected {expected_cols}. "
+                            f"Padding/truncating."
+                        )
+                        # Pad or truncate to match header length
+                        if len(row) < expected_cols:
+                            row.extend([''] * (expected_cols - len(row)))
+                        else:
+                            rows[i-2] = row[:expected_cols]
+
+                self.logger.info(f"✓ Loaded {len(rows)} rows with {len(headers)} columns")
+                return headers, rows
+
+        except csv.Error as e:
+            raise ValueError(f"CSV parsing error: {e}")
+        except UnicodeDecodeError as e:
+            raise ValueError(f"File encoding error (expected UTF-8): {e}")
+
+    @staticmethod
+    def _iter_factorized_rows(input_file: str, headers: List[str]) -> Iterator[List[str]]:
+        """Rows of a factorized variants manifest (variants.json), joined lazily"""
+        for record in iter_variant_records(Path(input_file)):
+            yield [record[h] for h in headers]
+
+    def iter_csv_chunks(
+        self,
+        input_file: str,
+        chunk_size: int = 10000
+    ) -> Iterator[Tuple[List[str], List[List[str]]]]:
+        """
+        Stream a CSV file in chunks of rows, without loading it whole.
+
+        Args:
+            input_file: Path to the CSV file
+            chunk_size: Rows per chunk
+
+        Yields:
+            (headers, rows) with every row padded/truncated to the header length
+
+        Raises:
+            ValueError: If CSV is malformed
+        """
+        try:
+            with open(input_file, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                headers = next(reader, None)
+                if not headers:
+                    raise ValueError("CSV file has no headers")
+
+                expected_cols = len(headers)
+                chunk = []
+                for row in reader:
+                    if len(row) != expected_cols:
+                        row = (row + [''] * expected_cols)[:expected_cols]
+                    chunk.append(row)
+                    if len(chunk) >= chunk_size:
+                        yield headers, chunk
+                        chunk = []
+                if chunk:
+                    yield headers, chunk
+
+        except csv.Error as e:
+            raise ValueError(f"CSV parsing error: {e}")
+        except UnicodeDecodeError as e:
+            raise ValueError(f"File encoding error (expected UTF-8): {e}")
+
+    def encode_rows(
+        self,
+        headers: List[str],
+        rows: Iterable[List[str]],
+        variant_id_col: str = 'Variant_ID'
+    ) -> EncodedTable:
+        """
+        Dictionary-encode variant rows column by column in a single pass.
+
+        Rows are transposed in chunks and each column is encoded with one
+        dict lookup per cell; a distinct cell string is stripped and checked
+        for N/A only the first time it appears. N/A cells become -1.
+
+        Args:
+            headers: CSV headers
+            rows: Data rows; read once, so a streaming iterator works too
+            variant_id_col: Name of the variant ID column
+
+        Returns:
+            EncodedTable with one code column per parameter
+        """
+        if variant_id_col in headers:
+            id_col = headers.index(variant_id_col)
+            exclude = [variant_id_col]
+        else:
+            self.logger.warning(f"Column '{variant_id_col}' not found, using row numbers")
+            id_col = None
+            exclude = ['Variant_ID', 'Test_Case_ID']
+        param_cols = [i for i, header in enumerate(headers) if header not in exclude]
+
+        # Per column: raw cell -> provisional code, and stripped value -> provisional code
+        lookups: List[Dict[str, int]] = [{} for _ in param_cols]
+        seen: List[Dict[str, int]] = [{} for _ in param_cols]
+        columns: List[List[int]] = [[] for _ in param_cols]
+        variant_ids = [] if id_col is not None else None
+        width = len(headers)
+        row_count = 0
+        rows = iter(rows)
+        while True:
+            chunk = [
+                row if len(row) == width else (row + [''] * width)[:width]
+                for row in itertools.islice(rows, 2000)
+            ]
+            if not chunk:
+                break
+            row_count += len(chunk)
+            transposed = list(zip(*chunk))
+            if variant_ids is not None:
+                variant_ids.extend(transposed[id_col])
+            for k, i in enumerate(param_cols):
+                lookup = lookups[k]
+                codes = list(map(lookup.get, transposed[i]))
+                if None in codes:
+                    for raw in set(transposed[i]).difference(lookup):
+                        value = raw.strip()
+                        if not value or value.upper() in NA_VALUES:
+                            lookup[raw] = -1
+                        else:
+                            lookup[raw] = seen[k].setdefault(value, len(seen[k]))
+                    codes = list(map(lookup.__getitem__, transposed[i]))
+                columns[k].extend(codes)
+
+        if not row_count:
+            raise ValueError("CSV file has no data rows")
+
+        headers_out, values_out, columns_out = [], [], []
+        for k, i in enumerate(param_cols):
+            if not seen[k]:
+                self.logger.warning(f"Parameter '{headers[i]}' has no valid values, skipping")
+                continue
+            # Renumber so codes follow sorted value order
+            ordered = sorted(seen[k])
+            rank = {v: c for c, v in enumerate(ordered)}
+            # Trailing -1 so that N/A (index -1) maps to itself
+            remap = [rank[v] for v in seen[k]] + [-1]
+            headers_out.append(headers[i])
+            values_out.append(ordered)
+            columns_out.append(array('i', map(remap.__getitem__, columns[k])))
+            self.logger.debug(f"Parameter '{headers[i]}': {len(ordered)} unique values")
+
+        if not headers_out:
+            raise ValueError("No valid parameters extracted from CSV")
+
+        self.logger.info(f"✓ Extracted {len(headers_out)} parameters")
+        return EncodedTable(headers_out, values_out, columns_out, variant_ids)
+
+    def load_encoded_csv(
+        self,
+        input_file: str,
+        variant_id_col: str = 'Variant_ID'
+    ) -> EncodedTable:
+        """
+        Read a variants CSV straight into per-column integer codes.
+
+        Rows are streamed from the file and never held as strings, so memory
+        is four bytes per cell plus one copy of each distinct value. A
+        factorized manifest (variants.json) is streamed as its joined rows.
+
+        Args:
+            input_file: Path to the CSV file or factorized manifest
+            variant_id_col: Name of the variant ID column
+
+        Returns:
+            EncodedTable of the file
+
+        Raises:
+            ValueError: If CSV is malformed or has no data rows
+        """
+        if Path(input_file).suffix.lower() == '.json':
+            headers = read_variant_columns(Path(input_file))
+            table = self.encode_rows(
+                headers, self._iter_factorized_rows(input_file, headers), variant_id_col
+            )
+            self.logger.info(f"✓ Loaded {len(table)} rows with {len(headers)} columns")
+            return table
+
+        try:
+            with open(input_file, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                headers = next(reader, None)
+                if not headers:
+                    raise ValueError("CSV file has no headers")
+                expected_cols = len(headers)
+
+                def checked_rows():
+                    for i, row in enumerate(reader, start=2):  # Start at 2 (after header)
+                        if len(row) != expected_cols:
+                            self.logger.warning(
+                                f"Row {i} has {len(row)} columns, expected {expected_cols}. "
+                                f"Padding/truncating."
+                            )
+                        yield row
+
+                table = self.encode_rows(headers, checked_rows(), variant_id_col)
+
+        except csv.Error as e:
+            raise ValueError(f"CSV parsing error: {e}")
+        except UnicodeDecodeError as e:
+            raise ValueError(f"File encoding error (expected UTF-8): {e}")
+
+        self.logger.info(f"✓ Loaded {len(table)} rows with {len(headers)} columns")
+        return table
+
+    def load_existing_plan(self, plan_file: str) -> ExistingPlan:
+        """
+        Load the rows of an existing plan to augment.
+
+        Accepts a markdown report written by this script (the "Test Cases"
+        table), its JSON sidecar, or a variants-format CSV (optional
+        Variant_ID column plus parameter columns).
+
+        Args:
+            plan_file: Path to combinatorial_plan.md, combinatorial_plan.json or
+                a CSV of plan rows
+
+        Returns:
+            ExistingPlan with the plan's headers and rows
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If no plan table can be found
+        """
+        self.validate_input_file(plan_file)
+        suffix = Path(plan_file).suffix.lower()
+
+        if suffix == '.json':
+            with open(plan_file, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+            if not isinstance(document, dict) or not {'rows', 'parameters'} <= document.keys():
+                raise ValueError(f"No plan rows and parameters found in plan: {plan_file}")
+            plan = ExistingPlan(document['parameters'], [tuple(row) for row in document['rows']],
+                                document.get('variant_ids'), plan_file)
+        elif suffix == '.csv':
+            headers, rows = self.read_csv_with_validation(plan_file)
+            variant_ids = None
+            if 'Variant_ID' in headers:
+                id_idx = headers.index('Variant_ID')
+                variant_ids = [row[id_idx] for row in rows]
+                rows = [row[:id_idx] + row[id_idx + 1:] for row in rows]
+                headers = headers[:id_idx] + headers[id_idx + 1:]
+            plan = ExistingPlan(headers, [tuple(v.strip() or 'N/A' for v in row) for row in rows],
+                                variant_ids, plan_file)
+        else:
+            headers, rows, variant_ids = None, [], []
+            with open(plan_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if headers is None:
+                        if line.startswith('| Test Case |'):
+                            headers = [c.strip() for c in line.strip('|').split('|')][1:]
+                        continue
+                    if not line.startswith('|'):
+                        if rows:
+                            break
+                        continue
+                    cells = [c.strip() for c in line.strip('|').split('|')][1:]
+                    if not cells or set(cells[0]) <= set('-'):
+                        continue
+                    rows.append(cells)
+
+            if headers is None:
+                raise ValueError(f"No test case table found in plan: {plan_file}")
+
+            has_ids = headers and headers[0] == 'Variant ID'
+            if has_ids:
+                headers = headers[1:]
+                variant_ids = [cells[0] for cells in rows]
+                rows = [cells[1:] for cells in rows]
+            plan = ExistingPlan(headers, [tuple(cells) for cells in rows],
+                                variant_ids if has_ids else None, plan_file)
+
+        self.logger.info(f"✓ Loaded existing plan with {len(plan.rows)} rows: {plan_file}")
+        return plan
+
+    def extract_parameters(
+        self,
+        headers: List[str],
+        rows: Iterable[List[str]],
+        exclude_columns: Optional[List[str]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Extract parameter values from CSV, filtering N/A and handling constraints.
+
+        Args:
+            headers: Column headers
+            rows: Data rows; read once, so a streaming iterator works too
+            exclude_columns: Columns to exclude (e.g., 'Variant_ID')
+
+        Returns:
+            Dictionary mapping parameter names to their possible values
+        """
+        exclude_columns = exclude_columns or ['Variant_ID', 'Test_Case_ID']
+        params = {}
+
+        # Unique values per column, excluding empty strings and N/A
+        seen = [set() for _ in headers]
+        for row in rows:
+            for i, value in enumerate(row[:len(headers)]):
+                seen[i].add(value.strip())
+
+        for i, header in enumerate(headers):
+            if header in exclude_columns:
+                self.logger.debug(f"Skipping column: {header}")
+                continue
+
+            # Only include non-empty, non-N/A values
+            unique_values = sorted(
+                value for value in seen[i] if value and value.upper() not in NA_VALUES
+            )
+
+            if not unique_values:
+                self.logger.warning(f"Parameter '{header}' has no valid values, skipping")
+                continue
+
+            params[header] = unique_values
+            self.logger.debug(f"Parameter '{header}': {len(unique_values)} unique values")
+
+        if not params:
+            raise ValueError("No valid parameters extracted from CSV")
+
+        self.logger.info(f"✓ Extracted {len(params)} parameters")
+        return params
+
+    def calculate_total_pairs(self, params: Dict[str, List[str]], strength: int = 2) -> int:
+        """Calculate total number of parameter t-tuples (pairs by default) to cover"""
+        total = 0
+        for group in itertools.combinations(params.values(), strength):
+            size = 1
+            for values in group:
+                size *= len(values)
+            total += size
+
+        return total
+
+    def _effective_strength(self, param_count: int) -> int:
+        """Clamp the requested strength to the number of parameters available"""
+        if 2 <= param_count < self.strength:
+            self.logger.warning(
+                f"Only {param_count} parameters available, "
+                f"reducing strength from {self.strength} to {param_count}"
+            )
+            return param_count
+        return self.strength
+
+    def _coverage_engine(
+        self,
+        headers: List[str],
+        params: Dict[str, List[str]],
+        strength: int,
+        report: bool = False
+    ) -> CoverageEngine:
+        """
+        Build the coverage engine of a model, with the strength groups that apply to it.
+
+        Args:
+            headers: Parameter names, in row column order
+            params: Dictionary of parameter names to possible values
+            strength: Base interaction strength
+            report: Log which strength groups apply (once per plan)
+
+        Returns:
+            CoverageEngine with one extra group per higher-strength column group
+        """
+        extra = []
+        for group in self.strength_groups:
+            present = [p for p in group.parameters if p in headers]
+            column_groups = group.column_groups(headers) if group.strength > strength else []
+            extra.extend(column_groups)
+            if not report:
+                continue
+            if group.strength <= strength:
+                self.logger.warning(
+                    f"Strength group ({group.label()}): already covered at strength {strength}"
+                )
+            elif not column_groups:
+                # Common with batch and partitioned runs: the group belongs to other models
+                self.logger.debug(f"Strength group ({group.label()}): not in this model")
+            else:
+                missing = [p for p in group.parameters if p not in present]
+                self.logger.info(
+                    f"Strength group ({group.label()}): "
+                    f"{strength_label(group.strength).lower()} coverage"
+                    + (f" (not in the model: {', '.join(missing)})" if missing else "")
+                )
+        return CoverageEngine(headers, params, strength=strength, extra_groups=extra)
+
+    def build_coverage_stats(
+        self,
+        headers: List[str],
+        params: Dict[str, List[str]],
+        test_cases: List[Tuple],
+        strength: Optional[int] = None,
+        candidates: Optional[List[Tuple]] = None
+    ) -> CoverageStats:
+        """
+        Measure a plan's coverage at every strength from 2 up to ``strength``.
+
+        Args:
+            headers: Parameter names, in test case column order
+            params: Dictionary of parameter names to possible values
+            test_cases: Plan rows as tuples of string values (N/A allowed)
+            strength: Target strength (defaults to the generator's strength)
+            candidates: Rows the plan was selected from; with constraints,
+                tuples only found in invalid candidates are excluded
+
+        Returns:
+            CoverageStats for the target strength, with the per-strength breakdown
+        """
+        strength = strength or max(2, min(self.strength, len(headers)))
+        breakdown = {}
+        excluded = 0
+        covered = total = 0
+        groups = []
+        for t in range(2, max(strength, 2) + 1):
+            if t > len(headers):
+                break
+            if t == strength:
+                engine = self._coverage_engine(headers, params, t)
+            else:
+                engine = CoverageEngine(headers, params, strength=t)
+            if self.constraints:
+                encoded = [engine.encode_row(c) for c in candidates] if candidates else None
+                engine.apply_constraints(self.constraints, encoded)
+            target = list(engine.uncovered)
+            for test_case in test_cases:
+                engine.cover(engine.encode_row(test_case))
+            breakdown[t] = engine.coverage_of(range(engine.base_group_count), target)
+            covered, total = engine.covered_count, engine.total_pairs
+            excluded = engine.excluded_count
+            groups = self._strength_group_breakdown(engine, target) if t == strength else []
+
+        return CoverageStats(
+            total_pairs=total,
+            covered_pairs=covered,
+            uncovered_pairs=total - covered,
+            coverage_percentage=(covered / total * 100) if total > 0 else 0,
+            test_cases_generated=len(test_cases),
+            strength=strength,
+            excluded_pairs=excluded,
+            strength_breakdown=breakdown,
+            strength_groups=groups
+        )
+
+    def _strength_group_breakdown(
+        self,
+        engine: CoverageEngine,
+        target: List[int]
+    ) -> List[Tuple[str, int, int, int]]:
+        """(parameters, strength, covered, total) of each strength group the engine applies"""
+        breakdown = []
+        for group in self.strength_groups:
+            if group.strength <= engine.strength:
+                continue
+            column_groups = group.column_groups(engine.headers)
+            if column_groups:
+                covered, total = engine.coverage_of(
+                    [engine.group_of[cols] for cols in column_groups], target
+                )
+                breakdown.append((group.label(), group.strength, covered, total))
+        return breakdown
+
+    def analyze_coverage(
+        self,
+        input_file: str,
+        universe_file: Optional[str] = None,
+        chunk_size: int = 10000
+    ) -> CoverageAnalysis:
+        """
+        Measure the t-way coverage of an existing test set.
+
+        The test set is streamed in chunks and encoded column-wise into the
+        coverage bitmaps, so memory depends on the parameter space and the
+        chunk size, never on the number of rows.
+
+        Args:
+            input_file: Variants-format CSV of the tests to measure
+            universe_file: Variants-format CSV defining the parameter space
+                (defaults to the values found in ``input_file`` itself)
+            chunk_size: Rows encoded per batch
+
+        Returns:
+            CoverageAnalysis with stats, per-group breakdown and uncovered tuples
+        """
+        universe_file = universe_file or input_file
+        universe_headers = None
+        for universe_headers, _ in self.iter_csv_chunks(universe_file, chunk_size):
+            break
+        if universe_headers is None:
+            raise ValueError(f"CSV file has no data rows: {universe_file}")
+        params = self.extract_parameters(
+            universe_headers,
+            (row for _, chunk in self.iter_csv_chunks(universe_file, chunk_size) for row in chunk)
+        )
+        param_headers = list(params.keys())
+        strength = self._effective_strength(len(param_headers))
+        if len(param_headers) < 2:
+            raise ValueError("At least two parameters are needed to measure coverage")
+
+        engines = [
+            CoverageEngine(param_headers, params, strength=t) for t in range(2, strength)
+        ] + [self._coverage_engine(param_headers, params, strength, report=True)]
+        for engine in engines:
+            if self.constraints:
+                engine.apply_constraints(self.constraints)
+        engine = engines[-1]
+        target = list(engine.uncovered)
+
+        unknown: Dict[str, Set[str]] = {}
+        rows_analyzed = 0
+        for headers, chunk in self.iter_csv_chunks(input_file, chunk_size):
+            index = {h: i for i, h in enumerate(headers)}
+            raw_columns = list(zip(*chunk))
+            columns = []
+            for c, header in enumerate(param_headers):
+                if header not in index:
+                    columns.append([-1] * len(chunk))
+                    continue
+                codes = engine.codes[c]
+                raw = [value.strip() for value in raw_columns[index[header]]]
+                columns.append([codes.get(value, -1) for value in raw])
+                strays = {
+                    v for v in set(raw) if v not in codes and v.upper() not in NA_VALUES
+                }
+                if strays:
+                    # Keep a bounded sample; ID-like columns can have a value per row
+                    sample = unknown.setdefault(header, set())
+                    sample.update(sorted(strays - sample)[:max(0, 20 - len(sample))])
+            for t_engine in engines:
+                t_engine.cover_columns(columns)
+            rows_analyzed += len(chunk)
+            self.logger.debug(f"Analyzed {rows_analyzed:,} rows")
+
+        if not rows_analyzed:
+            raise ValueError("CSV file has no data rows")
+        for header, values in unknown.items():
+            self.logger.warning(
+                f"Parameter '{header}': values outside the parameter space ignored "
+                f"(e.g. {', '.join(sorted(values)[:3])})"
+            )
+
+        breakdown = {
+            t_engine.strength: (t_engine.covered_count, t_engine.total_pairs)
+            for t_engine in engines[:-1]
+        }
+        breakdown[strength] = engine.coverage_of(range(engine.base_group_count), target)
+        covered, total = engine.covered_count, engine.total_pairs
+        stats = CoverageStats(
+            total_pairs=total,
+            covered_pairs=covered,
+            uncovered_pairs=total - covered,
+            coverage_percentage=(covered / total * 100) if total > 0 else 0,
+            test_cases_generated=rows_analyzed,
+            strength=strength,
+            excluded_pairs=engine.excluded_count,
+            strength_breakdown=breakdown,
+            strength_groups=self._strength_group_breakdown(engine, target)
+        )
+
+        group_breakdown = []
+        for g, cols in enumerate(engine.groups):
+            group_total = bin(target[g]).count('1')
+            group_open = bin(engine.uncovered[g]).count('1')
+            group_breakdown.append(
+                (tuple(param_headers[c] for c in cols), group_total - group_open, group_total)
+            )
+        uncovered = [
+            tuple((param_headers[c], engine.values[c][code]) for c, code in assignment)
+            for assignment in engine.uncovered_tuples()
+        ]
+
+        self.logger.info(
+            f"✓ Analyzed {rows_analyzed:,} test cases: "
+            f"{stats.coverage_percentage:.1f}% {strength_label(strength).lower()} coverage"
+        )
+        return CoverageAnalysis(
+            stats=stats,
+            headers=param_headers,
+            group_breakdown=group_breakdown,
+            uncovered=uncovered,
+            unknown_values=unknown,
+            source=input_file,
+            universe=universe_file
+        )
+
+    def _greedy(
+        self,
+        engine: CoverageEngine,
+        candidates: List[Tuple[int, ...]],
+        max_rows: Optional[int] = None,
+        phase: str = "Selecting",
+        entries: Optional[List[List[Tuple[int, int]]]] = None
+    ) -> List[int]:
+        """Run the configured greedy selector over encoded (and optionally sparse) candidates"""
+        monitor = self.instrumentation
+        monitor.begin(phase, engine.total_pairs, engine.covered_count)
+        if self.restarts > 1 or self.seed:
+            selected = self._multi_start(engine, candidates, max_rows, entries)
+        elif self.workers > 1 and len(candidates) >= PARALLEL_MIN_CANDIDATES:
+            self.logger.info(f"Scoring {len(candidates):,} candidates on {self.workers} workers")
+            selected = engine.parallel_select(
+                candidates, self.workers, max_rows=max_rows, instrumentation=monitor
+            )
+        elif self.selector == 'lazy':
+            selected = engine.lazy_select(
+                candidates, max_rows=max_rows, instrumentation=monitor, entries=entries
+            )
+        else:
+            selected = engine.greedy_select(
+                candidates, max_rows=max_rows, instrumentation=monitor, entries=entries
+            )
+        monitor.end()
+        return selected
+
+    def _multi_start(
+        self,
+        engine: CoverageEngine,
+        candidates: List[Tuple[int, ...]],
+        max_rows: Optional[int],
+        entries: Optional[List[List[Tuple[int, int]]]]
+    ) -> List[int]:
+        """
+        Run ``restarts`` greedy passes with seeded random tie-breaks and keep the best.
+
+        Passes use seeds ``seed .. seed + restarts - 1`` and run on up to
+        ``workers`` processes. The kept pass covers the most tuples with the
+        fewest rows (lowest seed on a tie); its seed is stored in
+        ``chosen_seed`` so ``restarts=1, seed=chosen_seed`` reproduces it.
+        The whole multi-start counts as one instrumentation step.
+
+        Args:
+            engine: Coverage state before selection; updated with the kept pass
+            candidates: Encoded candidate rows
+            max_rows: Optional cap on the number of rows selected
+            entries: Sparse form of ``candidates``, if known
+
+        Returns:
+            Indices of the selected candidates, in selection order
+        """
+        seeds = [self.seed + k for k in range(self.restarts)]
+        state = (engine, candidates, entries, max_rows, self.selector)
+        jobs = min(self.workers, len(seeds))
+        if jobs > 1:
+            self.logger.info(f"Running {len(seeds)} greedy restarts on {jobs} workers")
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_restarts, initargs=state
+            ) as pool:
+                results = list(pool.map(_restart_pass, seeds))
+        else:
+            results = [_restart_pass(seed, state) for seed in seeds]
+
+        best = min(range(len(seeds)), key=lambda k: (-results[k][0], len(results[k][1]), k))
+        covered_before = engine.covered_count
+        selected = results[best][1]
+        for r in selected:
+            engine.cover(candidates[r])
+        self.chosen_seed = seeds[best]
+
+        sizes = [len(result[1]) for result in results]
+        if len(seeds) > 1:
+            self.logger.info(
+                f"✓ Restarts: plan sizes {min(sizes)}-{max(sizes)} "
+                f"(seed {seeds[0]}: {sizes[0]}), kept seed {self.chosen_seed}"
+            )
+        self.instrumentation.step(
+            engine.covered_count - covered_before, sum(result[2] for result in results),
+            len(selected)
+        )
+        return selected
+
+    def _cover_fixed_rows(
+        self,
+        engine: CoverageEngine,
+        fixed_rows: Optional[List[Tuple[str, ...]]]
+    ) -> List[Tuple[str, ...]]:
+        """Mark the tuples of an existing plan's rows as already covered"""
+        fixed_rows = list(fixed_rows or [])
+        for row in fixed_rows:
+            engine.cover(engine.encode_row(row))
+        if fixed_rows:
+            self.logger.info(
+                f"Existing plan: {len(fixed_rows)} fixed rows already cover "
+                f"{engine.covered_count:,} of {engine.total_pairs:,} tuples"
+            )
+        return fixed_rows
+
+    def optimize_plan(
+        self,
+        headers: List[str],
+        params: Dict[str, List[str]],
+        plan: List[Tuple[str, ...]],
+        fixed: int = 0,
+        search: bool = True
+    ) -> Tuple[List[Tuple[str, ...]], List[int]]:
+        """
+        Shrink a plan within the time budget without reducing its coverage.
+
+        Args:
+            headers: Parameter names, in plan column order
+            params: Dictionary of parameter names to possible values
+            plan: Plan rows as tuples of string values
+            fixed: Number of leading rows to keep unchanged (existing plan)
+            search: Also anneal row values; without it only redundant rows
+                are dropped and every kept row is an original row
+
+        Returns:
+            Tuple of (optimized_plan, index of each kept row in ``plan``)
+        """
+        engine = self._coverage_engine(headers, params, self._effective_strength(len(headers)))
+        if self.constraints:
+            engine.constraints = self.constraints.compile(engine)
+
+        deadline = time.monotonic() + self.time_budget
+        optimizer = PlanOptimizer(engine, [engine.encode_row(row) for row in plan], fixed=fixed)
+        dropped = optimizer.eliminate_redundant()
+        removed = optimizer.anneal(deadline) if search else 0
+
+        self.logger.info(
+            f"Post-optimization: {len(plan)} -> {len(optimizer.rows)} rows "
+            f"({dropped} redundant, {removed} removed by annealing)"
+        )
+        optimized = list(plan[:fixed]) + [
+            engine.decode_row(row) for row in optimizer.rows[fixed:]
+        ]
+        return optimized, optimizer.origin
+
+    def generate_pairwise_plan(
+        self,
+        params: Dict[str, List[str]],
+        max_iterations: Optional[int] = None,
+        fixed_rows: Optional[List[Tuple[str, ...]]] = None
+    ) -> Tuple[List[Tuple], int]:
+        """
+        Generate t-way test plan (pairwise by default) using greedy algorithm.
+
+        Args:
+            params: Dictionary of parameter names to possible values
+            max_iterations: Maximum iterations (safety limit)
+            fixed_rows: Rows of an existing plan to keep; only the rows needed
+                for the tuples they miss are generated
+
+        Returns:
+            Tuple of (selected_test_cases, covered_tuple_count); fixed rows come first
+        """
+        headers = list(params.keys())
+        strength = self._effective_strength(len(headers))
+        engine = self._coverage_engine(headers, params, strength, report=True)
+
+        # Generate all possible combinations (encoded, in product order)
+        full_product = list(itertools.product(*[range(k) for k in engine.radix]))
+        total_combinations = len(full_product)
+
+        self.logger.info(f"Total possible combinations: {total_combinations:,}")
+
+        if self.constraints:
+            engine.apply_constraints(self.constraints)
+            full_product = [full_product[r] for r in engine.valid_candidates(full_product)]
+            self.logger.info(
+                f"Constraints: {len(full_product):,} valid combinations, "
+                f"{engine.excluded_count:,} unreachable tuples excluded"
+            )
+
+        if not full_product:
+            raise ValueError("No combinations possible with given parameters")
+
+        total_pairs = engine.total_pairs
+        self.logger.info(f"Total {strength}-way tuples to cover: {total_pairs:,}")
+
+        fixed_rows = self._cover_fixed_rows(engine, fixed_rows)
+
+        selected = self._greedy(
+            engine, full_product, max_rows=max_iterations,
+            phase=f"Generating {strength_label(strength).lower()} plan"
+        )
+
+        if engine.uncovered_count:
+            self.logger.warning("No more tuples can be covered, stopping early")
+
+        pairwise_plan = fixed_rows + [engine.decode_row(full_product[r]) for r in selected]
+
+        coverage_pct = (engine.covered_count / total_pairs * 100) if total_pairs > 0 else 0
+        self.logger.info(
+            f"✓ Generated {len(selected)} new test cases ({len(pairwise_plan)} total) "
+            f"with {coverage_pct:.1f}% coverage"
+        )
+
+        return pairwise_plan, engine.covered_count
+
+    def generate_ipog_plan(
+        self,
+        params: Dict[str, List[str]],
+        fixed_rows: Optional[List[Tuple[str, ...]]] = None
+    ) -> Tuple[List[Tuple], int]:
+        """
+        Generate t-way test plan using in-parameter-order (IPOG) construction.
+
+        Unlike the greedy generator this never materializes the Cartesian
+        product, so it scales to models with dozens of parameters.
+
+        Args:
+            params: Dictionary of parameter names to possible values
+            fixed_rows: Rows of an existing plan to keep; only the rows needed
+                for the tuples they miss are generated
+
+        Returns:
+            Tuple of (selected_test_cases, covered_tuple_count); fixed rows come first
+        """
+        headers = list(params.keys())
+        strength = self._effective_strength(len(headers))
+        engine = self._coverage_engine(headers, params, strength, report=True)
+        if self.constraints:
+            engine.apply_constraints(self.constraints)
+            self.logger.info(f"Constraints: {engine.excluded_count:,} unreachable tuples excluded")
+
+        total_pairs = engine.total_pairs
+        self.logger.info(
+            f"Parameters: {len(headers)}, total {strength}-way tuples to cover: {total_pairs:,}"
+        )
+
+        fixed_rows = self._cover_fixed_rows(engine, fixed_rows)
+
+        self.instrumentation.begin("Building IPOG plan", total_pairs, engine.covered_count)
+        rows = engine.ipog_build(instrumentation=self.instrumentation)
+        self.instrumentation.end()
+
+        pairwise_plan = fixed_rows + [engine.decode_row(row) for row in rows]
+
+        coverage_pct = (engine.covered_count / total_pairs * 100) if total_pairs > 0 else 100.0
+        self.logger.info(
+            f"✓ Generated {len(rows)} new test cases ({len(pairwise_plan)} total) "
+            f"with {coverage_pct:.1f}% coverage"
+        )
+
+        return pairwise_plan, engine.covered_count
+
+    def generate_aetg_plan(
+        self,
+        params: Dict[str, List[str]],
+        fixed_rows: Optional[List[Tuple[str, ...]]] = None
+    ) -> Tuple[List[Tuple], int]:
+        """
+        Generate t-way test plan by AETG-style sampling.
+
+        Each row is the best of ``candidates`` randomly built rows, so the cost
+        per row does not depend on the size of the Cartesian product. With
+        ``restarts`` > 1, passes with seeds ``seed .. seed + restarts - 1`` run
+        one after another and the smallest plan is kept (its seed is stored in
+        ``chosen_seed``).
+
+        Args:
+            params: Dictionary of parameter names to possible values
+            fixed_rows: Rows of an existing plan to keep; only the rows needed
+                for the tuples they miss are generated
+
+        Returns:
+            Tuple of (selected_test_cases, covered_tuple_count); fixed rows come first
+        """
+        headers = list(params.keys())
+        strength = self._effective_strength(len(headers))
+        engine = self._coverage_engine(headers, params, strength, report=True)
+        if self.constraints:
+            engine.apply_constraints(self.constraints)
+            self.logger.info(f"Constraints: {engine.excluded_count:,} unreachable tuples excluded")
+
+        total_pairs = engine.total_pairs
+        self.logger.info(
+            f"Parameters: {len(headers)}, total {strength}-way tuples to cover: {total_pairs:,}, "
+            f"{self.candidates} candidates per row"
+        )
+
+        fixed_rows = self._cover_fixed_rows(engine, fixed_rows)
+
+        self.instrumentation.begin("Building AETG plan", total_pairs, engine.covered_count)
+        if self.restarts == 1:
+            rows = engine.aetg_build(self.candidates, self.seed, self.instrumentation)
+            self.chosen_seed = self.seed
+        else:
+            covered_before = engine.covered_count
+            passes = []
+            counters = Instrumentation()
+            for seed in range(self.seed, self.seed + self.restarts):
+                trial = engine.copy()
+                passes.append((trial.aetg_build(self.candidates, seed, counters), seed, trial))
+            sizes = [len(rows) for rows, _, _ in passes]
+            rows, self.chosen_seed, engine = min(passes, key=lambda item: (len(item[0]), item[1]))
+            self.logger.info(
+                f"✓ Restarts: plan sizes {min(sizes)}-{max(sizes)} "
+                f"(seed {self.seed}: {sizes[0]}), kept seed {self.chosen_seed}"
+            )
+            self.instrumentation.step(
+                engine.covered_count - covered_before, counters.candidates_scored, len(rows)
+            )
+        self.instrumentation.end()
+
+        pairwise_plan = fixed_rows + [engine.decode_row(row) for row in rows]
+
+        coverage_pct = (engine.covered_count / total_pairs * 100) if total_pairs > 0 else 100.0
+        self.logger.info(
+            f"✓ Generated {len(rows)} new test cases ({len(pairwise_plan)} total) "
+            f"with {coverage_pct:.1f}% coverage"
+        )
+
+        return pairwise_plan, engine.covered_count
+
+    def generate_plan(
+        self,
+        headers: List[str],
+        rows: List[List[str]],
+        existing: Optional[ExistingPlan] = None
+    ) -> Tuple[List[str], List[Tuple[str, ...]], CoverageStats]:
+        """
+        Generate a plan from the parameter values found in CSV rows.
+
+        Runs the configured algorithm, the optional post-optimization pass
+        and the coverage measurement.
+
+        Args:
+            headers: CSV headers
+            rows: CSV data rows
+            existing: Previously generated plan to keep and extend
+
+        Returns:
+            Tuple of (parameter_headers, plan_rows, coverage_stats)
+        """
+        params = self.extract_parameters(headers, rows)
+        param_headers = list(params.keys())
+        fixed_rows = existing.aligned(param_headers) if existing else None
+
+        construction = self.construct_plan(params) if fixed_rows is None else None
+        if construction is not None and construction[2]:
+            # Provably optimal: no algorithm can do better
+            name, pairwise_plan, _ = construction
+        else:
+            if self.algorithm == 'ipog':
+                if self.restarts > 1 or self.seed:
+                    self.logger.warning("IPOG construction is deterministic; --restarts/--seed ignored")
+                pairwise_plan, _ = self.generate_ipog_plan(params, fixed_rows)
+            elif self.algorithm == 'aetg':
+                pairwise_plan, _ = self.generate_aetg_plan(params, fixed_rows)
+            else:
+                pairwise_plan, _ = self.generate_pairwise_plan(params, fixed_rows=fixed_rows)
+            if construction is not None:
+                name, constructed, _ = construction
+                if len(constructed) <= len(pairwise_plan):
+                    self.logger.info(
+                        f"✓ Kept the construction ({name}) over the "
+                        f"{self.algorithm} plan ({len(pairwise_plan)} rows)"
+                    )
+                    pairwise_plan = constructed
+                else:
+                    construction = None
+
+        rows_before = 0
+        if self.time_budget > 0 and not (construction and construction[2]):
+            rows_before = len(pairwise_plan)
+            pairwise_plan, _ = self.optimize_plan(
+                param_headers, params, pairwise_plan, fixed=len(fixed_rows or [])
+            )
+
+        stats = self.build_coverage_stats(param_headers, params, pairwise_plan)
+        stats.fixed_test_cases = len(fixed_rows or [])
+        stats.rows_before_optimization = rows_before
+        if construction is not None:
+            stats.construction = construction[0]
+        elif self.algorithm != 'ipog':
+            stats.seed, stats.restarts = self.chosen_seed, self.restarts
+        return param_headers, pairwise_plan, stats
+
+    def construct_plan(
+        self,
+        params: Dict[str, List[str]]
+    ) -> Optional[Tuple[str, List[Tuple[str, ...]], bool]]:
+        """
+        Build a plan from a known covering-array construction, if one fits the model.
+
+        Models with constraints or applicable strength groups are left to the
+        algorithms. Rows made redundant by folding values are dropped.
+
+        Args:
+            params: Dictionary of parameter names to possible values
+
+        Returns:
+            Tuple of (construction, plan_rows, optimal) - optimal when the plan
+            has exactly as many rows as the product of the t largest value
+            counts - or None if constructions are off or none fits
+        """
+        headers = list(params.keys())
+        strength = self._effective_strength(len(headers))
+        if not self.constructions or self.constraints or len(headers) < 2:
+            return None
+        if any(
+            group.strength > strength and group.column_groups(headers)
+            for group in self.strength_groups
+        ):
+            return None
+        radix = [len(params[h]) for h in headers]
+        lower_bound = math.prod(sorted(radix, reverse=True)[:strength])
+
+        # Only near-optimal arrays are worth building: a large one would cost
+        # more to build and prune than the algorithm and still lose to it
+        max_rows = int(lower_bound * CONSTRUCTION_MAX_RATIO)
+        found = covering_array(radix, strength, max_rows=max_rows)
+        if found is None:
+            self.logger.debug(f"No construction within {max_rows} rows (lower bound {lower_bound})")
+            return None
+
+        name, size, rows = found
+        engine = CoverageEngine(headers, params, strength=strength)
+        optimizer = PlanOptimizer(engine, rows)
+        optimizer.eliminate_redundant()
+        plan = [engine.decode_row(row) for row in optimizer.rows]
+        optimal = len(plan) <= lower_bound
+        label = f"{name}, {len(plan)} rows" if len(plan) == size \
+            else f"derived from {name}, {len(plan)} rows"
+        self.logger.info(
+            f"✓ Construction: {label} "
+            f"({'optimal' if optimal else f'lower bound {lower_bound}'})"
+        )
+        return label, plan, optimal
+
+    def select_optimal_variants(
+        self,
+        headers: List[str],
+        rows: List[List[str]],
+        variant_id_col: str = 'Variant_ID',
+        existing: Optional[ExistingPlan] = None
+    ) -> Tuple[List[Tuple[str, List[str]]], CoverageStats]:
+        """
+        Select optimal subset of existing variants for t-way (default pairwise) coverage.
+
+        Args:
+            headers: CSV headers
+            rows: CSV data rows
+            variant_id_col: Name of the variant ID column
+            existing: Previously selected plan to keep; only the variants
+                needed for the tuples it misses are added
+
+        Returns:
+            Tuple of (selected_variants_with_ids, coverage_stats); existing
+            plan rows come first
+        """
+        table = self.encode_rows(headers, rows, variant_id_col)
+        return self.select_from_table(table, existing=existing)
+
+    def select_from_table(
+        self,
+        table: EncodedTable,
+        existing: Optional[ExistingPlan] = None
+    ) -> Tuple[List[Tuple[str, List[str]]], CoverageStats]:
+        """
+        Select variants for t-way coverage from a dictionary-encoded table.
+
+        The greedy core only sees the table's integer rows; strings are
+        decoded for the selected variants alone.
+
+        Args:
+            table: Encoded variants (see ``load_encoded_csv``)
+            existing: Previously selected plan to keep; only the variants
+                needed for the tuples it misses are added
+
+        Returns:
+            Tuple of (selected_variants_with_ids, coverage_stats); existing
+            plan rows come first
+        """
+        params = table.params()
+        param_headers = table.headers
+
+        strength = self._effective_strength(len(param_headers))
+        engine = self._coverage_engine(param_headers, params, strength, report=True)
+        encoded = table.rows()
+
+        self.logger.info(f"Evaluating {len(encoded)} candidate variants")
+
+        valid = list(range(len(encoded)))
+        if self.constraints:
+            valid = engine.apply_constraints(self.constraints, encoded)
+            self.logger.info(
+                f"Constraints: {len(encoded) - len(valid):,} invalid variants skipped, "
+                f"{engine.excluded_count:,} unreachable tuples excluded"
+            )
+
+        fixed_variants = []
+        if existing is not None:
+            fixed_ids = existing.variant_ids or [
+                f"EXISTING-{i+1:03d}" for i in range(len(existing.rows))
+            ]
+            fixed_variants = list(zip(fixed_ids, existing.aligned(param_headers)))
+            self._cover_fixed_rows(engine, [values for _, values in fixed_variants])
+            # Variants already in the plan are not candidates again
+            kept = set(fixed_ids)
+            valid = [r for r in valid if table.variant_id(r) not in kept]
+
+        # Sparse rows: scoring cost follows each variant's populated parameters
+        sparse = table.sparse_rows()
+        selected = self._greedy(
+            engine, [encoded[r] for r in valid], phase="Selecting optimal variants",
+            entries=[sparse[r] for r in valid]
+        )
+
+        selected_variants = fixed_variants + [
+            (table.variant_id(valid[r]), table.decode_row(valid[r])) for r in selected
+        ]
+
+        rows_before = 0
+        if self.time_budget > 0:
+            rows_before = len(selected_variants)
+            # Only whole variants can be dropped; their values must stay real variants
+            _, kept = self.optimize_plan(
+                param_headers, params, [values for _, values in selected_variants],
+                fixed=len(fixed_variants), search=False
+            )
+            selected_variants = [selected_variants[k] for k in kept]
+
+        stats = self.build_coverage_stats(
+            param_headers, params, [values for _, values in selected_variants], strength,
+            candidates=[table.decode_row(r) for r in range(len(table))] if self.constraints else None
+        )
+
+        stats.fixed_test_cases = len(fixed_variants)
+        stats.rows_before_optimization = rows_before
+        stats.seed, stats.restarts = self.chosen_seed, self.restarts
+
+        self.logger.info(
+            f"✓ Selected {len(selected)} new variants ({len(selected_variants)} total) with "
+            f"{stats.coverage_percentage:.1f}% {strength}-way coverage"
+        )
+
+        return selected_variants, stats
+
+    def _write_coverage_statistics(self, f, stats: CoverageStats, mode: str):
+        """Write the "Coverage Statistics" section of a plan report"""
+        strength = stats.strength
+        unit = 'Pairs' if strength == 2 else f'{strength}-way Combinations'
+        f.write("## Coverage Statistics\n\n")
+        f.write(f"- **Interaction Strength:** {strength_label(strength)} (t={strength})\n")
+        f.write(f"- **Total Parameter {unit}:** {stats.total_pairs:,}\n")
+        f.write(f"- **Covered {unit}:** {stats.covered_pairs:,}\n")
+        f.write(f"- **Coverage Percentage:** {stats.coverage_percentage:.2f}%\n")
+        f.write(f"- **Test Cases Generated:** {stats.test_cases_generated}\n")
+
+        if stats.fixed_test_cases > 0:
+            new_cases = stats.test_cases_generated - stats.fixed_test_cases
+            f.write(f"- **Existing Test Cases (Fixed):** {stats.fixed_test_cases}\n")
+            f.write(f"- **New Test Cases:** {new_cases} (last rows of the plan)\n")
+
+        if stats.rows_before_optimization > 0:
+            before = stats.rows_before_optimization
+            saved = before - stats.test_cases_generated
+            f.write(
+                f"- **Post-Optimization:** {before} → {stats.test_cases_generated} rows "
+                f"({saved / before * 100:.1f}% fewer, coverage unchanged)\n"
+            )
+
+        if stats.construction:
+            f.write(f"- **Construction:** {stats.construction}\n")
+
+        if stats.restarts > 1 or stats.seed:
+            passes = f"best of {stats.restarts} restarts, " if stats.restarts > 1 else ""
+            f.write(
+                f"- **Tie-Break Seed:** {stats.seed} ({passes}"
+                f"reproduce with `--seed {stats.seed}`)\n"
+            )
+
+        if stats.uncovered_pairs > 0:
+            f.write(f"- **Uncovered {unit}:** {stats.uncovered_pairs}\n")
+
+        if stats.excluded_pairs > 0:
+            f.write(f"- **Excluded {unit} (Constraint-Invalid):** {stats.excluded_pairs:,}\n")
+
+        # Calculate efficiency
+        if mode == 'generate':
+            # Rough estimate of full combinations
+            f.write(f"- **Efficiency:** Reduced test cases by ~95%+\n")
+
+        f.write("\n")
+
+        if len(stats.strength_breakdown) > 1:
+            f.write("### Coverage by Strength\n\n")
+            f.write("| Strength | Covered | Total | Coverage |\n")
+            f.write("|----------|---------|-------|----------|\n")
+            for t, (covered, total) in sorted(stats.strength_breakdown.items()):
+                pct = (covered / total * 100) if total > 0 else 0
+                f.write(f"| {t}-way | {covered:,} | {total:,} | {pct:.2f}% |\n")
+            f.write("\n")
+
+        self._write_strength_groups(f, stats)
+
+    def _write_strength_groups(self, f, stats: CoverageStats):
+        """Write the coverage table of the higher-strength parameter groups, if any"""
+        if not stats.strength_groups:
+            return
+        f.write("### Variable-Strength Groups\n\n")
+        f.write("| Parameters | Strength | Covered | Total | Coverage |\n")
+        f.write("|------------|----------|---------|-------|----------|\n")
+        for parameters, t, covered, total in stats.strength_groups:
+            pct = (covered / total * 100) if total > 0 else 0
+            f.write(f"| {parameters} | {t}-way | {covered:,} | {total:,} | {pct:.2f}% |\n")
+        f.write("\n")
+
+    def write_markdown_report(
+        self,
+        output_file: str,
+        headers: List[str],
+        test_cases: List,
+        stats: Optional[CoverageStats] = None,
+        mode: str = 'generate'
+    ):
+        """
+        Write the test plan to a markdown file.
+
+        Args:
+            output_file: Output file path
+            headers: Parameter headers
+            test_cases: Selected test cases
+            stats: Coverage statistics
+            mode: 'generate' or 'select'
+        """
+        # Ensure output directory exists
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                # Header
+                strength = stats.strength if stats else self.strength
+                f.write(f"# Combinatorial Test Execution Plan ({strength_label(strength)})\n\n")
+                f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                f.write(f"**Mode:** {'Variant Selection' if mode == 'select' else 'Variant Generation'}\n\n")
+
+                # Statistics
+                if stats:
+                    self._write_coverage_statistics(f, stats, mode)
+
+                # Description
+                f.write("## About This Plan\n\n")
+                if mode == 'select':
+                    f.write(
+                        "This plan selects an optimal subset of predefined variants to achieve "
+                        f"maximum {strength_label(strength).lower()} coverage. The selection ensures that all critical "
+                        "parameter interactions are tested while minimizing redundant test executions.\n\n"
+                    )
+                else:
+                    f.write(
+                        f"This plan generates new test variants using {strength_label(strength).lower()} combinatorial testing. "
+                        "It ensures comprehensive coverage of parameter interactions while dramatically "
+                        "reducing the total number of test cases compared to exhaustive testing.\n\n"
+                    )
+
+                # Test cases table
+                f.write("## Test Cases\n\n")
+
+                # Determine if we have variant IDs
+                if test_cases and len(test_cases[0]) == 2 and isinstance(test_cases[0][0], str):
+                    # Format: [(variant_id, values), ...]
+                    has_ids = True
+                    f.write(f"| Test Case | Variant ID | {' | '.join(headers)} |\n")
+                    f.write(f"|-----------|------------|{'|'.join(['---'] * len(headers))}|\n")
+
+                    for i, (variant_id, values) in enumerate(test_cases, 1):
+                        f.write(f"| {i} | {variant_id} | {' | '.join(values)} |\n")
+                else:
+                    # Format: [tuple_of_values, ...]
+                    has_ids = False
+                    f.write(f"| Test Case | {' | '.join(headers)} |\n")
+                    f.write(f"|-----------|{'|'.join(['---'] * len(headers))}|\n")
+
+                    for i, test_case in enumerate(test_cases, 1):
+                        f.write(f"| {i} | {' | '.join(test_case)} |\n")
+
+                # Footer
+                f.write("\n---\n\n")
+                f.write(f"**Note:** This is an automated test plan generated using {strength_label(strength).lower()} ")
+                f.write("combinatorial testing techniques. Higher-order interactions (3-way, 4-way) ")
+                f.write("can be covered by re-running with `--strength 3` or `--strength 4`.\n")
+
+            self.logger.info(f"✓ Report written to: {output_file}")
+
+        except IOError as e:
+            raise IOError(f"Failed to write output file: {e}")
+
+    def _worker_settings(self) -> Dict[str, Any]:
+        """Constructor arguments for single-process generators run in a pool worker."""
+        return dict(
+            mode=self.mode, verbose=self.verbose, algorithm=self.algorithm,
+            strength=self.strength, selector=self.selector, constraints=self.constraints,
+            workers=1, time_budget=self.time_budget, progress=False,
+            output_formats=self.output_formats, restarts=self.restarts, seed=self.seed,
+            strength_groups=self.strength_groups, candidates=self.candidates,
+            constructions=self.constructions
+        )
+
+    def _worker_trace(self, name: str) -> Optional[str]:
+        """
+        Trace file of one partition or scenario planned by a worker.
+
+        Args:
+            name: Partition key or scenario directory name
+
+        Returns:
+            The --trace path with ``_<name>`` appended to its stem, or None
+            when no trace was requested
+        """
+        if not isinstance(self.instrumentation, TraceInstrumentation):
+            return None
+        path = Path(self.instrumentation.trace_file)
+        safe = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in name)
+        return str(path.with_name(f"{path.stem}_{safe}{path.suffix}"))
+
+    def split_partitions(
+        self,
+        input_file: str,
+        partition_by: str
+    ) -> Tuple[List[str], Dict[str, List[List[str]]]]:
+        """
+        Split a combined variants CSV by the value of one column, in one streaming pass.
+
+        Args:
+            input_file: Path to the CSV file
+            partition_by: Column whose value names the partition (e.g. Scenario_ID)
+
+        Returns:
+            Tuple of (headers_without_partition_column, key -> rows), keys in
+            order of first appearance
+
+        Raises:
+            ValueError: If the column is missing or the file has no data rows
+        """
+        partitions: Dict[str, List[List[str]]] = {}
+        headers: Optional[List[str]] = None
+        for chunk_headers, chunk in self.iter_csv_chunks(input_file):
+            if headers is None:
+                if partition_by not in chunk_headers:
+                    raise ValueError(f"Partition column '{partition_by}' not found in {input_file}")
+                col = chunk_headers.index(partition_by)
+                headers = chunk_headers[:col] + chunk_headers[col + 1:]
+            for row in chunk:
+                key = row[col].strip() or 'N/A'
+                partitions.setdefault(key, []).append(row[:col] + row[col + 1:])
+
+        if headers is None:
+            raise ValueError("CSV file has no data rows")
+        self.logger.info(
+            f"✓ Split {sum(len(rows) for rows in partitions.values()):,} rows into "
+            f"{len(partitions)} partitions by {partition_by}"
+        )
+        return headers, partitions
+
+    def plan_partitions(
+        self,
+        headers: List[str],
+        partitions: Dict[str, List[List[str]]]
+    ) -> Tuple[List[Tuple[str, List[str], List, CoverageStats, Dict[str, List[str]]]], CoverageStats]:
+        """
+        Plan every partition independently in a process pool.
+
+        Each partition only targets the tuples among its own parameters, so
+        cross-partition combinations never enter the coverage target. The
+        largest partitions are submitted first to keep the pool busy; with a
+        single worker they are planned in-process instead. With --trace each
+        partition writes its own trace (see ``_worker_trace``).
+
+        Args:
+            headers: CSV headers without the partition column
+            partitions: Partition key -> rows
+
+        Returns:
+            Tuple of (per-partition (key, parameter_headers, plan, stats, params)
+            in key order, overall coverage_stats)
+        """
+        settings = self._worker_settings()
+        order = sorted(partitions, key=lambda key: -len(partitions[key]))
+        results = {}
+
+        pbar = tqdm(total=len(partitions), desc="Planning partitions", unit="partitions",
+                    disable=not self.progress)
+
+        def record(result: Tuple[str, List[str], List, CoverageStats, Dict[str, List[str]]]):
+            key, stats = result[0], result[3]
+            results[key] = result
+            self.logger.debug(
+                f"✓ {key}: {stats.test_cases_generated} test cases, "
+                f"{stats.coverage_percentage:.1f}% coverage"
+            )
+            pbar.update(1)
+
+        if self.workers == 1:
+            # Partition generators share this logger and quieten it; restore the level
+            level = self.logger.level
+            try:
+                for key in partitions:
+                    result = _plan_partition(
+                        settings, key, headers, partitions[key], self._worker_trace(key)
+                    )
+                    self.logger.setLevel(level)
+                    record(result)
+            finally:
+                self.logger.setLevel(level)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [
+                    pool.submit(_plan_partition, settings, key, headers, partitions[key],
+                                self._worker_trace(key))
+                    for key in order
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    record(future.result())
+        pbar.close()
+
+        ordered = [results[key] for key in partitions]
+        per_partition = [result[3] for result in ordered]
+        total = sum(stats.total_pairs for stats in per_partition)
+        covered = sum(stats.covered_pairs for stats in per_partition)
+        breakdown: Dict[int, Tuple[int, int]] = {}
+        groups: Dict[Tuple[str, int], Tuple[int, int]] = {}
+        for stats in per_partition:
+            for t, (t_covered, t_total) in stats.strength_breakdown.items():
+                prev_covered, prev_total = breakdown.get(t, (0, 0))
+                breakdown[t] = (prev_covered + t_covered, prev_total + t_total)
+            for parameters, t, g_covered, g_total in stats.strength_groups:
+                prev_covered, prev_total = groups.get((parameters, t), (0, 0))
+                groups[parameters, t] = (prev_covered + g_covered, prev_total + g_total)
+
+        overall = CoverageStats(
+            total_pairs=total,
+            covered_pairs=covered,
+            uncovered_pairs=total - covered,
+            coverage_percentage=(covered / total * 100) if total > 0 else 0,
+            test_cases_generated=sum(stats.test_cases_generated for stats in per_partition),
+            strength=max(stats.strength for stats in per_partition),
+            excluded_pairs=sum(stats.excluded_pairs for stats in per_partition),
+            rows_before_optimization=sum(
+                stats.rows_before_optimization for stats in per_partition
+            ),
+            strength_breakdown=breakdown,
+            strength_groups=[
+                (parameters, t, g_covered, g_total)
+                for (parameters, t), (g_covered, g_total) in groups.items()
+            ],
+            partitions={result[0]: result[3] for result in ordered}
+        )
+        self.logger.info(
+            f"✓ Planned {len(ordered)} partitions: {overall.test_cases_generated} test cases, "
+            f"{overall.coverage_percentage:.1f}% coverage"
+        )
+        return ordered, overall
+
+    def write_partitioned_plan(
+        self,
+        output_file: str,
+        partition_by: str,
+        results: List[Tuple[str, List[str], List, CoverageStats, Dict[str, List[str]]]],
+        stats: CoverageStats,
+        mode: str,
+        input_file: str = "",
+        timing: Optional[Dict[str, float]] = None
+    ):
+        """
+        Write a partitioned plan in every requested output format.
+
+        The JSON sidecar holds the overall statistics and one plan document per
+        partition; the CSV sidecar starts with the partition column, so it is
+        itself a combined variants file.
+
+        Args:
+            output_file: Markdown report path
+            partition_by: Name of the partition column
+            results: Per-partition (key, parameter_headers, plan, stats, params)
+            stats: Overall coverage statistics
+            mode: 'generate' or 'select'
+            input_file: Input CSV the plan was built from
+            timing: Phase durations in seconds
+        """
+        if 'md' in self.output_formats:
+            self.write_partitioned_report(output_file, partition_by, results, stats, mode)
+        if 'json' in self.output_formats:
+            overall = asdict(stats)
+            del overall['partitions']
+            document = self._document_header(mode)
+            document.update(
+                input=input_file, partition_by=partition_by, stats=overall,
+                partitions=[
+                    {'key': key, **self.plan_document(param_headers, plan, part, mode, params,
+                                                      standalone=False)}
+                    for key, param_headers, plan, part, params in results
+                ],
+                timing=timing or {}
+            )
+            self._write_json(self._sidecar_path(output_file, 'json'), document)
+        if 'csv' in self.output_formats:
+            self._write_plan_csv(
+                self._sidecar_path(output_file, 'csv'),
+                [((partition_by, key), param_headers, plan)
+                 for key, param_headers, plan, _, _ in results],
+                mode
+            )
+
+    def write_partitioned_report(
+        self,
+        output_file: str,
+        partition_by: str,
+        results: List[Tuple[str, List[str], List, CoverageStats, Dict[str, List[str]]]],
+        stats: CoverageStats,
+        mode: str = 'select'
+    ):
+        """
+        Write one report for a partitioned plan: overall and per-partition stats,
+        then each partition's test cases.
+
+        Args:
+            output_file: Output file path
+            partition_by: Name of the partition column
+            results: Per-partition (key, parameter_headers, plan, stats, params)
+            stats: Overall coverage statistics
+            mode: 'generate' or 'select'
+        """
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                strength = stats.strength
+                f.write(
+                    f"# Combinatorial Test Execution Plan ({strength_label(strength)}, "
+                    f"per {partition_by})\n\n"
+                )
+                f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                f.write(f"**Mode:** {'Variant Selection' if mode == 'select' else 'Variant Generation'}\n\n")
+                f.write(f"**Partitions:** {len(results)} (by {partition_by})\n\n")
+
+                self._write_coverage_statistics(f, stats, mode)
+
+                f.write(f"### Coverage by {partition_by}\n\n")
+                f.write(f"| {partition_by} | Parameters | Test Cases | Covered | Total | Coverage |\n")
+                f.write("|---|------------|------------|---------|-------|----------|\n")
+                for key, param_headers, _, part, _ in results:
+                    f.write(
+                        f"| {key} | {len(param_headers)} | {part.test_cases_generated} | "
+                        f"{part.covered_pairs:,} | {part.total_pairs:,} | "
+                        f"{part.coverage_percentage:.2f}% |\n"
+                    )
+                f.write("\n")
+
+                f.write("## About This Plan\n\n")
+                f.write(
+                    f"Each {partition_by} was planned independently, so only parameter "
+                    "interactions within a partition are coverage targets; combinations "
+                    "across partitions can never occur in a single test and are not counted.\n\n"
+                )
+
+                for key, param_headers, plan, part, _ in results:
+                    f.write(f"## {partition_by}: {key}\n\n")
+                    f.write(
+                        f"**Test Cases:** {part.test_cases_generated} | "
+                        f"**Coverage:** {part.coverage_percentage:.2f}% "
+                        f"({part.covered_pairs:,}/{part.total_pairs:,})\n\n"
+                    )
+                    if mode == 'select':
+                        f.write(f"| Test Case | Variant ID | {' | '.join(param_headers)} |\n")
+                        f.write(f"|-----------|------------|{'|'.join(['---'] * len(param_headers))}|\n")
+                        for i, (variant_id, values) in enumerate(plan, 1):
+                            f.write(f"| {i} | {variant_id} | {' | '.join(values)} |\n")
+                    else:
+                        f.write(f"| Test Case | {' | '.join(param_headers)} |\n")
+                        f.write(f"|-----------|{'|'.join(['---'] * len(param_headers))}|\n")
+                        for i, values in enumerate(plan, 1):
+                            f.write(f"| {i} | {' | '.join(values)} |\n")
+                    f.write("\n")
+
+                f.write("---\n\n")
+                f.write(f"**Note:** This is an automated test plan generated using {strength_label(strength).lower()} ")
+                f.write("combinatorial testing techniques, one plan per partition.\n")
+
+            self.logger.info(f"✓ Report written to: {output_file}")
+
+        except IOError as e:
+            raise IOError(f"Failed to write output file: {e}")
 
-    def generate_pairwise_plan(
+    def write_analysis_report(
         self,
-        params: Dict[str, List[str]],
-        max_iterations: Optional[int] = None
-    ) -> Tuple[List[Tuple], Set]:
+        output_file: str,
+        analysis: CoverageAnalysis,
+        max_uncovered: int = 500
+    ):
         """
-        Generate pairwise test plan using greedy algorithm.
+        Write a coverage analysis to a markdown file.
 
         Args:
-            params: Dictionary of parameter names to possible values
-            max_iterations: Maximum iterations (safety limit)
-
-        Returns:
-            Tuple of (selected_test_cases, covered_pairs)
+            output_file: Output file path
+            analysis: Result of ``analyze_coverage``
+            max_uncovered: Maximum number of uncovered tuples to list
         """
-        headers = list(params.keys())
-        param_lists = [params[h] for h in headers]
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Generate all possible combinations
-        full_product = list(itertools.product(*param_lists))
-        total_combinations = len(full_product)
+        stats = analysis.stats
+        strength = stats.strength
+        unit = 'Pairs' if strength == 2 else f'{strength}-way Combinations'
+        group_label = 'Parameter Pair' if strength == 2 else 'Parameter Group'
 
-        self.logger.info(f"Total possible combinations: {total_combinations:,}")
+        try:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(f"# Coverage Analysis Report ({strength_label(strength)})\n\n")
+                f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                f.write(f"**Test Set:** {analysis.source}\n\n")
+                f.write(f"**Parameter Space:** {analysis.universe}\n\n")
+
+                f.write("## Coverage Statistics\n\n")
+                f.write(f"- **Interaction Strength:** {strength_label(strength)} (t={strength})\n")
+                f.write(f"- **Total Parameter {unit}:** {stats.total_pairs:,}\n")
+                f.write(f"- **Covered {unit}:** {stats.covered_pairs:,}\n")
+                f.write(f"- **Coverage Percentage:** {stats.coverage_percentage:.2f}%\n")
+                f.write(f"- **Test Cases Analyzed:** {stats.test_cases_generated:,}\n")
+                f.write(f"- **Uncovered {unit}:** {stats.uncovered_pairs:,}\n")
+                if stats.excluded_pairs > 0:
+                    f.write(f"- **Excluded {unit} (Constraint-Invalid):** {stats.excluded_pairs:,}\n")
+                f.write("\n")
+
+                if len(stats.strength_breakdown) > 1:
+                    f.write("### Coverage by Strength\n\n")
+                    f.write("| Strength | Covered | Total | Coverage |\n")
+                    f.write("|----------|---------|-------|----------|\n")
+                    for t, (covered, total) in sorted(stats.strength_breakdown.items()):
+                        pct = (covered / total * 100) if total > 0 else 0
+                        f.write(f"| {t}-way | {covered:,} | {total:,} | {pct:.2f}% |\n")
+                    f.write("\n")
 
-        if total_combinations == 0:
-            raise ValueError("No combinations possible with given parameters")
+                self._write_strength_groups(f, stats)
 
-        # Calculate all pairs that need to be covered
-        uncovered_pairs = set()
-        for i in range(len(headers)):
-            for j in range(i + 1, len(headers)):
-                p1_values = params[headers[i]]
-                p2_values = params[headers[j]]
-                for v1 in p1_values:
-                    for v2 in p2_values:
-                        uncovered_pairs.add(((headers[i], v1), (headers[j], v2)))
-
-        total_pairs = len(uncovered_pairs)
-        self.logger.info(f"Total pairs to cover: {total_pairs:,}")
-
-        # Greedy selection algorithm
-        pairwise_plan = []
-        remaining_candidates = set(full_product)  # Use set for O(1) removal
-        iteration = 0
-        max_iter = max_iterations or total_combinations * 2
-
-        # Create progress bar
-        pbar = tqdm(
-            total=total_pairs,
-            desc="Generating pairwise plan",
-            unit="pairs",
-            disable=False  # Always show progress bar
-        )
-
-        while uncovered_pairs and remaining_candidates and iteration < max_iter:
-            iteration += 1
-
-            best_candidate = None
-            best_coverage = -1
-
-            # Show progress during candidate evaluation if there are many candidates
-            candidates_iter = tqdm(
-                remaining_candidates,
-                desc=f"  Evaluating candidates (iteration {iteration})",
-                leave=False,
-                disable=False
-            ) if len(remaining_candidates) > 1000 else remaining_candidates
-
-            # Evaluate each remaining candidate
-            for candidate in candidates_iter:
-                pairs_covered = set()
-
-                # Count how many uncovered pairs this candidate covers
-                for i in range(len(headers)):
-                    for j in range(i + 1, len(headers)):
-                        pair = ((headers[i], candidate[i]), (headers[j], candidate[j]))
-                        if pair in uncovered_pairs:
-                            pairs_covered.add(pair)
-
-                # Track the best candidate
-                if len(pairs_covered) > best_coverage:
-                    best_candidate = candidate
-                    best_coverage = len(pairs_covered)
-
-            if best_candidate is None or best_coverage == 0:
-                self.logger.warning("No more pairs can be covered, stopping early")
-                break
+                # Least covered groups first
+                f.write(f"## Coverage by {group_label}\n\n")
+                f.write(f"| {group_label} | Covered | Total | Coverage |\n")
+                f.write("|---|---------|-------|----------|\n")
+                rows = sorted(
+                    analysis.group_breakdown,
+                    key=lambda item: (item[1] / item[2] if item[2] else 1.0, item[0])
+                )
+                for names, covered, total in rows:
+                    pct = (covered / total * 100) if total > 0 else 100.0
+                    f.write(f"| {' × '.join(names)} | {covered:,} | {total:,} | {pct:.2f}% |\n")
+                f.write("\n")
+
+                f.write(f"## Uncovered {unit}\n\n")
+                if not analysis.uncovered:
+                    f.write("None - every reachable combination is covered.\n\n")
+                for assignment in analysis.uncovered[:max_uncovered]:
+                    f.write(f"- {', '.join(f'{name}={value}' for name, value in assignment)}\n")
+                if len(analysis.uncovered) > max_uncovered:
+                    f.write(f"- ... and {len(analysis.uncovered) - max_uncovered:,} more\n")
+                f.write("\n")
+
+                if analysis.unknown_values:
+                    f.write("## Values Outside the Parameter Space\n\n")
+                    for header, values in sorted(analysis.unknown_values.items()):
+                        f.write(f"- **{header}:** {', '.join(sorted(values))}\n")
+                    f.write("\n")
 
-            # Add best candidate to plan
-            pairwise_plan.append(best_candidate)
-            remaining_candidates.remove(best_candidate)
-
-            # Mark pairs as covered and update progress bar
-            pairs_covered_this_iteration = 0
-            for i in range(len(headers)):
-                for j in range(i + 1, len(headers)):
-                    pair = ((headers[i], best_candidate[i]), (headers[j], best_candidate[j]))
-                    if pair in uncovered_pairs:
-                        uncovered_pairs.discard(pair)
-                        pairs_covered_this_iteration += 1
-            
-            # Update progress bar
-            pbar.update(pairs_covered_this_iteration)
-            coverage_pct = ((total_pairs - len(uncovered_pairs)) / total_pairs * 100) if total_pairs > 0 else 0
-            pbar.set_postfix(
-                test_cases=len(pairwise_plan),
-                coverage=f'{coverage_pct:.1f}%'
-            )
+                f.write("---\n\n")
+                f.write("**Note:** Uncovered combinations can be added to the test set with ")
+                f.write("`--augment`, which keeps the existing rows and adds only the missing ones.\n")
 
-        pbar.close()
-        
-        coverage_pct = ((total_pairs - len(uncovered_pairs)) / total_pairs * 100) if total_pairs > 0 else 0
-        self.logger.info(
-            f"✓ Generated {len(pairwise_plan)} test cases with {coverage_pct:.1f}% coverage"
-        )
+            self.logger.info(f"✓ Report written to: {output_file}")
 
-        return pairwise_plan, set(((headers[i], tc[i]), (headers[j], tc[j]))
-                                   for tc in pairwise_plan
-                                   for i in range(len(headers))
-                                   for j in range(i + 1, len(headers)))
+        except IOError as e:
+            raise IOError(f"Failed to write output file: {e}")
 
-    def select_optimal_variants(
+    def plan_file(
         self,
-        headers: List[str],
-        rows: List[List[str]],
-        variant_id_col: str = 'Variant_ID'
-    ) -> Tuple[List[Tuple[str, List[str]]], CoverageStats]:
+        input_file: str,
+        output_file: str,
+        mode: str,
+        existing: Optional[ExistingPlan] = None
+    ) -> CoverageStats:
         """
-        Select optimal subset of existing variants for pairwise coverage.
+        Plan one variants file and write its markdown report.
 
         Args:
-            headers: CSV headers
-            rows: CSV data rows
-            variant_id_col: Name of the variant ID column
+            input_file: Input CSV file path
+            output_file: Output markdown file path
+            mode: 'select' or 'generate'
+            existing: Plan to extend, or None
 
         Returns:
-            Tuple of (selected_variants_with_ids, coverage_stats)
+            CoverageStats of the written plan
         """
-        # Find variant ID column index
-        try:
-            id_col_idx = headers.index(variant_id_col)
-        except ValueError:
-            self.logger.warning(f"Column '{variant_id_col}' not found, using row numbers")
-            id_col_idx = None
-
-        # Extract parameters (excluding ID column)
-        exclude = [variant_id_col] if id_col_idx is not None else []
-        params = self.extract_parameters(headers, rows, exclude_columns=exclude)
-        param_headers = list(params.keys())
+        start = time.perf_counter()
+        if mode == 'select':
+            # Select from existing variants
+            table = self.load_encoded_csv(input_file)
+            loaded = time.perf_counter()
+            test_cases, stats = self.select_from_table(table, existing=existing)
+            param_headers, params = table.headers, table.params()
+        else:
+            # Generate new variants
+            headers, rows = self.read_csv_with_validation(input_file)
+            loaded = time.perf_counter()
+            param_headers, test_cases, stats = self.generate_plan(headers, rows, existing)
+            params = self.extract_parameters(headers, rows) if self._sidecars() else {}
+        planned = time.perf_counter()
+
+        timing = {
+            'load_seconds': round(loaded - start, 4),
+            'plan_seconds': round(planned - loaded, 4),
+            'total_seconds': round(planned - start, 4)
+        }
+        self.write_plan(output_file, param_headers, test_cases, stats, mode, params,
+                        input_file=input_file, timing=timing,
+                        counters=self.instrumentation.summary())
+        return stats
+
+    def _sidecars(self) -> List[str]:
+        """Requested machine-readable output formats"""
+        return [fmt for fmt in self.output_formats if fmt != 'md']
+
+    def write_plan(
+        self,
+        output_file: str,
+        headers: List[str],
+        test_cases: List,
+        stats: CoverageStats,
+        mode: str,
+        params: Dict[str, List[str]],
+        input_file: str = "",
+        timing: Optional[Dict[str, float]] = None,
+        counters: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Write a plan in every requested output format.
 
-        # Build candidate variants
-        candidates = []
-        for i, row in enumerate(rows):
-            variant_id = row[id_col_idx] if id_col_idx is not None else f"V{i+1:03d}"
-
-            # Extract parameter values for this variant
-            variant_values = []
-            for header in param_headers:
-                col_idx = headers.index(header)
-                value = row[col_idx].strip() if col_idx < len(row) else ''
-                # Keep N/A for existing variants
-                variant_values.append(value if value else 'N/A')
-
-            candidates.append((variant_id, tuple(variant_values)))
-
-        self.logger.info(f"Evaluating {len(candidates)} candidate variants")
-
-        # Calculate all possible pairs
-        all_pairs = set()
-        for i in range(len(param_headers)):
-            for j in range(i + 1, len(param_headers)):
-                for v1 in params[param_headers[i]]:
-                    for v2 in params[param_headers[j]]:
-                        all_pairs.add(((param_headers[i], v1), (param_headers[j], v2)))
-
-        total_pairs = len(all_pairs)
-        uncovered_pairs = all_pairs.copy()
-
-        # Greedy selection from existing variants
-        selected_variants = []
-        remaining_candidates = candidates.copy()
-
-        # Create progress bar for the selection process
-        pbar = tqdm(
-            total=total_pairs,
-            desc="Selecting optimal variants",
-            unit="pairs",
-            disable=False  # Always show progress bar
-        )
-
-        iteration = 0
-        while uncovered_pairs and remaining_candidates and iteration < len(candidates):
-            iteration += 1
-
-            best_variant = None
-            best_coverage = -1
-
-            # Show progress during candidate evaluation (slow part)
-            candidates_iter = tqdm(
-                remaining_candidates,
-                desc=f"  Evaluating candidates (iteration {iteration})",
-                leave=False,
-                disable=False
-            ) if len(remaining_candidates) > 1000 else remaining_candidates
-
-            for variant_id, values in candidates_iter:
-                pairs_covered = set()
-
-                for i in range(len(param_headers)):
-                    for j in range(i + 1, len(param_headers)):
-                        v1, v2 = values[i], values[j]
-                        # Skip N/A values
-                        if v1.upper() in ('N/A', 'NA') or v2.upper() in ('N/A', 'NA'):
-                            continue
-
-                        pair = ((param_headers[i], v1), (param_headers[j], v2))
-                        if pair in uncovered_pairs:
-                            pairs_covered.add(pair)
-
-                if len(pairs_covered) > best_coverage:
-                    best_variant = (variant_id, values)
-                    best_coverage = len(pairs_covered)
-
-            if best_variant is None or best_coverage == 0:
-                break
+        The markdown report goes to ``output_file``; the JSON and CSV sidecars
+        go next to it with the suffix replaced (``combinatorial_plan.json``).
 
-            selected_variants.append(best_variant)
-            remaining_candidates.remove(best_variant)
-
-            # Mark pairs as covered and update progress bar
-            variant_id, values = best_variant
-            pairs_covered_this_iteration = 0
-            for i in range(len(param_headers)):
-                for j in range(i + 1, len(param_headers)):
-                    v1, v2 = values[i], values[j]
-                    if v1.upper() not in ('N/A', 'NA') and v2.upper() not in ('N/A', 'NA'):
-                        pair = ((param_headers[i], v1), (param_headers[j], v2))
-                        if pair in uncovered_pairs:
-                            uncovered_pairs.discard(pair)
-                            pairs_covered_this_iteration += 1
-            
-            # Update progress bar
-            pbar.update(pairs_covered_this_iteration)
-            coverage = (1 - len(uncovered_pairs) / total_pairs) * 100
-            pbar.set_postfix(
-                variants=len(selected_variants),
-                coverage=f'{coverage:.1f}%'
+        Args:
+            output_file: Markdown report path
+            headers: Parameter headers
+            test_cases: Selected test cases
+            stats: Coverage statistics
+            mode: 'generate' or 'select'
+            params: Parameter name -> values; a value's code is its index
+            input_file: Input CSV the plan was built from
+            timing: Phase durations in seconds
+            counters: Instrumentation summary of the planning loops
+        """
+        if 'md' in self.output_formats:
+            self.write_markdown_report(output_file, headers, test_cases, stats, mode)
+        if 'json' in self.output_formats:
+            document = self.plan_document(headers, test_cases, stats, mode, params)
+            document.update(input=input_file, timing=timing or {}, counters=counters or {})
+            self._write_json(self._sidecar_path(output_file, 'json'), document)
+        if 'csv' in self.output_formats:
+            self._write_plan_csv(
+                self._sidecar_path(output_file, 'csv'), [(None, headers, test_cases)], mode
             )
 
-        pbar.close()
-
-        covered_pairs = total_pairs - len(uncovered_pairs)
-        coverage_pct = (covered_pairs / total_pairs * 100) if total_pairs > 0 else 0
-
-        stats = CoverageStats(
-            total_pairs=total_pairs,
-            covered_pairs=covered_pairs,
-            uncovered_pairs=len(uncovered_pairs),
-            coverage_percentage=coverage_pct,
-            test_cases_generated=len(selected_variants)
-        )
-
-        self.logger.info(
-            f"✓ Selected {len(selected_variants)} variants with {coverage_pct:.1f}% coverage"
-        )
-
-        return selected_variants, stats
+    @staticmethod
+    def _sidecar_path(output_file: str, fmt: str) -> str:
+        return str(Path(output_file).with_suffix(f'.{fmt}'))
 
-    def write_markdown_report(
+    def plan_document(
         self,
-        output_file: str,
         headers: List[str],
         test_cases: List,
-        stats: Optional[CoverageStats] = None,
-        mode: str = 'generate'
-    ):
+        stats: CoverageStats,
+        mode: str,
+        params: Dict[str, List[str]],
+        standalone: bool = True
+    ) -> Dict[str, Any]:
         """
-        Write the test plan to a markdown file.
+        Machine-readable form of a plan, as stored in the JSON sidecar.
 
         Args:
-            output_file: Output file path
             headers: Parameter headers
             test_cases: Selected test cases
             stats: Coverage statistics
             mode: 'generate' or 'select'
-        """
-        # Ensure output directory exists
-        output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+            params: Parameter name -> values; a value's code is its index
+            standalone: Include the generation time, mode and settings (off for
+                the partitions of a partitioned plan)
 
+        Returns:
+            Dictionary with the settings, parameters and their values, the
+            variant IDs (select mode), the rows as values and as codes (-1 for
+            N/A) and the full coverage statistics
+        """
+        if mode == 'select':
+            variant_ids = [variant_id for variant_id, _ in test_cases]
+            rows = [list(values) for _, values in test_cases]
+        else:
+            variant_ids = None
+            rows = [list(values) for values in test_cases]
+        values = [list(params.get(h, [])) for h in headers]
+        codes = [{value: code for code, value in enumerate(column)} for column in values]
+
+        document = self._document_header(mode) if standalone else {}
+        document.update({
+            'parameters': headers,
+            'values': values,
+            'variant_ids': variant_ids,
+            'rows': rows,
+            'encoded_rows': [
+                [code_of.get(value, -1) for code_of, value in zip(codes, row)] for row in rows
+            ],
+            'stats': asdict(stats)
+        })
+        return document
+
+    def _document_header(self, mode: str) -> Dict[str, Any]:
+        """Generation time, mode and settings heading a JSON sidecar"""
+        return {
+            'generated': datetime.now().isoformat(timespec='seconds'),
+            'mode': mode,
+            'settings': {
+                'strength': self.strength, 'algorithm': self.algorithm,
+                'selector': self.selector, 'time_budget': self.time_budget,
+                'constraints': self.constraints is not None,
+                'strength_groups': [
+                    f"{group.strength}:{','.join(group.parameters)}"
+                    for group in self.strength_groups
+                ]
+            }
+        }
+
+    def _write_json(self, path: str, document: Dict[str, Any]):
+        """Write a JSON sidecar"""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                # Header
-                f.write("# Combinatorial Test Execution Plan (Pairwise)\n\n")
-                f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write(f"**Mode:** {'Variant Selection' if mode == 'select' else 'Variant Generation'}\n\n")
-
-                # Statistics
-                if stats:
-                    f.write("## Coverage Statistics\n\n")
-                    f.write(f"- **Total Parameter Pairs:** {stats.total_pairs:,}\n")
-                    f.write(f"- **Covered Pairs:** {stats.covered_pairs:,}\n")
-                    f.write(f"- **Coverage Percentage:** {stats.coverage_percentage:.2f}%\n")
-                    f.write(f"- **Test Cases Generated:** {stats.test_cases_generated}\n")
-
-                    if stats.uncovered_pairs > 0:
-                        f.write(f"- **Uncovered Pairs:** {stats.uncovered_pairs}\n")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(document, f, indent=2)
+            self.logger.info(f"✓ JSON plan written to: {path}")
+        except IOError as e:
+            raise IOError(f"Failed to write output file: {e}")
 
-                    # Calculate efficiency
-                    if mode == 'generate':
-                        # Rough estimate of full combinations
-                        f.write(f"- **Efficiency:** Reduced test cases by ~95%+\n")
+    def _write_plan_csv(
+        self,
+        path: str,
+        plans: List[Tuple[Optional[Tuple[str, str]], List[str], List]],
+        mode: str
+    ):
+        """
+        Write plan rows as a variants-format CSV (loadable with --augment).
 
-                    f.write("\n")
+        Args:
+            path: CSV path
+            plans: (partition, headers, test_cases) per plan; partition is a
+                (column, key) pair that becomes the first column, or None
+            mode: 'generate' or 'select'; select mode adds a Variant_ID column
+        """
+        headers: List[str] = []
+        for _, plan_headers, _ in plans:
+            headers.extend(h for h in plan_headers if h not in headers)
+        partition_col = plans[0][0][0] if plans and plans[0][0] else None
 
-                # Description
-                f.write("## About This Plan\n\n")
-                if mode == 'select':
-                    f.write(
-                        "This plan selects an optimal subset of predefined variants to achieve "
-                        "maximum pairwise coverage. The selection ensures that all critical "
-                        "parameter interactions are tested while minimizing redundant test executions.\n\n"
-                    )
-                else:
-                    f.write(
-                        "This plan generates new test variants using pairwise combinatorial testing. "
-                        "It ensures comprehensive coverage of parameter interactions while dramatically "
-                        "reducing the total number of test cases compared to exhaustive testing.\n\n"
-                    )
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(
+                    ([partition_col] if partition_col else [])
+                    + (['Variant_ID'] if mode == 'select' else []) + headers
+                )
+                for partition, plan_headers, test_cases in plans:
+                    lead = [partition[1]] if partition else []
+                    for test_case in test_cases:
+                        if mode == 'select':
+                            variant_id, values = test_case
+                            prefix = lead + [variant_id]
+                        else:
+                            values, prefix = test_case, lead
+                        by_header = dict(zip(plan_headers, values))
+                        writer.writerow(prefix + [by_header.get(h, 'N/A') for h in headers])
+            self.logger.info(f"✓ CSV plan written to: {path}")
+        except IOError as e:
+            raise IOError(f"Failed to write output file: {e}")
 
-                # Test cases table
-                f.write("## Test Cases\n\n")
+    def process_batch(
+        self,
+        scenarios_dir: str,
+        mode: Optional[str] = None,
+        output_name: str = 'combinatorial_plan.md'
+    ) -> Dict[str, Optional[CoverageStats]]:
+        """
+        Plan every scenario under a directory in one process pool (in-process
+        with a single worker).
 
-                # Determine if we have variant IDs
-                if test_cases and len(test_cases[0]) == 2 and isinstance(test_cases[0][0], str):
-                    # Format: [(variant_id, values), ...]
-                    has_ids = True
-                    f.write(f"| Test Case | Variant ID | {' | '.join(headers)} |\n")
-                    f.write(f"|-----------|------------|{'|'.join(['---'] * len(headers))}|\n")
+        Each ``variants.csv`` below ``scenarios_dir`` gets an ``output_name``
+        report next to it; a scenario written in factorized form is read from
+        its ``variants.json`` instead. With --trace each scenario writes its own
+        trace, named after its directory (see ``_worker_trace``). Scenarios are
+        submitted to the pool largest file first so it stays busy; a failing
+        scenario is logged and does not stop the others.
 
-                    for i, (variant_id, values) in enumerate(test_cases, 1):
-                        f.write(f"| {i} | {variant_id} | {' | '.join(values)} |\n")
-                else:
-                    # Format: [tuple_of_values, ...]
-                    has_ids = False
-                    f.write(f"| Test Case | {' | '.join(headers)} |\n")
-                    f.write(f"|-----------|{'|'.join(['---'] * len(headers))}|\n")
+        Args:
+            scenarios_dir: Directory holding one sub-directory per scenario
+            mode: 'select' or 'generate' (overrides instance mode)
+            output_name: Report file name written into each scenario directory
 
-                    for i, test_case in enumerate(test_cases, 1):
-                        f.write(f"| {i} | {' | '.join(test_case)} |\n")
+        Returns:
+            Mapping of variants file -> CoverageStats (None for failed scenarios)
 
-                # Footer
-                f.write("\n---\n\n")
-                f.write("**Note:** This is an automated test plan generated using pairwise ")
-                f.write("combinatorial testing techniques. For complex scenarios or higher-order ")
-                f.write("interactions (3-way, 4-way), consider using specialized tools like ")
-                f.write("`allpairspy`, `PICT`, or `ACTS`.\n")
+        Raises:
+            FileNotFoundError: If the directory does not exist
+            ValueError: If no variants file is found or the mode is not supported
+        """
+        self.mode = mode or self.mode
+        if self.mode == 'analyze':
+            raise ValueError("--scenarios-dir works with select and generate mode")
+
+        root = Path(scenarios_dir)
+        if not root.is_dir():
+            raise FileNotFoundError(f"Scenarios directory not found: {scenarios_dir}")
+        files = sorted({
+            resolve_variants_file(path.parent / 'variants.csv')
+            for pattern in ('variants.csv', 'variants.json') for path in root.rglob(pattern)
+        })
+        if not files:
+            raise ValueError(f"No variants.csv or variants.json found under {scenarios_dir}")
 
-            self.logger.info(f"✓ Report written to: {output_file}")
+        self.logger.info(
+            f"Planning {len(files)} scenarios (mode: {self.mode}, workers: {self.workers})"
+        )
+        settings = self._worker_settings()
+        order = sorted(files, key=lambda path: -path.stat().st_size)
+        results: Dict[str, Optional[CoverageStats]] = {}
+
+        pbar = tqdm(total=len(files), desc="Planning scenarios", unit="scenarios",
+                    disable=not self.progress)
+
+        def record(result: Tuple[str, Optional[CoverageStats], Optional[str]]):
+            input_file, stats, error = result
+            results[input_file] = stats
+            if error:
+                self.logger.error(f"✗ {input_file}: {error}")
+            else:
+                self.logger.debug(
+                    f"✓ {input_file}: {stats.test_cases_generated} test cases, "
+                    f"{stats.coverage_percentage:.1f}% coverage"
+                )
+            pbar.update(1)
+
+        if self.workers == 1:
+            # Scenario generators share this logger and quieten it; restore the level
+            level = self.logger.level
+            try:
+                for path in files:
+                    result = _plan_scenario(
+                        settings, str(path), str(path.parent / output_name),
+                        self._worker_trace(path.parent.name)
+                    )
+                    self.logger.setLevel(level)
+                    record(result)
+            finally:
+                self.logger.setLevel(level)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [
+                    pool.submit(_plan_scenario, settings, str(path), str(path.parent / output_name),
+                                self._worker_trace(path.parent.name))
+                    for path in order
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    record(future.result())
+        pbar.close()
 
-        except IOError as e:
-            raise IOError(f"Failed to write output file: {e}")
+        return {str(path): results[str(path)] for path in files}
 
     def process(
         self,
         input_file: str,
         output_file: str,
-        mode: Optional[str] = None
+        mode: Optional[str] = None,
+        augment: Optional[str] = None,
+        universe: Optional[str] = None,
+        partition_by: Optional[str] = None
     ):
         """
         Main processing function.
@@ -635,9 +4226,16 @@ class CombinatorialTestGenerator:
         Args:
             input_file: Input CSV file path
             output_file: Output markdown file path
-            mode: 'select' or 'generate' (overrides instance mode)
+            mode: 'select', 'generate' or 'analyze' (overrides instance mode)
+            augment: Existing plan (markdown or CSV) to extend instead of
+                rebuilding from scratch
+            universe: Parameter space CSV for analyze mode
+            partition_by: Column of a combined file to split on (e.g. Scenario_ID);
+                every partition is planned on its own
         """
         mode = mode or self.mode
+        if mode != 'analyze' and not partition_by:
+            input_file = str(resolve_variants_file(Path(input_file)))
 
         self.logger.info(f"Starting combinatorial test generation (mode: {mode})")
         self.logger.info(f"Input: {input_file}")
@@ -646,42 +4244,50 @@ class CombinatorialTestGenerator:
         try:
             # Validate and read input
             self.validate_input_file(input_file)
-            headers, rows = self.read_csv_with_validation(input_file)
-
-            if mode == 'select':
-                # Select from existing variants
-                selected_variants, stats = self.select_optimal_variants(headers, rows)
-                param_headers = [h for h in headers if h != 'Variant_ID']
-                self.write_markdown_report(
-                    output_file, param_headers, selected_variants, stats, mode
+            if partition_by and (mode == 'analyze' or augment):
+                raise ValueError("--partition-by works with select and generate mode, without --augment")
+            existing = self.load_existing_plan(augment) if augment else None
+
+            if partition_by:
+                # Plan each scenario (or other partition) independently
+                self.mode = mode
+                start = time.perf_counter()
+                headers, partitions = self.split_partitions(input_file, partition_by)
+                loaded = time.perf_counter()
+                results, stats = self.plan_partitions(headers, partitions)
+                planned = time.perf_counter()
+                timing = {
+                    'load_seconds': round(loaded - start, 4),
+                    'plan_seconds': round(planned - loaded, 4),
+                    'total_seconds': round(planned - start, 4)
+                }
+                self.write_partitioned_plan(
+                    output_file, partition_by, results, stats, mode, input_file, timing
                 )
+            elif mode == 'analyze':
+                # Measure an existing test set; streamed, never loaded whole
+                if universe:
+                    self.validate_input_file(universe)
+                analysis = self.analyze_coverage(input_file, universe)
+                stats = analysis.stats
+                self.write_analysis_report(output_file, analysis)
             else:
-                # Generate new variants
-                params = self.extract_parameters(headers, rows)
-                pairwise_plan, covered = self.generate_pairwise_plan(params)
-
-                total_pairs = self.calculate_total_pairs(params)
-                stats = CoverageStats(
-                    total_pairs=total_pairs,
-                    covered_pairs=len(covered),
-                    uncovered_pairs=total_pairs - len(covered),
-                    coverage_percentage=(len(covered) / total_pairs * 100) if total_pairs > 0 else 0,
-                    test_cases_generated=len(pairwise_plan)
-                )
-
-                param_headers = list(params.keys())
-                self.write_markdown_report(
-                    output_file, param_headers, pairwise_plan, stats, mode
-                )
+                stats = self.plan_file(input_file, output_file, mode, existing)
 
             self.logger.info("✓ Processing completed successfully")
             print(f"\n{'='*60}")
-            print(f"✓ Successfully generated combinatorial plan")
+            done = 'analyzed test set coverage' if mode == 'analyze' else 'generated combinatorial plan'
+            print(f"✓ Successfully {done}")
             print(f"  Input:  {input_file}")
-            print(f"  Output: {output_file}")
+            outputs = [output_file] if mode == 'analyze' or 'md' in self.output_formats else []
+            outputs += [self._sidecar_path(output_file, fmt) for fmt in self._sidecars()
+                        if mode != 'analyze']
+            print(f"  Output: {', '.join(outputs)}")
             if stats:
                 print(f"  Test Cases: {stats.test_cases_generated}")
-                print(f"  Coverage: {stats.coverage_percentage:.1f}%")
+                if augment:
+                    print(f"  New Test Cases: {stats.test_cases_generated - stats.fixed_test_cases}")
+                print(f"  Coverage: {stats.coverage_percentage:.1f}% ({strength_label(stats.strength)})")
             print(f"{'='*60}\n")
 
         except Exception as e:
@@ -689,6 +4295,82 @@ class CombinatorialTestGenerator:
             raise
 
 
+def _plan_partition(
+    settings: Dict[str, Any],
+    key: str,
+    headers: List[str],
+    rows: List[List[str]],
+    trace_file: Optional[str] = None
+) -> Tuple[str, List[str], List, CoverageStats, Dict[str, List[str]]]:
+    """
+    Plan one partition of a combined variants file (runs in a pool worker).
+
+    Args:
+        settings: Keyword arguments for CombinatorialTestGenerator
+        key: Partition key (e.g. the scenario ID)
+        headers: CSV headers without the partition column
+        rows: The partition's rows
+        trace_file: Path of the partition's JSON trace, or None
+
+    Returns:
+        Tuple of (key, parameter_headers, plan, coverage_stats, params)
+    """
+    generator = CombinatorialTestGenerator(
+        **settings, instrumentation=TraceInstrumentation(trace_file) if trace_file else None
+    )
+    if not settings.get('verbose'):
+        generator.logger.setLevel(logging.WARNING)
+
+    # Columns this partition never populates belong to other partitions
+    columns = list(zip(*rows))
+    keep = [
+        i for i, header in enumerate(headers)
+        if header == 'Variant_ID' or any(
+            value.strip() and value.strip().upper() not in NA_VALUES for value in set(columns[i])
+        )
+    ]
+    headers = [headers[i] for i in keep]
+    rows = [[row[i] for i in keep] for row in rows]
+
+    if generator.mode == 'select':
+        table = generator.encode_rows(headers, rows)
+        plan, stats = generator.select_from_table(table)
+        return key, table.headers, plan, stats, table.params()
+    param_headers, plan, stats = generator.generate_plan(headers, rows)
+    params = generator.extract_parameters(headers, rows) if generator._sidecars() else {}
+    return key, param_headers, plan, stats, params
+
+
+def _plan_scenario(
+    settings: Dict[str, Any],
+    input_file: str,
+    output_file: str,
+    trace_file: Optional[str] = None
+) -> Tuple[str, Optional[CoverageStats], Optional[str]]:
+    """
+    Plan one scenario's variants file (runs in a pool worker).
+
+    Args:
+        settings: Keyword arguments for CombinatorialTestGenerator
+        input_file: The scenario's variants.csv (or factorized variants.json)
+        output_file: Report path
+        trace_file: Path of the scenario's JSON trace, or None
+
+    Returns:
+        Tuple of (input_file, coverage_stats, error); stats is None on error
+    """
+    generator = CombinatorialTestGenerator(
+        **settings, instrumentation=TraceInstrumentation(trace_file) if trace_file else None
+    )
+    if not settings.get('verbose'):
+        generator.logger.setLevel(logging.WARNING)
+    try:
+        generator.validate_input_file(input_file)
+        return input_file, generator.plan_file(input_file, output_file, generator.mode), None
+    except Exception as e:
+        return input_file, None, str(e)
+
+
 def main():
     """Command-line interface"""
     parser = argparse.ArgumentParser(
@@ -702,6 +4384,54 @@ Examples:
   # Generate new variants from parameter space
   python combinatorial.py deliverables/04_variants.csv --mode generate
 
+  # Generate with in-parameter-order construction (large models)
+  python combinatorial.py input.csv --mode generate --algorithm ipog
+
+  # Generate with the algorithm only, without trying known covering-array constructions
+  python combinatorial.py input.csv --mode generate --no-constructions
+
+  # Generate by AETG-style sampling: best of 20 random rows per plan row
+  python combinatorial.py input.csv --mode generate --algorithm aetg --candidates 20
+
+  # 3-way interaction coverage
+  python combinatorial.py input.csv --strength 3
+
+  # Pairwise overall, but every Payment_Method x Card_Type x Payment_Status triple
+  python combinatorial.py input.csv --strength-group Payment_Method,Card_Type,Payment_Status
+
+  # 3-way among any three of four parameters (T:PARAMS), repeatable
+  python combinatorial.py input.csv --strength-group 3:Browser,Device,Network_Speed,Payment_Method
+
+  # Exclude invalid combinations (JSON forbidden tuples / implications)
+  python combinatorial.py input.csv --constraints constraints.json
+
+  # Score greedy candidates on 8 processes (same plan as single-process)
+  python combinatorial.py input.csv --workers 8
+
+  # Spend up to 60s shrinking the generated plan
+  python combinatorial.py input.csv --mode generate --time-budget 60
+
+  # Measure the coverage of the tests that actually ran against the full variant set
+  python combinatorial.py ci_executed.csv --mode analyze --universe 04_variants.csv
+
+  # Plan every scenario of a combined file separately, 4 scenarios at a time
+  python combinatorial.py deliverables/04_variants.csv --partition-by Scenario_ID --workers 4
+
+  # Plan every scenario directory in one run, 8 scenarios at a time
+  python combinatorial.py --scenarios-dir deliverables/scenarios --workers 8
+
+  # Write only the machine-readable plan (JSON and CSV)
+  python combinatorial.py input.csv --format json,csv
+
+  # Try 16 randomized greedy passes on all CPUs and keep the smallest plan
+  python combinatorial.py input.csv --mode generate --restarts 16 --workers 0
+
+  # Profile planning on CI: no progress display, per-iteration JSON trace
+  python combinatorial.py input.csv --no-progress --trace plan_trace.json
+
+  # Extend an existing plan after adding parameter values
+  python combinatorial.py input.csv --augment combinatorial_plan.md
+
   # Custom output path
   python combinatorial.py input.csv --output custom_plan.md
 
@@ -712,20 +4442,163 @@ Examples:
 
     parser.add_argument(
         'input_file',
+        nargs='?',
         help='Input CSV file containing variants or parameters'
     )
 
+    parser.add_argument(
+        '--scenarios-dir',
+        metavar='DIR',
+        help='Batch mode: plan every variants.csv (or factorized variants.json) below '
+             'DIR in one process pool of --workers processes, writing '
+             'combinatorial_plan.md next to each'
+    )
+
     parser.add_argument(
         '--output', '-o',
-        default='deliverables/07_combinatorial_plan.md',
-        help='Output markdown file path (default: deliverables/07_combinatorial_plan.md)'
+        help='Output markdown file path (default: deliverables/07_combinatorial_plan.md, '
+             'or deliverables/07_coverage_analysis.md in analyze mode)'
     )
 
     parser.add_argument(
         '--mode', '-m',
-        choices=['select', 'generate'],
+        choices=['select', 'generate', 'analyze'],
         default='select',
-        help='Mode: "select" to choose from existing variants (default), "generate" to create new'
+        help='Mode: "select" to choose from existing variants (default), "generate" to create new, '
+             '"analyze" to measure the coverage of the input CSV as an executed test set'
+    )
+
+    parser.add_argument(
+        '--universe', '-u',
+        metavar='CSV',
+        help='Analyze mode: variants CSV defining the parameter space '
+             '(default: the values found in the input itself)'
+    )
+
+    parser.add_argument(
+        '--algorithm', '-a',
+        choices=['greedy', 'ipog', 'aetg'],
+        default='greedy',
+        help='Generate-mode algorithm: "greedy" scans the full Cartesian product (default), '
+             '"ipog" builds the plan one parameter at a time without materializing it, '
+             '"aetg" builds each row as the best of --candidates random rows'
+    )
+
+    parser.add_argument(
+        '--candidates',
+        type=int,
+        default=50,
+        metavar='K',
+        help='Random candidate rows built per plan row by --algorithm aetg (default: 50); '
+             'the random order comes from --seed'
+    )
+
+    parser.add_argument(
+        '--no-constructions',
+        action='store_true',
+        help='Generate mode: skip the orthogonal/covering-array constructions that are '
+             'otherwise tried before --algorithm'
+    )
+
+    parser.add_argument(
+        '--strength', '-t',
+        type=int,
+        default=2,
+        help='Interaction strength t to cover: 2 = pairwise (default), 3 = 3-way, 4 = 4-way'
+    )
+
+    parser.add_argument(
+        '--strength-group',
+        action='append',
+        default=[],
+        metavar='[T:]PARAMS',
+        help='Cover a comma-separated parameter sub-group at strength T (default: all of '
+             'them together) on top of --strength; repeatable. Groups whose parameters are '
+             'not in a model are skipped'
+    )
+
+    parser.add_argument(
+        '--selector',
+        choices=['lazy', 'incremental'],
+        default='lazy',
+        help='Greedy selection strategy: "lazy" CELF priority queue (default) or '
+             '"incremental" row-bitset gain updates; both select identical plans'
+    )
+
+    parser.add_argument(
+        '--constraints', '-c',
+        help='JSON file of forbidden combinations and implications to respect'
+    )
+
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Worker processes for greedy candidate scoring (default: 1, 0 = all CPUs); '
+             'results are identical to a single-process run'
+    )
+
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        default=0.0,
+        metavar='SECONDS',
+        help='Shrink the plan after construction for up to SECONDS (redundant-row '
+             'elimination, plus simulated annealing in generate mode); never reduces coverage'
+    )
+
+    parser.add_argument(
+        '--format',
+        default='md,json',
+        help='Comma-separated plan outputs: md (report), json and csv (sidecars next to the '
+             'report, e.g. combinatorial_plan.json). Default: md,json'
+    )
+
+    parser.add_argument(
+        '--restarts',
+        type=int,
+        default=1,
+        metavar='K',
+        help='Run K greedy passes with randomized tie-breaks (on --workers processes) and '
+             'keep the smallest plan (default: 1)'
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        metavar='S',
+        help='Tie-break seed of the first pass; pass k uses S+k and the kept seed is '
+             'recorded in the report (default: 0 = input order)'
+    )
+
+    parser.add_argument(
+        '--trace',
+        metavar='FILE',
+        help='Write a JSON trace of every selection/construction iteration '
+             '(tuples covered, candidates scored, seconds) to FILE; with --partition-by '
+             'or --scenarios-dir every partition/scenario gets its own trace, with '
+             '_<partition or scenario directory> appended to the FILE name'
+    )
+
+    parser.add_argument(
+        '--no-progress',
+        action='store_true',
+        help='Do not show progress (counters are still kept for --trace and the JSON sidecar)'
+    )
+
+    parser.add_argument(
+        '--partition-by',
+        metavar='COLUMN',
+        help='Split a combined variants file on COLUMN (e.g. Scenario_ID) and plan each '
+             'partition independently on a pool of --workers processes'
+    )
+
+    parser.add_argument(
+        '--augment',
+        metavar='PLAN',
+        help='Existing combinatorial plan (markdown or CSV) to keep; only the rows '
+             'needed for newly uncovered tuples are added'
     )
 
     parser.add_argument(
@@ -741,10 +4614,44 @@ Examples:
     )
 
     args = parser.parse_args()
+    if bool(args.input_file) == bool(args.scenarios_dir):
+        parser.error('give either an input file or --scenarios-dir')
 
     try:
-        generator = CombinatorialTestGenerator(mode=args.mode, verbose=args.verbose)
-        generator.process(args.input_file, args.output)
+        constraints = ConstraintSet.from_file(args.constraints) if args.constraints else None
+        strength_groups = [StrengthGroup.parse(spec) for spec in args.strength_group]
+        generator = CombinatorialTestGenerator(
+            mode=args.mode, verbose=args.verbose, algorithm=args.algorithm,
+            strength=args.strength, selector=args.selector, constraints=constraints,
+            workers=args.workers, time_budget=args.time_budget,
+            output_formats=[fmt.strip() for fmt in args.format.split(',') if fmt.strip()],
+            progress=not args.no_progress, restarts=args.restarts, seed=args.seed,
+            strength_groups=strength_groups, candidates=args.candidates,
+            constructions=not args.no_constructions,
+            instrumentation=TraceInstrumentation(
+                args.trace, interval=None if args.no_progress else 0.5
+            ) if args.trace else None
+        )
+        if args.scenarios_dir:
+            results = generator.process_batch(args.scenarios_dir)
+            failed = [path for path, stats in results.items() if stats is None]
+            planned = [stats for stats in results.values() if stats is not None]
+            print(f"\n{'='*60}")
+            print(f"✓ Planned {len(planned)}/{len(results)} scenarios in {args.scenarios_dir}")
+            print(f"  Test Cases: {sum(stats.test_cases_generated for stats in planned):,}")
+            for path in failed:
+                print(f"  ✗ Failed: {path}")
+            print(f"{'='*60}\n")
+            sys.exit(1 if failed else 0)
+
+        output = args.output or (
+            'deliverables/07_coverage_analysis.md' if args.mode == 'analyze'
+            else 'deliverables/07_combinatorial_plan.md'
+        )
+        generator.process(
+            args.input_file, output, augment=args.augment, universe=args.universe,
+            partition_by=args.partition_by
+        )
         sys.exit(0)
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user")
@@ -27,6 +27,8 @@ import sys
 from pathlib import Path
 from typing import Dict, Any
 
+from generate_variants import iter_variant_records, resolve_variants_file
+
 # Sample data pools
 FIRST_NAMES = ['John', 'Jane', 'Michael', 'Emily', 'David', 'Sarah', 'Robert', 'Lisa', 'James', 'Mary']
 LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez']
@@ -127,62 +129,49 @@ def generate_test_data_for_variants(
     Generate test data for all variants in a CSV file.
 
     Args:
-        variants_file: Input variants CSV file
+        variants_file: Input variants CSV file (or factorized variants.json)
         output_file: Output test data CSV file
         verbose: Enable verbose output
 
     Returns:
         Number of test data rows generated
     """
+    variants_file = resolve_variants_file(variants_file)
     if not variants_file.exists():
         raise FileNotFoundError(f"Variants file not found: {variants_file}")
 
     if verbose:
         print(f"Reading variants from {variants_file}...")
 
-    # Read variants
-    variants = []
-    with open(variants_file, 'r') as csvfile:
-        reader = csv.DictReader(csvfile)
-        variants = list(reader)
-
-    if verbose:
-        print(f"✓ Loaded {len(variants)} variants")
-        print(f"Generating test data...")
-
-    # Generate test data
-    test_data = []
-    for i, variant in enumerate(variants):
-        if verbose and (i + 1) % 5000 == 0:
-            print(f"  Progress: {i + 1}/{len(variants)} ({(i+1)/len(variants)*100:.1f}%)")
-        test_data.append(generate_test_data_row(variant))
+    # Stream variants (factorized files are joined back into full rows); each
+    # test data row is written as soon as it is generated
+    rows = map(generate_test_data_row, iter_variant_records(variants_file))
+    first = next(rows, None)
+    if first is None:
+        return 0
 
     # Ensure output directory exists
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write test data to CSV
     if verbose:
-        print(f"Writing test data to {output_file}...")
-
-    if test_data:
-        fieldnames = test_data[0].keys()
-        with open(output_file, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(test_data)
+        print(f"Generating test data into {output_file}...")
+
+    with open(output_file, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=first.keys())
+        writer.writeheader()
+        writer.writerow(first)
+        row_count = 1
+        for row in rows:
+            writer.writerow(row)
+            row_count += 1
+            if verbose and row_count % 5000 == 0:
+                print(f"  Progress: {row_count} rows")
 
-        if verbose:
-            print(f"✓ Generated test data for {len(test_data)} variants")
-            print(f"✓ Saved to {output_file}")
-
-        # Verification
-        if len(test_data) == len(variants):
-            if verbose:
-                print(f"✅ Verification PASSED: Row count matches ({len(test_data)} rows)")
-        else:
-            print(f"❌ Verification FAILED: Row count mismatch (expected {len(variants)}, got {len(test_data)})")
+    if verbose:
+        print(f"✓ Generated test data for {row_count} variants")
+        print(f"✓ Saved to {output_file}")
 
-    return len(test_data)
+    return row_count
 
 
 def main():
@@ -221,7 +210,7 @@ Examples:
         '--variants',
         type=Path,
         required=True,
-        help='Input variants CSV file'
+        help='Input variants CSV file (or factorized variants.json)'
     )
     parser.add_argument(
         '--output',
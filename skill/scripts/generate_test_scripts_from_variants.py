@@ -30,6 +30,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import time
 
+from generate_variants import iter_variant_records, resolve_variants_file
+
 
 @dataclass
 class TestScenario:
@@ -132,30 +134,27 @@ class TestScriptGenerator:
         self.logger.info(f"✓ Loaded {len(self.scenarios)} scenarios")
 
     def load_variants(self, variants_file: str):
-        """Load variants from CSV"""
+        """Load variants from CSV (factorized variants are joined on the fly)"""
         self.logger.info(f"Loading variants from {variants_file}")
 
-        with open(variants_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                variant_id = row.get('Variant_ID', '').strip()
-                scenario_id = row.get('Scenario_ID', '').strip()
+        for row in iter_variant_records(Path(variants_file)):
+            variant_id = row.get('Variant_ID', '').strip()
+            scenario_id = row.get('Scenario_ID', '').strip()
 
-                if not variant_id or not scenario_id:
-                    continue
+            if not variant_id or not scenario_id:
+                continue
 
-                # Get all parameters (exclude ID columns)
-                parameters = {
-                    k: v for k, v in row.items()
-                    if k not in ['Variant_ID', 'Scenario_ID']
-                }
+            # Get all parameters (exclude ID columns)
+            parameters = {
+                k: v for k, v in row.items()
+                if k not in ['Variant_ID', 'Scenario_ID']
+            }
 
-                self.variants[variant_id] = Variant(
-                    variant_id=variant_id,
-                    scenario_id=scenario_id,
-                    parameters=parameters
-                )
+            self.variants[variant_id] = Variant(
+                variant_id=variant_id,
+                scenario_id=scenario_id,
+                parameters=parameters
+            )
 
         self.logger.info(f"✓ Loaded {len(self.variants)} variants")
 
@@ -642,7 +641,7 @@ Examples:
     )
     parser.add_argument(
         'variants_file',
-        help='Path to variants CSV file (04_variants.csv)'
+        help='Path to variants CSV file (04_variants.csv, or a factorized variants.json)'
     )
     parser.add_argument(
         'test_data_file',
@@ -662,6 +661,7 @@ Examples:
     args = parser.parse_args()
 
     # Validate input files exist
+    args.variants_file = str(resolve_variants_file(Path(args.variants_file)))
     for file_path in [args.scenarios_file, args.variants_file, args.test_data_file]:
         if not Path(file_path).exists():
             print(f"ERROR: File not found: {file_path}", file=sys.stderr)
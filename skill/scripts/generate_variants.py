@@ -18,17 +18,25 @@ Usage:
     # Generate all scenarios (new architecture)
     python3 generate_variants.py --all --output-dir deliverables/scenarios
 
+    # Generate all scenarios on 8 processes
+    python3 generate_variants.py --all --output-dir deliverables/scenarios --workers 8
+
     # Legacy monolithic mode
     python3 generate_variants.py --monolithic --output deliverables/04_variants.csv
 """
 
 import csv
+import concurrent.futures
+import contextlib
+import hashlib
 import itertools
 import argparse
 import json
+import operator
+import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 
 # Global parameters applicable across scenarios
@@ -38,6 +46,28 @@ GLOBAL_PARAMS = {
     'Network_Speed': ['High', 'Medium', 'Low']
 }
 
+# Fixed leading columns of every variants CSV
+ID_COLUMNS = ['Scenario_ID', 'Variant_ID']
+
+# Write buffer for variants CSVs (bytes)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Bump when the files written for an unchanged definition change; every
+# scenario is then regenerated on the next run
+GENERATOR_VERSION = '2.0.0'
+
+# Definition hashes of the scenarios in an output directory, used to skip
+# scenarios that have not changed since they were last generated
+GENERATION_MANIFEST = 'variants_manifest.json'
+
+# Output formats: 'csv' writes the full Cartesian product to variants.csv;
+# 'factorized' writes the scenario-specific and global products to separate
+# CSVs plus a manifest, and readers join them on the fly
+OUTPUT_FORMATS = ['csv', 'factorized']
+VARIANTS_FILE = 'variants.csv'
+FACTORIZED_MANIFEST = 'variants.json'
+FACTOR_FILES = ['variants_scenario.csv', 'variants_global.csv']
+
 # Scenario definitions - extracted for configurability
 SCENARIO_DEFINITIONS = {
     'TS-001': {
@@ -489,6 +519,8 @@ class ScenarioMetrics:
     output_file: str = ""
     status: str = "success"
     error_message: str = ""
+    definition_hash: str = ""
+    unchanged: bool = False
 
 
 def generate_variants_for_scenario(
@@ -535,6 +567,172 @@ def generate_variants_for_scenario(
     return variants
 
 
+def variant_columns(param_sets: Iterable[Dict[str, List[str]]]) -> List[str]:
+    """
+    Column order of a variants CSV: the ID columns, then every parameter name in
+    sorted order.
+
+    Args:
+        param_sets: Parameter dictionaries whose names make up the columns
+
+    Returns:
+        List of column names
+    """
+    names = set()
+    for params in param_sets:
+        names.update(params)
+    return ID_COLUMNS + sorted(names - set(ID_COLUMNS))
+
+
+def iter_variant_rows(
+    scenario_id: str,
+    scenario_params: Dict[str, List[str]],
+    global_params: Optional[Dict[str, List[str]]] = None,
+    columns: Optional[List[str]] = None,
+    start: int = 1
+) -> Iterator[Tuple[str, ...]]:
+    """
+    Stream the variants of a scenario as CSV rows, straight from the Cartesian product.
+
+    Rows come out in the same order, with the same Variant_IDs, as
+    generate_variants_for_scenario(), but no per-variant dictionary is built.
+
+    Args:
+        scenario_id: e.g., "TS-001"
+        scenario_params: Scenario-specific parameters
+        global_params: Cross-cutting parameters (Browser, Device, etc.)
+        columns: Output column order (default: variant_columns() of this scenario);
+            columns the scenario does not have are filled with 'N/A'
+        start: Number of the first Variant_ID
+
+    Yields:
+        Row tuples in column order
+    """
+    if global_params is None:
+        global_params = GLOBAL_PARAMS
+
+    all_params = {**scenario_params, **global_params}
+    param_names = list(all_params.keys())
+    param_values = [all_params[name] for name in param_names]
+
+    if columns is None:
+        columns = variant_columns([all_params])
+
+    # Position of each parameter column in a product tuple; absent columns point
+    # one past the end, where an 'N/A' is appended
+    missing = len(param_names)
+    positions = [param_names.index(col) if col in all_params else missing
+                 for col in columns[len(ID_COLUMNS):]]
+    pad = ('N/A',) if missing in positions else ()
+
+    if len(positions) == 1:
+        position = positions[0]
+        pick = lambda combination: (combination[position],)
+    else:
+        pick = operator.itemgetter(*positions)
+
+    for number, combination in enumerate(itertools.product(*param_values), start):
+        yield (scenario_id, f'V{number:05d}') + pick(combination + pad)
+
+
+def scenario_parameters(
+    scenario_id: str,
+    global_params: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, List[str]]:
+    """
+    Parameters of a scenario in Cartesian product order (scenario-specific, then global).
+
+    Args:
+        scenario_id: e.g., "TS-001"
+        global_params: Cross-cutting parameters (Browser, Device, etc.)
+
+    Returns:
+        Dictionary of parameter name to values
+    """
+    if scenario_id not in SCENARIO_DEFINITIONS:
+        raise ValueError(f"Scenario {scenario_id} not found in definitions")
+    if global_params is None:
+        global_params = GLOBAL_PARAMS
+    return {**SCENARIO_DEFINITIONS[scenario_id]['params'], **global_params}
+
+
+def decode_variant_id(
+    scenario_id: str,
+    variant_id: str,
+    global_params: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, str]:
+    """
+    Parameter values of a variant, decoded from its Variant_ID without reading a CSV.
+
+    A Variant_ID is the 1-based position of the variant in the scenario's
+    Cartesian product, i.e. a mixed-radix number whose last parameter is the
+    least significant digit. Decoding takes O(P) for P parameters.
+
+    Args:
+        scenario_id: e.g., "TS-001"
+        variant_id: Per-scenario Variant_ID, e.g. "V00042" (monolithic IDs are
+            numbered across scenarios and do not decode)
+        global_params: Cross-cutting parameters (Browser, Device, etc.)
+
+    Returns:
+        Dictionary of parameter name to value, in product order
+    """
+    all_params = scenario_parameters(scenario_id, global_params)
+    count = calculate_expected_variant_count(all_params, {})
+
+    digits = variant_id[1:] if variant_id[:1] in ('V', 'v') else variant_id
+    if not digits.isdigit() or not 1 <= int(digits) <= count:
+        raise ValueError(
+            f"Invalid Variant_ID {variant_id!r} for {scenario_id} (V00001-V{count:05d})"
+        )
+
+    index = int(digits) - 1
+    values = {}
+    for name in reversed(list(all_params)):
+        index, digit = divmod(index, len(all_params[name]))
+        values[name] = all_params[name][digit]
+
+    return {name: values[name] for name in all_params}
+
+
+def encode_variant_id(
+    scenario_id: str,
+    values: Dict[str, str],
+    global_params: Optional[Dict[str, List[str]]] = None
+) -> str:
+    """
+    Variant_ID of the variant with the given parameter values (inverse of decode_variant_id()).
+
+    Args:
+        scenario_id: e.g., "TS-001"
+        values: Value of every scenario parameter; ID columns and 'N/A' entries
+            for other parameters (as in a monolithic CSV row) are ignored
+        global_params: Cross-cutting parameters (Browser, Device, etc.)
+
+    Returns:
+        Variant_ID, e.g. "V00042"
+    """
+    all_params = scenario_parameters(scenario_id, global_params)
+
+    unknown = [name for name, value in values.items()
+               if name not in all_params and name not in ID_COLUMNS and value != 'N/A']
+    if unknown:
+        raise ValueError(f"Unknown parameters for {scenario_id}: {', '.join(unknown)}")
+    missing = [name for name in all_params if name not in values]
+    if missing:
+        raise ValueError(f"Missing parameters for {scenario_id}: {', '.join(missing)}")
+
+    index = 0
+    for name, options in all_params.items():
+        if values[name] not in options:
+            raise ValueError(
+                f"Invalid value {values[name]!r} for {name} (expected one of: {', '.join(options)})"
+            )
+        index = index * len(options) + options.index(values[name])
+
+    return f'V{index + 1:05d}'
+
+
 def calculate_expected_variant_count(
     scenario_params: Dict[str, List[str]],
     global_params: Optional[Dict[str, List[str]]] = None
@@ -552,11 +750,46 @@ def calculate_expected_variant_count(
     return count
 
 
+def write_variant_rows(
+    rows: Iterable[Sequence[str]],
+    columns: List[str],
+    output_file: Path
+) -> int:
+    """
+    Stream variant rows to a CSV file through a buffered csv.writer.
+
+    Args:
+        rows: Row sequences in column order (e.g. from iter_variant_rows())
+        columns: Header row
+        output_file: Path to output CSV
+
+    Returns:
+        Number of rows written
+    """
+    # Ensure output directory exists
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # zip() draws from the counter only after a row, so the counter ends at the
+    # number of rows written without a Python-level loop
+    counter = itertools.count()
+    with open(output_file, 'w', newline='', buffering=CSV_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(columns)
+        writer.writerows(map(operator.itemgetter(0), zip(rows, counter)))
+
+    count = next(counter)
+    if count == 0:
+        output_file.unlink()
+        raise ValueError("No variants to write")
+
+    return count
+
+
 def write_variants_to_csv(
     variants: List[Dict[str, Any]],
     output_file: Path
 ) -> None:
-    """Write variants to CSV file"""
+    """Write variant dictionaries to CSV file (see write_variant_rows() for streaming)"""
     if not variants:
         raise ValueError("No variants to write")
 
@@ -583,6 +816,160 @@ def write_variants_to_csv(
             writer.writerow(row)
 
 
+def write_factorized_variants(
+    scenario_id: str,
+    scenario_params: Dict[str, List[str]],
+    global_params: Optional[Dict[str, List[str]]] = None,
+    output_dir: Path = Path('.')
+) -> Tuple[Path, int]:
+    """
+    Write a scenario's variants in factorized form.
+
+    The scenario-specific product and the global product are written to
+    separate CSVs (one column per parameter, no IDs), and variants.json records
+    how to join them. The logical rows are the Cartesian product of the factor
+    rows, first factor outermost - the same rows and Variant_IDs as
+    variants.csv, read back with iter_variant_records().
+
+    Args:
+        scenario_id: e.g., "TS-001"
+        scenario_params: Scenario-specific parameters
+        global_params: Cross-cutting parameters (Browser, Device, etc.)
+        output_dir: Scenario directory
+
+    Returns:
+        Tuple of (manifest path, logical variant count)
+    """
+    if global_params is None:
+        global_params = GLOBAL_PARAMS
+
+    all_params = {**scenario_params, **global_params}
+    names = list(all_params.keys())
+
+    # Global parameters trail the product order unless a scenario overrides
+    # one of them; then everything goes in a single factor
+    split = len(names) - len(global_params)
+    if global_params and split > 0 and names[split:] == list(global_params):
+        groups = [names[:split], names[split:]]
+    else:
+        groups = [names]
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    factors = []
+    for file_name, group in zip(FACTOR_FILES, groups):
+        rows = itertools.product(*(all_params[name] for name in group))
+        count = write_variant_rows(rows, group, output_dir / file_name)
+        factors.append({'file': file_name, 'rows': count})
+
+    variant_count = 1
+    for factor in factors:
+        variant_count *= factor['rows']
+
+    manifest = {
+        'format': 'factorized',
+        'scenario_id': scenario_id,
+        'columns': variant_columns([all_params]),
+        'factors': factors,
+        'variant_count': variant_count
+    }
+    manifest_file = output_dir / FACTORIZED_MANIFEST
+    with open(manifest_file, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest_file, variant_count
+
+
+def resolve_variants_file(variants_file: Path) -> Path:
+    """
+    Path to read a scenario's variants from: the CSV itself, or the factorized
+    manifest next to it (variants.json for variants.csv) when only that exists.
+    """
+    variants_file = Path(variants_file)
+    if not variants_file.exists() and variants_file.suffix == '.csv':
+        manifest_file = variants_file.with_suffix('.json')
+        if manifest_file.exists():
+            return manifest_file
+    return variants_file
+
+
+def _load_manifest(manifest_file: Path) -> Dict[str, Any]:
+    """Load and check a factorized variants manifest"""
+    with open(manifest_file) as f:
+        manifest = json.load(f)
+    if manifest.get('format') != 'factorized':
+        raise ValueError(f"Not a factorized variants manifest: {manifest_file}")
+    return manifest
+
+
+def read_variant_columns(variants_file: Path) -> List[str]:
+    """
+    Column names of a variants file (CSV header or factorized manifest).
+
+    Args:
+        variants_file: variants.csv, variants.json, or a variants.csv path that
+            was written in factorized form
+
+    Returns:
+        List of column names, ID columns first
+    """
+    path = resolve_variants_file(variants_file)
+    if path.suffix == '.json':
+        return list(_load_manifest(path)['columns'])
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return next(csv.reader(f), [])
+
+
+def iter_variant_records(variants_file: Path) -> Iterator[Dict[str, str]]:
+    """
+    Iterate the variants of a file as dictionaries, like csv.DictReader.
+
+    A factorized manifest is joined lazily: the first (scenario) factor is
+    streamed and only the inner factors are held in memory, so readers see the
+    same rows, column order and Variant_IDs as the equivalent variants.csv.
+
+    Args:
+        variants_file: variants.csv, variants.json, or a variants.csv path that
+            was written in factorized form
+
+    Yields:
+        Row dictionaries keyed by column name
+    """
+    path = resolve_variants_file(variants_file)
+    if path.suffix != '.json':
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.DictReader(f)
+        return
+
+    manifest = _load_manifest(path)
+    scenario_id = manifest['scenario_id']
+    columns = manifest['columns']
+
+    with contextlib.ExitStack() as stack:
+        readers = []
+        for factor in manifest['factors']:
+            f = stack.enter_context(open(path.parent / factor['file'], 'r',
+                                         encoding='utf-8', newline=''))
+            readers.append(csv.reader(f))
+        headers = [next(reader) for reader in readers]
+
+        # Parameter values of a joined row, in output column order
+        names = [name for header in headers for name in header]
+        positions = [names.index(col) for col in columns[len(ID_COLUMNS):]]
+        if len(positions) == 1:
+            position = positions[0]
+            pick = lambda values: (values[position],)
+        else:
+            pick = operator.itemgetter(*positions)
+
+        inner = [[tuple(row) for row in reader] for reader in readers[1:]]
+        number = 0
+        for outer in readers[0]:
+            for parts in itertools.product(*inner):
+                number += 1
+                values = tuple(outer) + sum(parts, ())
+                yield dict(zip(columns, (scenario_id, f'V{number:05d}') + pick(values)))
+
+
 def save_scenario_metrics(
     metrics: ScenarioMetrics,
     output_dir: Path
@@ -605,6 +992,92 @@ def save_scenario_metrics(
         json.dump(metrics_dict, f, indent=2)
 
 
+def load_scenario_metrics(scenario_dir: Path) -> Optional[ScenarioMetrics]:
+    """Load a scenario's metrics.json (None if it is missing or unreadable)"""
+    metrics_file = scenario_dir / 'metrics.json'
+    try:
+        with open(metrics_file) as f:
+            return ScenarioMetrics(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def scenario_definition_hash(scenario_id: str, output_format: str = 'csv') -> str:
+    """
+    Content hash of everything a scenario's output depends on.
+
+    Covers the title (folder name and metrics), the parameters merged with
+    GLOBAL_PARAMS in product order, the output format and GENERATOR_VERSION.
+
+    Args:
+        scenario_id: e.g., "TS-001"
+        output_format: 'csv' or 'factorized'
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    definition = [
+        GENERATOR_VERSION,
+        output_format,
+        scenario_id,
+        SCENARIO_DEFINITIONS[scenario_id]['title'],
+        list(scenario_parameters(scenario_id).items())
+    ]
+    return hashlib.sha256(json.dumps(definition).encode('utf-8')).hexdigest()
+
+
+def load_generation_manifest(output_base_dir: Path) -> Dict[str, str]:
+    """
+    Definition hashes recorded by the last run in an output directory.
+
+    Args:
+        output_base_dir: Base directory for scenarios
+
+    Returns:
+        Dictionary of scenario ID to definition hash (empty if there is no
+        manifest or it was written by another GENERATOR_VERSION)
+    """
+    try:
+        with open(output_base_dir / GENERATION_MANIFEST) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('generator_version') != GENERATOR_VERSION:
+        return {}
+    return dict(manifest.get('scenarios', {}))
+
+
+def update_generation_manifest(
+    output_base_dir: Path,
+    all_metrics: List[ScenarioMetrics]
+) -> None:
+    """
+    Record the definition hashes of generated scenarios in the manifest.
+
+    Entries of other scenarios are kept. The file is replaced atomically so an
+    interrupted run never leaves a half-written manifest.
+
+    Args:
+        output_base_dir: Base directory for scenarios
+        all_metrics: Metrics of the scenarios generated (or skipped) by this run
+    """
+    hashes = load_generation_manifest(output_base_dir)
+    for metrics in all_metrics:
+        if metrics.definition_hash:
+            hashes[metrics.scenario_id] = metrics.definition_hash
+
+    manifest = {
+        'generator_version': GENERATOR_VERSION,
+        'scenarios': dict(sorted(hashes.items()))
+    }
+    output_base_dir.mkdir(parents=True, exist_ok=True)
+    manifest_file = output_base_dir / GENERATION_MANIFEST
+    temp_file = manifest_file.with_name(f'{manifest_file.name}.{os.getpid()}.tmp')
+    with open(temp_file, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_file, manifest_file)
+
+
 def sanitize_folder_name(title: str) -> str:
     """Convert scenario title to safe folder name"""
     # Replace spaces and special characters
@@ -616,7 +1089,9 @@ def sanitize_folder_name(title: str) -> str:
 def generate_single_scenario(
     scenario_id: str,
     output_base_dir: Path,
-    verbose: bool = False
+    verbose: bool = False,
+    output_format: str = 'csv',
+    previous_hash: Optional[str] = None
 ) -> ScenarioMetrics:
     """
     Generate variants for a single scenario.
@@ -625,6 +1100,11 @@ def generate_single_scenario(
         scenario_id: e.g., "TS-001"
         output_base_dir: Base directory for scenarios
         verbose: Enable verbose output
+        output_format: 'csv' (variants.csv) or 'factorized' (variants.json plus
+            factor CSVs, see write_factorized_variants())
+        previous_hash: Definition hash from the generation manifest; if it still
+            matches and the outputs exist, nothing is written and the saved
+            metrics are returned with ``unchanged`` set
 
     Returns:
         ScenarioMetrics object
@@ -639,6 +1119,20 @@ def generate_single_scenario(
     # Create scenario directory
     folder_name = f"{scenario_id}_{sanitize_folder_name(scenario_title)}"
     scenario_dir = output_base_dir / folder_name
+    definition_hash = scenario_definition_hash(scenario_id, output_format)
+
+    # Skip unchanged scenarios, leaving their files (and timestamps) untouched
+    if previous_hash == definition_hash:
+        output_names = [FACTORIZED_MANIFEST] + FACTOR_FILES if output_format == 'factorized' \
+            else [VARIANTS_FILE]
+        metrics = load_scenario_metrics(scenario_dir)
+        if metrics and all((scenario_dir / name).exists() for name in output_names):
+            metrics.definition_hash = definition_hash
+            metrics.unchanged = True
+            if verbose:
+                print(f"\n[{scenario_id}] Unchanged, skipped ({metrics.variant_count:,} variants)")
+            return metrics
+
     scenario_dir.mkdir(parents=True, exist_ok=True)
 
     if verbose:
@@ -650,18 +1144,28 @@ def generate_single_scenario(
     if verbose:
         print(f"[{scenario_id}] Expected variants: {expected_count:,}")
 
-    # Generate variants
-    variants = generate_variants_for_scenario(scenario_id, scenario_params, GLOBAL_PARAMS)
+    if output_format == 'factorized':
+        output_file, actual_count = write_factorized_variants(
+            scenario_id, scenario_params, GLOBAL_PARAMS, scenario_dir
+        )
+        stale_files = [VARIANTS_FILE]
+    else:
+        # Stream variants straight into the CSV
+        output_file = scenario_dir / VARIANTS_FILE
+        columns = variant_columns([scenario_params, GLOBAL_PARAMS])
+        rows = iter_variant_rows(scenario_id, scenario_params, GLOBAL_PARAMS, columns)
+        actual_count = write_variant_rows(rows, columns, output_file)
+        stale_files = [FACTORIZED_MANIFEST] + FACTOR_FILES
+
+    # Drop output of the other format so readers cannot pick up old variants
+    for file_name in stale_files:
+        if (scenario_dir / file_name).exists():
+            (scenario_dir / file_name).unlink()
 
     # Verify count
-    actual_count = len(variants)
     if actual_count != expected_count:
         print(f"WARNING: Expected {expected_count} variants but generated {actual_count}")
 
-    # Write to CSV
-    output_file = scenario_dir / 'variants.csv'
-    write_variants_to_csv(variants, output_file)
-
     if verbose:
         print(f"[{scenario_id}] ✓ Generated {actual_count:,} variants → {output_file}")
 
@@ -679,7 +1183,8 @@ def generate_single_scenario(
         expected_variant_count=expected_count,
         parameters=param_stats,
         output_file=str(output_file),
-        status="success"
+        status="success",
+        definition_hash=definition_hash
     )
 
     # Save metrics
@@ -688,6 +1193,89 @@ def generate_single_scenario(
     return metrics
 
 
+def _generate_scenario_job(
+    scenario_id: str,
+    output_base_dir: Path,
+    verbose: bool,
+    output_format: str,
+    previous_hash: Optional[str]
+) -> Tuple[str, Optional[ScenarioMetrics], str]:
+    """Generate one scenario in a worker process; errors are returned, not raised"""
+    try:
+        metrics = generate_single_scenario(scenario_id, output_base_dir, verbose, output_format,
+                                           previous_hash)
+        return scenario_id, metrics, ""
+    except Exception as e:
+        return scenario_id, None, str(e)
+
+
+def generate_all_scenarios(
+    output_base_dir: Path,
+    workers: int = 1,
+    verbose: bool = False,
+    output_format: str = 'csv',
+    force: bool = False
+) -> List[ScenarioMetrics]:
+    """
+    Generate every scenario in SCENARIO_DEFINITIONS, optionally on a process pool.
+
+    Scenarios are independent and write to their own folders, so they run
+    concurrently; the metrics come back in scenario order whatever the
+    completion order, so summaries match a sequential run. Scenarios whose
+    definition hash matches the generation manifest are skipped unless
+    ``force`` is set, and the manifest is updated afterwards.
+
+    Args:
+        output_base_dir: Base directory for scenarios
+        workers: Worker processes (1 = in-process, 0 = one per CPU)
+        verbose: Enable verbose output
+        output_format: 'csv' or 'factorized' (see generate_single_scenario())
+        force: Regenerate every scenario, ignoring the generation manifest
+
+    Returns:
+        ScenarioMetrics of the scenarios that succeeded, sorted by scenario ID
+    """
+    scenario_ids = sorted(SCENARIO_DEFINITIONS.keys())
+    total = len(scenario_ids)
+    workers = workers if workers > 0 else (os.cpu_count() or 1)
+    previous_hashes = {} if force else load_generation_manifest(output_base_dir)
+    results: Dict[str, ScenarioMetrics] = {}
+
+    def collect(idx: int, scenario_id: str, metrics: Optional[ScenarioMetrics], error: str):
+        if error:
+            print(f"ERROR processing {scenario_id}: {error}")
+            # Continue with other scenarios
+        else:
+            results[scenario_id] = metrics
+
+        # Progress update
+        if not verbose and idx % 10 == 0:
+            print(f"Progress: {idx}/{total} scenarios ({idx/total*100:.1f}%)")
+
+    if workers == 1:
+        for idx, scenario_id in enumerate(scenario_ids, 1):
+            collect(idx, *_generate_scenario_job(scenario_id, output_base_dir, verbose,
+                                                 output_format, previous_hashes.get(scenario_id)))
+    else:
+        # Largest scenarios first so the pool does not finish on a long straggler
+        order = sorted(
+            scenario_ids,
+            key=lambda sid: -calculate_expected_variant_count(SCENARIO_DEFINITIONS[sid]['params'])
+        )
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_generate_scenario_job, scenario_id, output_base_dir, verbose,
+                            output_format, previous_hashes.get(scenario_id))
+                for scenario_id in order
+            ]
+            for idx, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                collect(idx, *future.result())
+
+    all_metrics = [results[scenario_id] for scenario_id in scenario_ids if scenario_id in results]
+    update_generation_manifest(output_base_dir, all_metrics)
+    return all_metrics
+
+
 def generate_monolithic(output_file: Path, verbose: bool = False) -> int:
     """
     Generate all variants in one monolithic CSV (legacy mode).
@@ -701,37 +1289,42 @@ def generate_monolithic(output_file: Path, verbose: bool = False) -> int:
     """
     print("Generating variants in MONOLITHIC mode (legacy)...")
 
-    all_variants = []
-    variant_id_counter = 1
-
-    for scenario_id in sorted(SCENARIO_DEFINITIONS.keys()):
-        scenario_def = SCENARIO_DEFINITIONS[scenario_id]
-
-        if verbose:
-            print(f"Processing {scenario_id}: {scenario_def['title']}")
-
-        # Generate variants for this scenario
-        variants = generate_variants_for_scenario(
-            scenario_id,
-            scenario_def['params'],
-            GLOBAL_PARAMS
-        )
+    scenario_ids = sorted(SCENARIO_DEFINITIONS.keys())
 
-        # Reassign global variant IDs
-        for v in variants:
-            v['Variant_ID'] = f'V{variant_id_counter:05d}'
-            variant_id_counter += 1
+    # The column union is known from the definitions, so rows can be streamed
+    columns = variant_columns(
+        [SCENARIO_DEFINITIONS[scenario_id]['params'] for scenario_id in scenario_ids]
+        + [GLOBAL_PARAMS]
+    )
 
-        all_variants.extend(variants)
+    def all_rows() -> Iterator[Tuple[str, ...]]:
+        # Variant IDs continue across scenarios
+        variant_id_counter = 1
+        for scenario_id in scenario_ids:
+            scenario_def = SCENARIO_DEFINITIONS[scenario_id]
+
+            if verbose:
+                print(f"Processing {scenario_id}: {scenario_def['title']}")
+
+            yield from iter_variant_rows(
+                scenario_id,
+                scenario_def['params'],
+                GLOBAL_PARAMS,
+                columns,
+                start=variant_id_counter
+            )
+            variant_id_counter += calculate_expected_variant_count(
+                scenario_def['params'], GLOBAL_PARAMS
+            )
 
     # Write all variants to one file
-    write_variants_to_csv(all_variants, output_file)
+    total_variants = write_variant_rows(all_rows(), columns, output_file)
 
-    print(f"\n✓ Generated {len(all_variants):,} variants in monolithic file")
+    print(f"\n✓ Generated {total_variants:,} variants in monolithic file")
     print(f"✓ Saved to {output_file}")
-    print(f"✓ Variants per scenario: {len(all_variants) / len(SCENARIO_DEFINITIONS):.1f} average")
+    print(f"✓ Variants per scenario: {total_variants / len(SCENARIO_DEFINITIONS):.1f} average")
 
-    return len(all_variants)
+    return total_variants
 
 
 def main():
@@ -750,8 +1343,22 @@ Examples:
   # Generate all scenarios (new architecture)
   python3 generate_variants.py --all --output-dir deliverables/scenarios
 
+  # Generate all scenarios on 8 processes (0 = one per CPU)
+  python3 generate_variants.py --all --output-dir deliverables/scenarios --workers 8
+
+  # Factorized storage: scenario and global products joined on read (~36x smaller)
+  python3 generate_variants.py --all --output-dir deliverables/scenarios --format factorized
+
+  # Unchanged scenarios are skipped on reruns; --force regenerates everything
+  python3 generate_variants.py --all --output-dir deliverables/scenarios --force
+
   # Legacy monolithic mode
   python3 generate_variants.py --monolithic --output deliverables/04_variants.csv
+
+  # Look up a variant without reading variants.csv
+  python3 generate_variants.py --scenario TS-001 --decode V00042
+  python3 generate_variants.py --scenario TS-045 --encode User_Type=Buyer \\
+      Social_Platform=Twitter Browser=Safari Device=Mobile Network_Speed=Low
         """
     )
 
@@ -789,6 +1396,44 @@ Examples:
         help='Output file for monolithic mode (default: deliverables/04_variants.csv)'
     )
 
+    parser.add_argument(
+        '--format',
+        choices=OUTPUT_FORMATS,
+        default='csv',
+        help='Per-scenario output: csv (full variants.csv) or factorized (scenario and '
+             'global products stored separately, joined on read; default: csv)'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Worker processes for --all (default: 1, 0 = all CPUs); '
+             'totals are identical to a sequential run'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help=f'Regenerate every requested scenario, even if its definition hash matches '
+             f'{GENERATION_MANIFEST} in the output directory'
+    )
+
+    # Variant lookup (with --scenario)
+    lookup_group = parser.add_mutually_exclusive_group()
+    lookup_group.add_argument(
+        '--decode',
+        metavar='VARIANT_ID',
+        help='Print the parameter values of a --scenario Variant_ID (e.g., V00042) '
+             'instead of generating'
+    )
+    lookup_group.add_argument(
+        '--encode',
+        nargs='+',
+        metavar='PARAM=VALUE',
+        help='Print the Variant_ID of the --scenario variant with these parameter values '
+             'instead of generating'
+    )
+
     # Other options
     parser.add_argument(
         '-v', '--verbose',
@@ -798,64 +1443,93 @@ Examples:
 
     args = parser.parse_args()
 
+    if (args.decode or args.encode) and not args.scenario:
+        parser.error('--decode and --encode require --scenario')
+    if args.monolithic and args.format != 'csv':
+        parser.error('--format factorized applies to per-scenario output, not --monolithic')
+
     try:
-        if args.monolithic:
+        if args.decode:
+            values = decode_variant_id(args.scenario, args.decode)
+            print(f"Scenario_ID: {args.scenario}")
+            print(f"Variant_ID: {encode_variant_id(args.scenario, values)}")
+            for name, value in values.items():
+                print(f"{name}: {value}")
+
+        elif args.encode:
+            values = {}
+            for pair in args.encode:
+                name, sep, value = pair.partition('=')
+                if not sep:
+                    raise ValueError(f"Expected PARAM=VALUE, got {pair!r}")
+                values[name.strip()] = value.strip()
+            print(encode_variant_id(args.scenario, values))
+
+        elif args.monolithic:
             # Legacy monolithic mode
             output_file = args.output or Path('deliverables/04_variants.csv')
             generate_monolithic(output_file, args.verbose)
 
         elif args.scenario:
             # Single scenario
-            metrics = generate_single_scenario(args.scenario, args.output_dir, args.verbose)
-            print(f"\n✓ Generated {metrics.variant_count:,} variants for {args.scenario}")
+            previous_hashes = {} if args.force else load_generation_manifest(args.output_dir)
+            metrics = generate_single_scenario(args.scenario, args.output_dir, args.verbose,
+                                               args.format, previous_hashes.get(args.scenario))
+            update_generation_manifest(args.output_dir, [metrics])
+            if metrics.unchanged:
+                print(f"\n✓ {args.scenario} unchanged ({metrics.variant_count:,} variants), "
+                      f"skipped (use --force to regenerate)")
+            else:
+                print(f"\n✓ Generated {metrics.variant_count:,} variants for {args.scenario}")
             print(f"  Output: {metrics.output_file}")
 
         elif args.scenarios:
             # Multiple specific scenarios
             scenario_list = [s.strip() for s in args.scenarios.split(',')]
             all_metrics = []
+            previous_hashes = {} if args.force else load_generation_manifest(args.output_dir)
 
             for scenario_id in scenario_list:
                 try:
-                    metrics = generate_single_scenario(scenario_id, args.output_dir, args.verbose)
+                    metrics = generate_single_scenario(scenario_id, args.output_dir,
+                                                       args.verbose, args.format,
+                                                       previous_hashes.get(scenario_id))
                     all_metrics.append(metrics)
                 except Exception as e:
                     print(f"ERROR processing {scenario_id}: {e}")
 
+            update_generation_manifest(args.output_dir, all_metrics)
+
             # Summary
             total_variants = sum(m.variant_count for m in all_metrics)
+            unchanged = sum(1 for m in all_metrics if m.unchanged)
             print(f"\n{'='*60}")
             print(f"SUMMARY: Generated {total_variants:,} variants across {len(all_metrics)} scenarios")
+            if unchanged:
+                print(f"  Unchanged (skipped): {unchanged}")
             print(f"{'='*60}")
 
         elif args.all:
             # All scenarios
-            all_metrics = []
-            total_variants = 0
-
             print(f"Generating all {len(SCENARIO_DEFINITIONS)} scenarios...")
             print(f"Output directory: {args.output_dir}")
+            if args.workers != 1:
+                print(f"Workers: {args.workers or os.cpu_count()}")
             print(f"{'='*60}\n")
 
-            for idx, scenario_id in enumerate(sorted(SCENARIO_DEFINITIONS.keys()), 1):
-                try:
-                    metrics = generate_single_scenario(scenario_id, args.output_dir, args.verbose)
-                    all_metrics.append(metrics)
-                    total_variants += metrics.variant_count
-
-                    # Progress update
-                    if not args.verbose and idx % 10 == 0:
-                        print(f"Progress: {idx}/{len(SCENARIO_DEFINITIONS)} scenarios ({idx/len(SCENARIO_DEFINITIONS)*100:.1f}%)")
-
-                except Exception as e:
-                    print(f"ERROR processing {scenario_id}: {e}")
-                    # Continue with other scenarios
+            all_metrics = generate_all_scenarios(args.output_dir, args.workers, args.verbose,
+                                                 args.format, args.force)
+            total_variants = sum(m.variant_count for m in all_metrics)
+            unchanged = sum(1 for m in all_metrics if m.unchanged)
 
             # Final summary
             print(f"\n{'='*60}")
             print(f"VARIANT GENERATION COMPLETE")
             print(f"{'='*60}")
             print(f"  Total Scenarios: {len(all_metrics)}")
+            if unchanged:
+                print(f"  Regenerated: {len(all_metrics) - unchanged} "
+                      f"(unchanged, skipped: {unchanged})")
             print(f"  Total Variants: {total_variants:,}")
             print(f"  Avg Variants per Scenario: {total_variants / len(all_metrics):.1f}")
 
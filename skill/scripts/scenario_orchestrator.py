@@ -38,6 +38,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import time
 
+from generate_variants import resolve_variants_file
+
 @dataclass
 class StepResult:
     """Result from executing a step"""
@@ -173,7 +175,7 @@ class ScenarioOrchestrator:
                 step_name="variants",
                 status="success",
                 duration=duration,
-                output_file=str(scenario_dir / 'variants.csv'),
+                output_file=str(resolve_variants_file(scenario_dir / 'variants.csv')),
                 metrics=metrics
             )
         else:
@@ -201,7 +203,7 @@ class ScenarioOrchestrator:
         """
         start_time = time.time()
 
-        variants_file = scenario_dir / 'variants.csv'
+        variants_file = resolve_variants_file(scenario_dir / 'variants.csv')
         if not variants_file.exists():
             return StepResult(
                 step_name="test-data",
@@ -269,7 +271,7 @@ class ScenarioOrchestrator:
         """
         start_time = time.time()
 
-        variants_file = scenario_dir / 'variants.csv'
+        variants_file = resolve_variants_file(scenario_dir / 'variants.csv')
         test_data_file = scenario_dir / 'test_data.csv'
         scripts_dir = scenario_dir / 'scripts'
 
@@ -355,8 +357,9 @@ class ScenarioOrchestrator:
         """
         start_time = time.time()
 
-        variants_file = scenario_dir / 'variants.csv'
+        variants_file = resolve_variants_file(scenario_dir / 'variants.csv')
         combo_file = scenario_dir / 'combinatorial_plan.md'
+        combo_json = scenario_dir / 'combinatorial_plan.json'
 
         if not variants_file.exists():
             return StepResult(
@@ -384,17 +387,25 @@ class ScenarioOrchestrator:
         duration = time.time() - start_time
 
         if returncode == 0:
-            # Extract coverage stats from output
+            # Extract coverage stats from the JSON sidecar, or the markdown report
             metrics = {}
-            if combo_file.exists():
+            if combo_json.exists():
+                try:
+                    with open(combo_json) as f:
+                        stats = json.load(f)['stats']
+                        metrics['coverage_pct'] = f"{stats['coverage_percentage']:.2f}%"
+                        metrics['optimized_count'] = str(stats['test_cases_generated'])
+                except Exception as e:
+                    self.log(f"Error loading combinatorial plan for {scenario_id}: {e}", "WARN")
+            if not metrics and combo_file.exists():
                 with open(combo_file) as f:
                     content = f.read()
                     # Parse stats from markdown
                     for line in content.split('\n'):
                         if 'Coverage Percentage:' in line:
-                            metrics['coverage_pct'] = line.split(':')[1].strip()
+                            metrics['coverage_pct'] = line.split(':', 1)[1].strip(' *')
                         elif 'Test Cases Generated:' in line:
-                            metrics['optimized_count'] = line.split(':')[1].strip()
+                            metrics['optimized_count'] = line.split(':', 1)[1].strip(' *')
 
             return StepResult(
                 step_name="combinatorial",
@@ -37,6 +37,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import re
 
+from generate_variants import iter_variant_records, resolve_variants_file
+
 
 @dataclass
 class ScenarioSummary:
@@ -144,9 +146,18 @@ class SummaryAggregator:
         if scripts_dir.exists():
             summary.script_count = len(list(scripts_dir.glob('*.txt')))
 
-        # Parse combinatorial plan
+        # Load combinatorial plan stats (JSON sidecar, else parse the markdown)
+        combo_json = scenario_dir / 'combinatorial_plan.json'
         combo_file = scenario_dir / 'combinatorial_plan.md'
-        if combo_file.exists():
+        if combo_json.exists():
+            try:
+                with open(combo_json) as f:
+                    stats = json.load(f)['stats']
+                    summary.coverage_pct = round(stats['coverage_percentage'], 2)
+                    summary.optimized_count = stats['test_cases_generated']
+            except Exception as e:
+                self.log(f"Error loading combinatorial plan for {scenario_id}: {e}", "WARN")
+        elif combo_file.exists():
             try:
                 with open(combo_file) as f:
                     content = f.read()
@@ -301,17 +312,16 @@ class SummaryAggregator:
         variant_id_counter = 1
 
         for scenario in sorted(self.scenarios, key=lambda s: s.scenario_id):
-            variants_file = scenario.scenario_dir / 'variants.csv'
+            variants_file = resolve_variants_file(scenario.scenario_dir / 'variants.csv')
             if not variants_file.exists():
                 continue
 
-            with open(variants_file) as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Reassign global variant ID
-                    row['Variant_ID'] = f'V{variant_id_counter:05d}'
-                    variant_id_counter += 1
-                    all_variants.append(row)
+            # Factorized scenarios are joined back into full rows
+            for row in iter_variant_records(variants_file):
+                # Reassign global variant ID
+                row['Variant_ID'] = f'V{variant_id_counter:05d}'
+                variant_id_counter += 1
+                all_variants.append(row)
 
         if all_variants:
             # Write combined CSV
@@ -23,6 +23,8 @@ from pathlib import Path
 from typing import Dict, List, Set, Tuple
 from collections import defaultdict
 
+from generate_variants import iter_variant_records, read_variant_columns, resolve_variants_file
+
 
 class TestDataValidator:
     """
@@ -87,40 +89,39 @@ class TestDataValidator:
         Load variant definitions from CSV.
 
         Args:
-            variants_file: Path to variants CSV file
+            variants_file: Path to variants CSV file (or factorized variants.json,
+                joined on the fly)
         """
         self.logger.info(f"Loading variants from {variants_file}")
 
         try:
+            variants_file = str(resolve_variants_file(Path(variants_file)))
             self.validate_file(variants_file, "variants")
 
-            with open(variants_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            # Get parameter columns (exclude Scenario_ID and Variant_ID)
+            all_columns = read_variant_columns(Path(variants_file))
+            if not all_columns:
+                raise ValueError("Variants file has no columns")
 
-                # Get parameter columns (exclude Scenario_ID and Variant_ID)
-                all_columns = reader.fieldnames
-                if not all_columns:
-                    raise ValueError("Variants file has no columns")
+            if 'Variant_ID' not in all_columns:
+                raise ValueError("Variants file must have 'Variant_ID' column")
 
-                if 'Variant_ID' not in all_columns:
-                    raise ValueError("Variants file must have 'Variant_ID' column")
+            self.variant_params = [
+                col for col in all_columns
+                if col not in ['Scenario_ID', 'Variant_ID']
+            ]
 
-                self.variant_params = [
-                    col for col in all_columns
-                    if col not in ['Scenario_ID', 'Variant_ID']
-                ]
+            # Load all variants
+            for row in iter_variant_records(Path(variants_file)):
+                variant_id = row.get('Variant_ID')
+                if not variant_id:
+                    continue
 
-                # Load all variants
-                for row in reader:
-                    variant_id = row.get('Variant_ID')
-                    if not variant_id:
-                        continue
-
-                    # Store parameter values for this variant
-                    self.variants[variant_id] = {
-                        param: row.get(param, 'N/A')
-                        for param in self.variant_params
-                    }
+                # Store parameter values for this variant
+                self.variants[variant_id] = {
+                    param: row.get(param, 'N/A')
+                    for param in self.variant_params
+                }
 
             self.logger.info(f"✓ Loaded {len(self.variants)} variants with {len(self.variant_params)} parameters")
 
@@ -394,7 +395,8 @@ Examples:
 
     parser.add_argument(
         'variants_file',
-        help='Path to variants CSV file (e.g., deliverables/04_variants.csv)'
+        help='Path to variants CSV file (e.g., deliverables/04_variants.csv) '
+             'or factorized variants.json'
     )
 
     parser.add_argument(